@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""CCTF
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - License:     UNLICENSE
+"""
+import asyncio
+import concurrent.futures as cf
+import functools
+import weakref
+
+import requests
+
+from cctf import utils
+from cctf.cache import PRICE_CACHE, HIT, STALE
+from cctf.ratelimit import NORMAL, RateLimitTimeout
+from cctf.retry import Attempts, Backoff, _DEADLINE
+
+__all__ = ['AsyncClient', 'get_url', 'get_price', 'get_prices', 'convert', 'wallet_totals', 'load_currencies']
+
+
+class AsyncClient:
+    """Asyncio mirror of "cctf.utils" pricing and metadata functions.
+
+    Blocking requests run in a dedicated thread pool (sharing "cctf.session" connection pool) so event loop is never
+    blocked. At most "max_concurrency" requests are in flight at the same time, and cancelling a coroutine stops
+    waiting for its result right away.
+
+    >>> client, loop = AsyncClient(max_concurrency=4), asyncio.new_event_loop()
+    >>> loop.run_until_complete(client.run(lambda: 'done'))
+    'done'
+    >>> client.close(), loop.close()
+    (None, None)
+
+    """
+
+    def __init__(self, max_concurrency=10):
+        """AsyncClient constructor.
+
+        :param int max_concurrency: max number of concurrent requests.
+        """
+        self.max_concurrency = int(max_concurrency)
+        self._executor = cf.ThreadPoolExecutor(self.max_concurrency, thread_name_prefix='cctf-aio')
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    @property
+    def _semaphore(self):
+        """Running loop concurrency limiter."""
+        loop = asyncio.get_event_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop]
+
+    async def run(self, fn, *args, **kwargs):
+        """Run blocking "fn" in client thread pool honoring concurrency limit.
+
+        :param fn: blocking callable.
+        :return: "fn" result.
+        """
+        async with self._semaphore:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def get_url(self, url, params=None, retries=3, wait_secs=None, verbose=True, timeout=None, priority=NORMAL,
+                      deadline=_DEADLINE):
+        """Async "cctf.utils.get_url" version (retries wait without blocking the event loop).
+
+        :param str url: URL to retrieve as str.
+        :param dict params: params used to build the GET request.
+        :param int retries: max attempts (no limit if negative).
+        :param float wait_secs: max sleep time in secs between attempts (backoff cap).
+        :param bool verbose: if True all catches errors will be reported to stderr.
+        :param timeout: request timeout in secs as float or (connect, read) tuple (default is pool timeout).
+        :type timeout: float or tuple
+        :param int priority: rate limiter lane ("cctf.ratelimit" HIGH, NORMAL or LOW).
+        :param float deadline: max secs for all attempts including waits (None means no deadline).
+        :return: parsed JSON content or None on error.
+        """
+        attempts = Attempts(url, retries, Backoff(cap=wait_secs) if wait_secs else None, deadline, timeout, verbose)
+        try:
+            while attempts.start():
+                try:
+                    result = await self.run(utils._get_json, url, params=params, timeout=attempts.timeout,
+                                            priority=priority, wait=attempts.remaining)
+                except (requests.RequestException, ValueError, RateLimitTimeout) as err:
+                    delay = attempts.failed(err)
+                    if delay is not None:
+                        await asyncio.sleep(delay)
+                else:
+                    attempts.succeeded()
+                    return result
+        finally:
+            attempts.close()
+
+    async def get_price(self, base, quote=None, timestamp=None):
+        """Async "cctf.utils.get_price" version.
+
+        :param base: base currency.
+        :type base: str or Currency
+        :param quote: quote currency (default BTC).
+        :type quote: str or Currency
+        :param int timestamp: return historical price at supplied timestamp.
+        :return float: price for supplied currency pair.
+        """
+        key, ttl, timestamp = utils._price_key(base, quote, timestamp)
+        price, status = PRICE_CACHE.get(key)
+        if status == HIT:
+            return price
+        elif status == STALE:
+            PRICE_CACHE.revalidate(key, lambda: PRICE_CACHE.set(key, utils._fetch_price(*key[:2], timestamp), ttl))
+            return price
+        params = dict(fsym=key[0], tsym=key[1])
+        if timestamp:
+            params.update(toTs=timestamp)
+        price = utils._parse_price(await self.get_url(utils._PRICE_URL, params=params), key[1])
+        PRICE_CACHE.set(key, price, ttl)
+        return price
+
+    async def get_prices(self, bases, quotes=None):
+        """Async "cctf.utils.get_prices" version, needed requests are sent concurrently.
+
+        :param bases: base currencies.
+        :type bases: str or tp.Iterable
+        :param quotes: quote currencies (default BTC).
+        :type quotes: str or tp.Iterable
+        :return: price matrix as {base: {quote: price}} dict.
+        """
+        bases, quotes = utils._price_pairs(bases, quotes)
+        prices, stale, missing = utils._cached_prices(bases, quotes)
+        if stale:
+            PRICE_CACHE.revalidate(('prices', frozenset(stale)), lambda: utils._fetch_prices(*utils._unzip(stale)))
+        if missing:
+            requests_params = utils._price_params(*utils._unzip(missing))
+            results = await asyncio.gather(*[self.get_url(utils._PRICE_MULTI_URL, params=p) for p in requests_params])
+            for result in results:
+                utils._merge_prices(prices, result)
+        return prices
+
+    async def convert(self, currency, quote):
+        """Async "Currency.to" version.
+
+        :param currency: currency to convert.
+        :type currency: str or Currency
+        :param quote: currency to convert to.
+        :type quote: str or Currency
+        :return float: current price in "quote" currency.
+        """
+        return await self.get_price(str(currency), quote)
+
+    async def wallet_totals(self, wallet, *quotes):
+        """Async "Wallet.totals" version.
+
+        :param Wallet wallet: wallet to value.
+        :param quotes: quote currencies (default BTC, USD and EUR).
+        :return dict: quote currency as key and wallet total value as value.
+        """
+        from cctf.valuation import PriceSnapshot, valuate
+        quotes = [str(q).upper() for q in quotes or ('BTC', 'USD', 'EUR')]
+        prices = await self.get_prices(wallet.currencies, quotes)
+        return valuate(wallet, quotes, PriceSnapshot(prices, quotes)).totals
+
+    async def load_currencies(self):
+        """Load currencies metadata without blocking the event loop.
+
+        :return Currencies: loaded currencies registry ("CURRENCIES").
+        """
+        from cctf.symbol import CURRENCIES
+        return await self.run(CURRENCIES.load)
+
+    def close(self):
+        """Shutdown client thread pool."""
+        self._executor.shutdown(wait=False)
+
+
+_CLIENT = None
+
+
+def _client():
+    """Module level functions shared client (created on first use)."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = AsyncClient()
+    return _CLIENT
+
+
+async def get_url(url, params=None, retries=3, wait_secs=None, verbose=True, timeout=None, priority=NORMAL,
+                  deadline=_DEADLINE):
+    """Async "cctf.utils.get_url" version (see "AsyncClient.get_url")."""
+    return await _client().get_url(url, params, retries, wait_secs, verbose, timeout, priority, deadline)
+
+
+async def get_price(base, quote=None, timestamp=None):
+    """Async "cctf.utils.get_price" version (see "AsyncClient.get_price")."""
+    return await _client().get_price(base, quote, timestamp)
+
+
+async def get_prices(bases, quotes=None):
+    """Async "cctf.utils.get_prices" version (see "AsyncClient.get_prices")."""
+    return await _client().get_prices(bases, quotes)
+
+
+async def convert(currency, quote):
+    """Async "Currency.to" version (see "AsyncClient.convert")."""
+    return await _client().convert(currency, quote)
+
+
+async def wallet_totals(wallet, *quotes):
+    """Async "Wallet.totals" version (see "AsyncClient.wallet_totals")."""
+    return await _client().wallet_totals(wallet, *quotes)
+
+
+async def load_currencies():
+    """Async currencies metadata loader (see "AsyncClient.load_currencies")."""
+    return await _client().load_currencies()
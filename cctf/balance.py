@@ -8,8 +8,34 @@
 import collections as col
 import typing as tp
 
+from cctf import aio
 from cctf.symbol import Currency, CURRENCIES
-from cctf.utils import num2str
+from cctf.utils import num2str, get_prices, _quote
+from cctf.valuation import valuate, _at_par
+
+BalanceChange = col.namedtuple('BalanceChange', ['currency', 'old', 'new'])
+BalanceChange.__doc__ = """Balance change as (free, used, total) tuples before and after it (None if added/removed)."""
+
+# ccxt balance payload keys which are not currencies
+_BALANCE_META_KEYS = {'free', 'used', 'total', 'info', 'timestamp', 'datetime'}
+_BALANCE_FIELDS = ('free', 'used', 'total')
+
+
+def _amount(value):
+    """Return balance payload field as float (None if missing or not a number).
+
+    >>> _amount(1), _amount('0.5'), _amount('n/a'), _amount(True), _amount(None)
+    (1.0, 0.5, None, None, None)
+
+    :param value: payload field value.
+    :return float: field value as float or None.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
 
 
 class Balance(col.UserDict):
@@ -29,13 +55,18 @@ class Balance(col.UserDict):
         currency = kwargs.get('currency')
         currency = Currency(currency or str())
 
-        if currency in CURRENCIES.names:
+        if CURRENCIES.has(currency):
             kwargs['currency'] = currency  # type: Currency
 
         super().__init__(**kwargs)
 
         self.currency = self.data.get('currency', Currency(''))
 
+    @property
+    def state(self):
+        """Balance (free, used, total) tuple."""
+        return self.free, self.used, self.total
+
     @property
     def dict(self):
         """Get balance data as dict type."""
@@ -122,6 +153,30 @@ class Balance(col.UserDict):
         response = self.currency.to(currency)
         return response
 
+    def value(self, quote, prices=None):
+        """Balance total value in "quote" currency.
+
+        >>> Balance(currency='USDT', total=10.5).value('USD')
+        10.5
+        >>> Balance(currency='XRP', total=10.0).value('BTC', prices={'XRP': {'BTC': 0.0001}})
+        0.001
+
+        :param quote: quote currency (BTC, EUR or USD).
+        :type quote: str or Currency
+        :param dict prices: price matrix as returned by "get_prices" (one will be fetched if None).
+        :return float: conversion result as float or None if no price is available for balance currency.
+        """
+        quote = _quote(quote)
+        decimals = 8 if quote == 'BTC' else 5
+        currency = str(self.currency)
+        if _at_par(currency, quote):
+            return round(self.total, decimals)
+        if prices is None:
+            prices = get_prices([currency], [quote])
+        price = prices.get(currency, dict()).get(quote)
+        if price is not None:
+            return round(price * self.total, decimals)
+
     @property
     def to_eur(self):
         """Converts balance currency amount to EUR.
@@ -133,10 +188,7 @@ class Balance(col.UserDict):
 
         :return float: conversion result as float
         """
-        if self.currency != 'EUR' and hasattr(self.currency, 'to'):
-            return round(self.currency.to('EUR') * self.total, 5)
-        else:
-            return round(self.total, 5)
+        return self.value('EUR')
 
     @property
     def to_usd(self):
@@ -149,10 +201,7 @@ class Balance(col.UserDict):
 
         :return float: conversion result as float
         """
-        if 'USD' not in self.currency and self.currency != 'PAX' and hasattr(self.currency, 'to'):
-            return round(self.currency.to('USD') * self.total, 5)
-        else:
-            return round(self.total, 5)
+        return self.value('USD')
 
     @property
     def to_btc(self):
@@ -165,13 +214,7 @@ class Balance(col.UserDict):
 
         :return float: conversion result as float
         """
-        try:
-            if self.currency != 'BTC':
-                return round(self.currency.to('BTC') * self.total, 8)
-            else:
-                return round(self.total, 8)
-        except AttributeError:
-            return None
+        return self.value('BTC')
 
     def __float__(self):
         """Return total balance as float.
@@ -241,17 +284,101 @@ class Wallet(tp.Dict[str, Balance]):
     def currencies(self):
         return [c for c in sorted(self.keys())]
 
+    def totals(self, *quotes):
+        """Wallet total value for each supplied quote currency.
+
+        All balances are priced in all quote currencies from a single price snapshot (see "valuation").
+
+        >>> wallet = Wallet(BTC=0.5, USDT=100.0)
+        >>> totals = wallet.totals('BTC', 'USD')
+        >>> sorted(totals)
+        ['BTC', 'USD']
+
+        :param quotes: quote currencies (default BTC, USD and EUR).
+        :return dict: quote currency as key and wallet total value as value.
+        """
+        return self.valuation(*quotes).totals
+
+    def valuation(self, *quotes, max_age=None):
+        """Wallet totals and per currency breakdown in each supplied quote currency from a single price snapshot.
+
+        :param quotes: quote currencies (default BTC, USD and EUR).
+        :param float max_age: cached prices older than "max_age" secs are requested again.
+        :return Valuation: totals, breakdown, currencies without price and price snapshot (with its staleness).
+        """
+        return valuate(self, quotes, max_age=max_age)
+
+    def apply(self, balances):
+        """Apply a (partial) balances payload in place, only changed balances are updated.
+
+        Payload may be a ccxt "fetch_balance" like dict or a {currency: total or {free, used, total}} dict. Missing
+        fields keep their current value, total is derived as free + used when only those are supplied and a None
+        value removes the currency. Non numeric fields are ignored, as are currencies whose value is neither a
+        number nor a dict.
+
+        >>> wallet = Wallet(BTC=0.5, XRP=1000.0)
+        >>> wallet.apply({'BTC': {'total': 0.5}, 'XRP': {'free': 900.0, 'used': 100.0}, 'ETH': 2.0})
+        [BalanceChange(currency='XRP', old=(0.0, 0.0, 1000.0), new=(900.0, 100.0, 1000.0)), \
+BalanceChange(currency='ETH', old=None, new=(0.0, 0.0, 2.0))]
+        >>> wallet.apply({'XRP': None}), wallet.currencies
+        ([BalanceChange(currency='XRP', old=(900.0, 100.0, 1000.0), new=None)], ['BTC', 'ETH'])
+        >>> wallet.apply({'ADA': {'free': 5.0, 'used': 1.0}, 'ETH': 'n/a', 'BTC': {'free': 'n/a', 'used': 0.1}})
+        [BalanceChange(currency='ADA', old=None, new=(5.0, 1.0, 6.0)), \
+BalanceChange(currency='BTC', old=(0.0, 0.0, 0.5), new=(0.0, 0.1, 0.1))]
+
+        :param dict balances: balances payload.
+        :return list: BalanceChange list (one per changed currency).
+        """
+        changes = list()
+        for currency, values in balances.items():
+            if currency in _BALANCE_META_KEYS:
+                continue
+            currency = str(currency).upper()
+            balance = self.get(currency)
+            old = None if balance is None else balance.state
+            if values is None:
+                if balance is not None:
+                    del self[currency]
+                    changes.append(BalanceChange(currency, old, None))
+                continue
+            values = dict(total=values) if isinstance(values, (int, float)) else values
+            if not isinstance(values, dict):
+                continue
+            values = {f: _amount(values.get(f)) for f in _BALANCE_FIELDS}
+            if values['total'] is None and (values['free'] is not None or values['used'] is not None):
+                free, used = (values[f] if values[f] is not None else old[i] if old else 0.0
+                              for i, f in enumerate(_BALANCE_FIELDS[:2]))
+                values['total'] = free + used
+            new = tuple(old[i] if old and values[f] is None else round(values[f] or 0.0, 8)
+                        for i, f in enumerate(_BALANCE_FIELDS))
+            if new == old:
+                continue
+            if balance is None:
+                self[Currency(currency)] = Balance(currency=currency, **dict(zip(_BALANCE_FIELDS, new)))
+            else:
+                balance.free, balance.used, balance.total = new
+            changes.append(BalanceChange(currency, old, new))
+        return changes
+
+    async def totals_async(self, *quotes):
+        """Async "totals" version (see "cctf.aio").
+
+        :param quotes: quote currencies (default BTC, USD and EUR).
+        :return dict: quote currency as key and wallet total value as value.
+        """
+        return await aio.wallet_totals(self, *quotes)
+
     @property
     def total_btc(self):
-        return sum([c.to_btc for c in sorted(self.values())])
+        return self.totals('BTC')['BTC']
 
     @property
     def total_usd(self):
-        return sum([c.to_usd for c in sorted(self.values())])
+        return self.totals('USD')['USD']
 
     @property
     def total_eur(self):
-        return sum([c.to_eur for c in sorted(self.values())])
+        return self.totals('EUR')['EUR']
 
     def __contains__(self, item):
         return str(item) in self.keys()
@@ -6,6 +6,8 @@
  - License:     UNLICENSE
 """
 import abc
+import decimal
+import math
 import typing as tp
 from collections import UserDict
 
@@ -107,17 +109,23 @@ class BaseDict(UserDict):
     def __getattr__(self, item):
         """Dict entries accessing as class attributes implementation.
 
+        "data" is read through normal attribute lookup, so subclasses may provide it as a property.
+
+        >>> BaseDict(min=0.0, max=10.0).max
+        10.0
+
         :param str item: attribute name.
         :return: self.data value for item key.
         :raise AttributeError:
         """
-        temp_data = super().__dict__.get('data')
+        # private names and "data" itself are never dict entries (also avoids recursion while "data" is not set)
+        if item == 'data' or item.startswith('_'):
+            raise AttributeError(f'{item} is not a valid attribute.')
+        temp_data = self.data
         if temp_data is None:
             raise AttributeError(f'{item} not in data.')
-        elif item not in 'data' and item in temp_data:
-            return temp_data[item]
         elif item in temp_data:
-            return temp_data
+            return temp_data[item]
         else:
             raise AttributeError(f'{item} is not a valid attribute.')
 
@@ -133,6 +141,8 @@ class BaseDict(UserDict):
 class Limit:
     """Limits class with amount, price and cost attributes."""
 
+    __slots__ = ('amount', 'price', 'cost', 'market')
+
     def __init__(self, amount=None, price=None, cost=None, market=None):
         """Initialize Limits class with amount, price and cost values.
 
@@ -171,7 +181,8 @@ class Limit:
 
         :return str:
         """
-        return 'Limit(amount: {amount}, price: {price}, cost: {cost})'.format(**{k: v for k, v in vars(self).items()})
+        template = 'Limit(amount: {amount}, price: {price}, cost: {cost})'
+        return template.format(**{k: getattr(self, k) for k in self.__slots__})
 
 
 class Precision:
@@ -186,21 +197,131 @@ class Precision:
 
     """
 
+    FIELDS = ('amount', 'price', 'cost', 'base', 'quote')
+
+    __slots__ = FIELDS + ('_scales', '_steps', '_divisors')
+
     def __init__(self, amount=8, price=8, cost=8, base=8, quote=8):
         """Precision constructor.
 
+        Precision values can be int (number of decimals) or float (tick size, like 0.05).
+
         :param int base:  base currency precision (default 8).
         :param int quote: quote currency precision (default 8).
         :param int amount: amount precision (default 8).
         :param int price: price precision (default 8).
         :param int cost:  cost precision (default 8).
         """
+        self._scales = dict()
+        self._steps = dict()
+        self._divisors = dict()
         self.amount = amount
         self.price = price
         self.cost = cost
         self.base = base
         self.quote = quote
 
+    def __setattr__(self, key, value):
+        """Keep quantization scale factors, tick sizes and divisors tables updated when a precision value is set."""
+        object.__setattr__(self, key, value)
+        if key in self.FIELDS:
+            self._scales[key] = _scale(value)
+            self._steps[key] = _step(value)
+            self._divisors[key] = _divisor(self._steps[key])
+
+    def scale(self, field):
+        """Quantization scale factor for "field" (None if field has no precision).
+
+        >>> Precision(price=2, amount=0.5).scale('price'), Precision(price=2, amount=0.5).scale('amount')
+        (100.0, 2.0)
+
+        :param str field: one of FIELDS.
+        :return float: "field" scale factor.
+        """
+        return self._scales[field]
+
+    def quantize(self, field, value, truncate=False):
+        """Round half up (or truncate) "value" to "field" precision, as ccxt "decimal_to_precision" does.
+
+        Value is scaled by the cached "field" divisor and rounded as float, unless it is too close to a rounding
+        boundary for exact float math (or too big), in which case decimal arithmetic over value shortest repr is used,
+        so binary float artifacts (0.29 * 100 = 28.999...) never change the result. Decimal arithmetic is always used
+        when tick size is not an exact fraction of 1 (like 0.3).
+
+        >>> precision = Precision(amount=2, price=0.05, cost=0)
+        >>> precision.quantize('amount', 0.29, truncate=True), precision.quantize('amount', 1.239, truncate=True)
+        (0.29, 1.23)
+        >>> precision.quantize('price', 10.07), precision.quantize('price', 10.075)
+        (10.05, 10.1)
+        >>> precision.quantize('cost', 2.5), precision.quantize('amount', 0.125), precision.quantize('amount', -0.125)
+        (3.0, 0.13, -0.13)
+
+        :param str field: one of FIELDS.
+        :param float value: value to quantize.
+        :param bool truncate: truncate (round down) instead of rounding half up if True.
+        :return float: quantized value.
+        """
+        if value is None:
+            return value
+        divisor = self._divisors[field]
+        if divisor is not None:
+            value = float(value)
+            scaled = value * divisor
+            magnitude = abs(scaled)
+            if magnitude < _MAX_SCALED:
+                if truncate:
+                    integral = float(math.trunc(scaled))
+                    distance = abs(scaled - round(scaled))
+                else:
+                    integral = math.copysign(math.floor(magnitude + 0.5), scaled)
+                    distance = abs(magnitude - math.floor(magnitude) - 0.5)
+                if distance >= _TOLERANCE + magnitude * _REL_TOLERANCE:
+                    return integral / divisor
+        return _quantize_exact(self._steps[field], value, truncate)
+
+    def quantize_many(self, field, values, truncate=False):
+        """Vectorised "quantize" version (uses numpy if installed), giving the same results.
+
+        Values too close to a rounding boundary for exact float math, or too big, are quantized one by one with
+        decimal arithmetic (as are all of them when tick size is not an exact fraction of 1 like 0.3).
+
+        >>> Precision(amount=3).quantize_many('amount', [0.12345, 1.0, 2.9999], truncate=True)
+        [0.123, 1.0, 2.999]
+        >>> Precision(price=2).quantize_many('price', [0.125, 0.135, -0.125, None])
+        [0.13, 0.14, -0.13, None]
+
+        :param str field: one of FIELDS.
+        :param values: values to quantize.
+        :type values: tp.Iterable[float]
+        :param bool truncate: truncate (round down) instead of rounding half up if True.
+        :return list: quantized values.
+        """
+        values = list(values)
+        step, divisor = self._steps[field], self._divisors[field]
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if step is None:
+            return values
+        if np is None or divisor is None:
+            return [self.quantize(field, v, truncate) for v in values]
+        scaled = np.array([math.nan if v is None else v for v in values], dtype=np.float64) * divisor
+        with np.errstate(invalid='ignore'):
+            # float error of scaled values grows with their magnitude
+            tolerance = _TOLERANCE + np.abs(scaled) * _REL_TOLERANCE
+            if truncate:
+                integral = np.trunc(scaled)
+                unsafe = np.abs(scaled - np.rint(scaled)) < tolerance
+            else:
+                integral = np.copysign(np.floor(np.abs(scaled) + 0.5), scaled)
+                unsafe = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) < tolerance
+            unsafe |= ~(np.abs(scaled) < _MAX_SCALED)
+        result = (integral / divisor).tolist()
+        for i in np.flatnonzero(unsafe).tolist():
+            result[i] = _quantize_exact(step, values[i], truncate)
+        return [None if v is None or math.isnan(v) else v for v in result]
+
     def __repr__(self):
         """Precision object str representation handler.
 
@@ -210,4 +331,79 @@ class Precision:
         :return str: Precision object str representation handler
         """
         template = 'Precision(amount: {amount}, price: {price}, cost: {cost}, base: {base}, quote: {quote})'
-        return template.format(**vars(self))
+        return template.format(**{k: getattr(self, k) for k in self.FIELDS})
+
+
+# scaled values closer than this (absolute plus relative to their magnitude) to a rounding boundary are quantized
+# with exact decimal arithmetic
+_TOLERANCE = 1e-6
+_REL_TOLERANCE = 1e-12
+# scaled values from this magnitude on are always quantized with exact decimal arithmetic
+_MAX_SCALED = 2.0 ** 50
+
+
+def _scale(precision):
+    """Precision value to quantization scale factor.
+
+    >>> _scale(3), _scale(0.25), _scale(None)
+    (1000.0, 4.0, None)
+
+    :param precision: number of decimals as int or tick size as float.
+    :type precision: int or float
+    :return float: scale factor (None if precision is None).
+    """
+    if precision is None or isinstance(precision, bool):
+        return None
+    elif isinstance(precision, int):
+        return 10.0 ** precision
+    return 1.0 / float(precision)
+
+
+def _step(precision):
+    """Precision value to decimal tick size.
+
+    >>> _step(3), _step(0), _step(0.05), _step(None)
+    (Decimal('0.001'), Decimal('1'), Decimal('0.05'), None)
+
+    :param precision: number of decimals as int or tick size as float.
+    :type precision: int or float
+    :return decimal.Decimal: tick size (None if precision is None).
+    """
+    if precision is None or isinstance(precision, bool):
+        return None
+    elif isinstance(precision, int):
+        return decimal.Decimal(1).scaleb(-precision)
+    return decimal.Decimal(repr(float(precision)))
+
+
+def _divisor(step):
+    """Tick size to float quantization divisor (None if tick size is not an exact fraction of 1).
+
+    >>> _divisor(_step(3)), _divisor(_step(0.05)), _divisor(_step(0.3)), _divisor(None)
+    (1000.0, 20.0, None, None)
+
+    :param decimal.Decimal step: tick size.
+    :return float: divisor (None if quantization must use decimal arithmetic).
+    """
+    if not step:
+        return None
+    divisor = 1 / step
+    return float(divisor) if divisor == divisor.to_integral_value() else None
+
+
+def _quantize_exact(step, value, truncate=False):
+    """Quantize "value" to "step" tick size with decimal arithmetic over value shortest repr.
+
+    >>> _quantize_exact(_step(2), 0.125), _quantize_exact(_step(0.3), 1.0, truncate=True)
+    (0.13, 0.9)
+
+    :param decimal.Decimal step: tick size (value is returned unchanged if None).
+    :param float value: value to quantize.
+    :param bool truncate: truncate (round down) instead of rounding half up if True.
+    :return float: quantized value.
+    """
+    if step is None or value is None:
+        return value
+    number = decimal.Decimal(repr(float(value)))
+    rounding = decimal.ROUND_DOWN if truncate else decimal.ROUND_HALF_UP
+    return float((number / step).to_integral_value(rounding) * step)
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""CCTF
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - License:     UNLICENSE
+"""
+import collections as col
+import threading
+import time
+
+__all__ = ['PriceCache', 'PRICE_CACHE']
+
+HIT = 'hit'
+STALE = 'stale'
+MISS = 'miss'
+
+
+class _Flight:
+    """In flight call shared by concurrent callers (see "PriceCache.single_flight")."""
+
+    __slots__ = ('done', 'value', 'error', 'aborted')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+        self.aborted = False
+
+    def result(self):
+        """Wait for call to finish and return its value (or raise its error)."""
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class PriceCache:
+    """Thread-safe TTL + LRU price cache.
+
+    Keys are (base, quote, timestamp bucket) tuples where bucket is None for current prices.
+
+    If "stale" is greater than zero, expired entries are still served (as "stale") for that many secs while a
+    background refresh takes place.
+
+    Concurrent misses for the same key share a single fetch (see "single_flight").
+
+    >>> cache = PriceCache(ttl=60, maxsize=2)
+    >>> cache.fetch(('BTC', 'USD', None), lambda: 6000.0)
+    6000.0
+    >>> cache.fetch(('BTC', 'USD', None), lambda: 0.0)
+    6000.0
+    >>> cache.stats['hits'], cache.stats['misses']
+    (1, 1)
+
+    """
+
+    def __init__(self, ttl=60.0, maxsize=4096, stale=0.0):
+        """PriceCache constructor.
+
+        :param float ttl: secs an entry is considered fresh (zero or negative disables the cache).
+        :param int maxsize: max number of entries, least recently used ones are evicted first.
+        :param float stale: secs after expiration an entry is still served while it is refreshed in background.
+        """
+        self.ttl = float(ttl)
+        self.maxsize = int(maxsize)
+        self.stale = float(stale)
+        self._data = col.OrderedDict()
+        self._lock = threading.RLock()
+        self._refreshing = set()
+        self._flights = dict()
+        self._stats = col.Counter()
+
+    @property
+    def enabled(self):
+        """True if cache is enabled (ttl > 0)."""
+        return self.ttl > 0 and self.maxsize > 0
+
+    @property
+    def stats(self):
+        """Cache counters as dict (hits, stale, misses, evictions, refreshes, coalesced, size)."""
+        with self._lock:
+            stats = dict.fromkeys(['hits', 'stale', 'misses', 'evictions', 'refreshes', 'coalesced'], 0)
+            stats.update(self._stats, size=len(self._data))
+            return stats
+
+    def configure(self, ttl=None, maxsize=None, stale=None):
+        """Change cache settings, entries exceeding new "maxsize" are evicted.
+
+        :param float ttl: secs an entry is considered fresh (zero or negative disables the cache).
+        :param int maxsize: max number of entries.
+        :param float stale: secs after expiration an entry is still served while it is refreshed in background.
+        """
+        with self._lock:
+            self.ttl = self.ttl if ttl is None else float(ttl)
+            self.maxsize = self.maxsize if maxsize is None else int(maxsize)
+            self.stale = self.stale if stale is None else float(stale)
+            self._evict()
+
+    def get(self, key):
+        """Lookup "key" returning its value and status ("hit", "stale" or "miss").
+
+        >>> cache = PriceCache(ttl=60)
+        >>> cache.get(('ETH', 'BTC', None))
+        (None, 'miss')
+
+        :param tuple key: (base, quote, bucket) tuple.
+        :return tuple: (value, status) tuple.
+        """
+        with self._lock:
+            entry = self._data.get(key) if self.enabled else None
+            if entry is not None:
+                value, expires, _ = entry
+                age = time.monotonic() - expires
+                if age < 0:
+                    self._data.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return value, HIT
+                elif age < self.stale:
+                    self._data.move_to_end(key)
+                    self._stats['stale'] += 1
+                    return value, STALE
+                del self._data[key]
+            self._stats['misses'] += 1
+            return None, MISS
+
+    def set(self, key, value, ttl=None):
+        """Store "value" for "key" (None values are not stored).
+
+        :param tuple key: (base, quote, bucket) tuple.
+        :param float value: price to store.
+        :param float ttl: entry specific ttl in secs (default is cache ttl).
+        """
+        if value is not None and self.enabled:
+            with self._lock:
+                now = time.monotonic()
+                self._data[key] = (value, now + (self.ttl if ttl is None else ttl), now)
+                self._data.move_to_end(key)
+                self._evict()
+
+    def age(self, key):
+        """Return secs elapsed since "key" value was stored (without updating counters or LRU order).
+
+        >>> cache = PriceCache(ttl=60)
+        >>> cache.set(('ETH', 'BTC', None), 0.03)
+        >>> cache.age(('ETH', 'BTC', None)) < 1.0, cache.age(('XRP', 'BTC', None))
+        (True, None)
+
+        :param tuple key: (base, quote, bucket) tuple.
+        :return float: entry age in secs or None if "key" is not cached.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            return None if entry is None else time.monotonic() - entry[2]
+
+    def fetch(self, key, fn, ttl=None):
+        """Return cached value for "key" calling "fn" (and storing its result) on cache miss.
+
+        Stale entries are returned as is and "fn" is called from a background thread to refresh them. Concurrent
+        misses for the same key share a single "fn" call.
+
+        :param tuple key: (base, quote, bucket) tuple.
+        :param fn: callable with no args returning the price.
+        :param float ttl: entry specific ttl in secs (default is cache ttl).
+        :return: cached or fetched value.
+        """
+        value, status = self.get(key)
+        if status == STALE:
+            self.revalidate(key, lambda: self.set(key, fn(), ttl))
+        elif status == MISS:
+            value = self.single_flight(key, lambda: self._load(key, fn, ttl))
+        return value
+
+    def _load(self, key, fn, ttl=None):
+        """Call "fn" and store its result unless "key" was stored meanwhile (by a just finished flight)."""
+        with self._lock:
+            entry = self._data.get(key) if self.enabled else None
+            if entry is not None and entry[1] > time.monotonic():
+                return entry[0]
+        value = fn()
+        self.set(key, value, ttl)
+        return value
+
+    def single_flight(self, key, fn):
+        """Call "fn" unless a call identified by "key" is already in flight, in which case its result is shared.
+
+        Callers arriving while a call is in flight wait for it and get its value (or its error raised), so N concurrent
+        identical lookups issue a single request. Coalesced calls are counted in "stats". If the call is aborted by a
+        non "Exception" error (like KeyboardInterrupt or SystemExit), only its caller gets it and waiting callers retry.
+
+        >>> cache, calls = PriceCache(), list()
+        >>> def fetch():
+        ...     calls.append(1)
+        ...     time.sleep(0.1)
+        ...     return 6000.0
+        >>> threads = [threading.Thread(target=cache.single_flight, args=('BTC', fetch)) for _ in range(4)]
+        >>> _ = [t.start() for t in threads], [t.join() for t in threads]
+        >>> len(calls), cache.stats['coalesced']
+        (1, 3)
+
+        :param key: hashable call identifier.
+        :param fn: callable with no args.
+        :return: "fn" result.
+        """
+        while True:
+            with self._lock:
+                flight = self._flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._flights[key] = _Flight()
+                else:
+                    self._stats['coalesced'] += 1
+            if leader:
+                break
+            flight.done.wait()
+            if not flight.aborted:
+                return flight.result()
+        try:
+            flight.value = fn()
+        except Exception as err:
+            flight.error = err
+            raise
+        except BaseException:
+            flight.aborted = True
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.value
+
+    def revalidate(self, name, fn):
+        """Run "fn" in a background thread unless a refresh identified by "name" is already running.
+
+        :param name: hashable refresh identifier.
+        :param fn: callable with no args in charge of storing refreshed values.
+        """
+        with self._lock:
+            if name in self._refreshing:
+                return
+            self._refreshing.add(name)
+            self._stats['refreshes'] += 1
+
+        def target():
+            try:
+                fn()
+            except Exception:  # a failed refresh keeps serving stale data until it expires
+                pass
+            finally:
+                with self._lock:
+                    self._refreshing.discard(name)
+
+        threading.Thread(target=target, name='cctf-cache-refresh', daemon=True).start()
+
+    def clear(self):
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._data.clear()
+            self._stats.clear()
+
+    def _evict(self):
+        """Drop least recently used entries until size fits "maxsize"."""
+        while len(self._data) > max(self.maxsize, 0):
+            self._data.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
+PRICE_CACHE = PriceCache()
@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""CCTF
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - License:     UNLICENSE
+"""
+import abc
+import collections as col
+import math
+import random
+import threading
+import time
+
+from cctf.balance import Wallet, _BALANCE_META_KEYS
+from cctf.market import Markets, Tickers, ExchangeInfo
+from cctf.ratelimit import RATE_LIMITER, HIGH, NORMAL, LOW
+
+__all__ = ['Exchange', 'CcxtExchange', 'FakeExchange']
+
+# ccxt exchange description attributes used to build ExchangeInfo
+_INFO_KEYS = ('id', 'name', 'countries', 'urls', 'version', 'has', 'timeframes', 'rateLimit', 'userAgent')
+
+# ccxt methods scheduling lane: account and orders calls first, metadata last (any other method is NORMAL)
+_PRIORITIES = dict.fromkeys(('fetch_balance', 'create_order', 'cancel_order', 'edit_order', 'fetch_order',
+                             'fetch_orders', 'fetch_open_orders', 'fetch_closed_orders', 'fetch_my_trades'), HIGH)
+_PRIORITIES.update(dict.fromkeys(('load_markets', 'fetch_markets', 'fetch_currencies'), LOW))
+
+
+class Exchange(abc.ABC):
+    """Exchange adapter protocol.
+
+    Subclasses implement ccxt like raw methods ("load_markets", "fetch_tickers", "fetch_ohlcv" and "fetch_balance"),
+    so adapters can also be used wherever a ccxt exchange instance is expected (e.g. "cctf.scanner"), and this class
+    turns their results into cctf types ("markets", "tickers", "ohlcv" and "wallet").
+    """
+
+    #: min time between requests in ms (ccxt "rateLimit" convention)
+    rateLimit = 0
+
+    @property
+    @abc.abstractmethod
+    def info(self):
+        """Exchange description as ExchangeInfo."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def load_markets(self):
+        """Return raw markets as {symbol: ccxt market dict} dict."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def fetch_tickers(self, symbols=None):
+        """Return raw tickers as {symbol: ccxt ticker dict} dict."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None):
+        """Return raw candles as [timestamp, open, high, low, close, volume] lists."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def fetch_balance(self):
+        """Return raw balances as ccxt "fetch_balance" dict."""
+        raise NotImplementedError
+
+    def markets(self):
+        """Exchange markets.
+
+        :return Markets: markets instance.
+        """
+        return Markets(**self.load_markets())
+
+    def tickers(self, symbols=None):
+        """Exchange tickers.
+
+        :param list symbols: symbols to fetch (default all).
+        :return Tickers: tickers instance.
+        """
+        return Tickers(**self.fetch_tickers(symbols))
+
+    def ohlcv(self, symbol, timeframe='1m', since=None, limit=None):
+        """Symbol candles (requires numpy).
+
+        :param str symbol: symbol to fetch.
+        :param str timeframe: candles timeframe.
+        :param int since: first candle ms timestamp.
+        :param int limit: max number of candles.
+        :return OHLCV: candles instance.
+        """
+        from cctf.ohlcv import OHLCV
+        return OHLCV.from_ccxt(self.fetch_ohlcv(symbol, timeframe, since, limit), timeframe=timeframe)
+
+    def wallet(self):
+        """Account balances.
+
+        :return Wallet: wallet instance.
+        """
+        balances = self.fetch_balance()
+        return Wallet(**{c: v for c, v in balances.items() if c not in _BALANCE_META_KEYS and isinstance(v, dict)})
+
+
+class CcxtExchange(Exchange):
+    """Adapter for ccxt exchange instances.
+
+    Every ccxt call waits for its turn in "limiter" (default the shared "RATE_LIMITER"), whose exchange budget is set
+    from ccxt "rateLimit": orders and balance calls are scheduled first (HIGH lane) and markets metadata last (LOW).
+    ccxt built-in throttling ("enableRateLimit") is redundant with it and can be disabled.
+
+    >>> class Api:
+    ...     id, rateLimit, has = 'api', 500, dict(fetchOHLCV=True)
+    ...     def load_markets(self):
+    ...         return {'ETH/BTC': dict(symbol='ETH/BTC', base='ETH', quote='BTC')}
+    >>> exchange = CcxtExchange(Api())
+    >>> exchange.rateLimit, exchange.info.has('fetchOHLCV'), list(exchange.markets())
+    (500, True, [(Symbol:ETH/BTC)])
+    >>> RATE_LIMITER.stats['lanes']['LOW'] >= 1
+    True
+
+    """
+
+    def __init__(self, api, limiter=None):
+        """CcxtExchange constructor.
+
+        :param api: ccxt exchange instance.
+        :param RateLimiter limiter: calls scheduler (default "RATE_LIMITER").
+        """
+        self.api = api
+        self.id = getattr(api, 'id', None)
+        self.rateLimit = getattr(api, 'rateLimit', 0) or 0
+        self.limiter = limiter or RATE_LIMITER
+        self._url = self.limiter.configure_exchange(self.info)
+
+    @property
+    def info(self):
+        return ExchangeInfo(**{k: getattr(self.api, k) for k in _INFO_KEYS if hasattr(self.api, k)})
+
+    def call(self, method, *args, **kwargs):
+        """Call any ccxt "method" once its turn is granted by "limiter".
+
+        :param str method: ccxt method name (like "create_order").
+        :param args: method positional args.
+        :param kwargs: method keyword args.
+        :return: method result.
+        """
+        self.limiter.acquire(self._url, _PRIORITIES.get(method, NORMAL))
+        return getattr(self.api, method)(*args, **kwargs)
+
+    def load_markets(self):
+        return self.call('load_markets')
+
+    def fetch_tickers(self, symbols=None):
+        return self.call('fetch_tickers', symbols)
+
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None):
+        return self.call('fetch_ohlcv', symbol, timeframe=timeframe, since=since, limit=limit)
+
+    def fetch_balance(self):
+        return self.call('fetch_balance')
+
+
+class FakeExchange(Exchange):
+    """Deterministic in-process exchange for offline tests and benchmarks.
+
+    Generated data only depends on "seed" and the fake clock ("now"), so two instances built with the same args
+    return the same payloads. Every call sleeps "latency" secs and is counted in "calls".
+
+    >>> exchange = FakeExchange(markets=4, balances=3, seed=1)
+    >>> sorted(exchange.load_markets())
+    ['ETH/BTC', 'ETH/USDT', 'XRP/BTC', 'XRP/USDT']
+    >>> candles = exchange.ohlcv('ETH/BTC', '1h', limit=3)
+    >>> len(candles), candles.dates.tolist() == FakeExchange(seed=1).ohlcv('ETH/BTC', '1h', limit=3).dates.tolist()
+    (3, True)
+    >>> exchange.wallet().currencies
+    ['BTC', 'ETH', 'XRP']
+    >>> dict(exchange.calls)
+    {'load_markets': 1, 'fetch_ohlcv': 1, 'fetch_balance': 1}
+
+    """
+
+    id = 'fake'
+
+    #: base currencies used first, synthetic ones (C0010, C0011, ...) are used after them
+    BASES = ('ETH', 'XRP', 'LTC', 'ADA', 'TRX', 'BNB', 'EOS', 'XLM', 'ETC', 'BCN')
+    QUOTES = ('BTC', 'USDT')
+    TIMEFRAMES = {'1m': 60000, '5m': 300000, '15m': 900000, '1h': 3600000, '4h': 14400000, '1d': 86400000}
+
+    def __init__(self, markets=100, balances=10, ohlcv_limit=500, latency=0.0, rate_limit=0, now=1546300800000,
+                 seed=0):
+        """FakeExchange constructor.
+
+        :param int markets: number of markets (split among QUOTES).
+        :param int balances: number of currencies with balance.
+        :param int ohlcv_limit: default (and max) number of candles per "fetch_ohlcv" call.
+        :param float latency: secs each call takes.
+        :param int rate_limit: advertised min time between requests in ms ("rateLimit").
+        :param int now: fake clock as ms timestamp (see "advance").
+        :param seed: random seed.
+        """
+        self.latency = float(latency)
+        self.rateLimit = int(rate_limit)
+        self.ohlcv_limit = int(ohlcv_limit)
+        self.now = int(now)
+        self.seed = seed
+        self.calls = col.Counter()
+        self._lock = threading.Lock()
+        count = max(1, math.ceil(markets / len(self.QUOTES)))
+        self._bases = [self.BASES[i] if i < len(self.BASES) else f'C{i:04d}' for i in range(count)]
+        self._symbols = [f'{b}/{q}' for b in self._bases for q in self.QUOTES][:markets]
+        self._markets = set(self._symbols)
+        self._balances = ([self.QUOTES[0]] + self._bases)[:balances]
+        # base currencies USDT price
+        self._usdt = {self.QUOTES[0]: 6000.0, self.QUOTES[1]: 1.0}
+        self._usdt.update({b: round(self._random(b).lognormvariate(0.0, 2.0), 4) for b in self._bases})
+
+    def _random(self, *keys):
+        """Return a random generator seeded from "seed" and "keys" (str seeds are hashed with sha512)."""
+        return random.Random(':'.join(map(str, (self.seed,) + keys)))
+
+    def _call(self, name):
+        """Count call and simulate latency."""
+        with self._lock:
+            self.calls[name] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _price(self, symbol, timestamp):
+        """Symbol price at "timestamp" (deterministic oscillation around its reference price)."""
+        base, quote = symbol.split('/')
+        reference = self._usdt[base] / self._usdt[quote]
+        drift = math.sin(timestamp / 3600000.0 + len(base)) * 0.05
+        return reference * (1.0 + drift)
+
+    def advance(self, ms):
+        """Move fake clock forward.
+
+        :param int ms: milliseconds to advance.
+        """
+        self.now += int(ms)
+
+    @property
+    def info(self):
+        return ExchangeInfo(id=self.id, name='Fake', countries=list(), urls=dict(api='memory://fake'),
+                            has=dict(fetchMarkets=True, fetchTickers=True, fetchOHLCV=True, fetchBalance=True),
+                            timeframes={k: k for k in self.TIMEFRAMES}, rateLimit=self.rateLimit,
+                            symbols=list(self._symbols))
+
+    def load_markets(self):
+        self._call('load_markets')
+        markets = dict()
+        for symbol in self._symbols:
+            base, quote = symbol.split('/')
+            price_decimals = 8 if quote == 'BTC' else 2
+            markets[symbol] = dict(id=symbol.replace('/', '').lower(), symbol=symbol, base=base, quote=quote,
+                                   baseId=base, quoteId=quote, active=True,
+                                   precision=dict(price=price_decimals, amount=3),
+                                   limits=dict(amount=dict(min=0.001, max=1e7), price=dict(min=10 ** -price_decimals),
+                                               cost=dict(min=0.001 if quote == 'BTC' else 10.0)))
+        return markets
+
+    def fetch_tickers(self, symbols=None):
+        self._call('fetch_tickers')
+        tickers = dict()
+        for symbol in symbols or self._symbols:
+            if symbol not in self._markets:
+                continue
+            last = self._price(symbol, self.now)
+            open_ = self._price(symbol, self.now - 86400000)
+            volume = self._random(symbol, 'volume').uniform(100.0, 100000.0)
+            tickers[symbol] = dict(symbol=symbol, timestamp=self.now, last=last, close=last, open=open_,
+                                   bid=last * 0.999, ask=last * 1.001, high=max(last, open_) * 1.01,
+                                   low=min(last, open_) * 0.99, baseVolume=volume, quoteVolume=volume * last,
+                                   percentage=(last - open_) / open_ * 100.0)
+        return tickers
+
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None):
+        self._call('fetch_ohlcv')
+        step = self.TIMEFRAMES[timeframe]
+        limit = min(limit or self.ohlcv_limit, self.ohlcv_limit)
+        last = self.now - self.now % step
+        # first candle opened at or after "since" (default last "limit" candles)
+        first = -(-since // step) * step if since is not None else last - (limit - 1) * step
+        candles = list()
+        for timestamp in range(first, min(last, first + (limit - 1) * step) + 1, step):
+            open_, close = self._price(symbol, timestamp), self._price(symbol, timestamp + step)
+            volume = self._random(symbol, timestamp).uniform(1.0, 100.0)
+            candles.append([timestamp, open_, max(open_, close) * 1.001, min(open_, close) * 0.999, close, volume])
+        return candles
+
+    def fetch_balance(self):
+        self._call('fetch_balance')
+        balances = dict()
+        for currency in self._balances:
+            total = round(self._random(currency, 'balance').uniform(0.1, 1000.0), 8)
+            used = round(total * 0.1, 8)
+            balances[currency] = dict(free=round(total - used, 8), used=used, total=total)
+        balances.update({k: {c: b[k] for c, b in balances.items()} for k in ('free', 'used', 'total')})
+        return balances
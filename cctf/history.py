@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""CCTF
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - License:     UNLICENSE
+"""
+import collections as col
+import threading
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from cctf import utils
+from cctf.store import OHLCVStore
+from cctf.symbol import _DATA_DIR
+
+__all__ = ['PriceHistory', 'get_historical_prices']
+
+_HISTO_URLS = {
+    '1d': 'https://min-api.cryptocompare.com/data/v2/histoday',
+    '1h': 'https://min-api.cryptocompare.com/data/v2/histohour',
+    '1m': 'https://min-api.cryptocompare.com/data/v2/histominute',
+}
+_HISTO_STEPS = {'1d': 86400, '1h': 3600, '1m': 60}
+# CryptoCompare max "limit" value (a response holds limit + 1 candles)
+_HISTO_MAX_LIMIT = 2000
+
+
+class PriceHistory:
+    """Historical prices service backed by a local candles store (requires numpy).
+
+    Queries are grouped by pair, each pair missing range is fetched from CryptoCompare once (2000 candles per request)
+    and saved into an "OHLCVStore", then all pair timestamps are answered with a single binary search. Price at a
+    timestamp is the average of open and close prices of the candle holding it (as "get_price" does), or the linear
+    interpolation between candles middle points if "interpolate" is True.
+
+    >>> import tempfile
+    >>> history = PriceHistory(store=OHLCVStore(tempfile.mkdtemp()))
+    >>> history.store.append('ETH/USD', '1d', [[0, 100.0, 110.0, 90.0, 102.0, 1.0],
+    ...                                        [86400000, 102.0, 120.0, 100.0, 118.0, 1.0]])
+    2
+    >>> history._lookup('ETH', 'USD', [3600, 86400 + 3600, 2 * 86400], interpolate=False)
+    [101.0, 110.0, None]
+    >>> history._lookup('ETH', 'USD', [43200, 86400], interpolate=True)
+    [101.0, 105.5]
+
+    """
+
+    def __init__(self, store=None, timeframe='1d'):
+        """PriceHistory constructor.
+
+        :param OHLCVStore store: candles store (default "~/.local/cctf/history").
+        :param str timeframe: candles granularity, one of "1d", "1h" or "1m".
+        """
+        if timeframe not in _HISTO_URLS:
+            raise ValueError(f'Invalid timeframe: {timeframe} (valid ones: {", ".join(_HISTO_URLS)})')
+        self.store = store or OHLCVStore(_DATA_DIR.joinpath('history'))
+        self.timeframe = timeframe
+        self.step = _HISTO_STEPS[timeframe]
+        self._locks = col.defaultdict(threading.Lock)
+
+    def prices(self, queries, interpolate=False):
+        """Return historical prices for many (base, quote, timestamp) queries.
+
+        Stored ranges are not requested again, so this example (store already holding the queried range) runs offline:
+
+        >>> import tempfile
+        >>> history = PriceHistory(store=OHLCVStore(tempfile.mkdtemp()))
+        >>> history.store.append('ETH/USD', '1d', [[0, 100.0, 110.0, 90.0, 102.0, 1.0],
+        ...                                        [86400000, 102.0, 120.0, 100.0, 118.0, 1.0]])
+        2
+        >>> history.prices([('ETH', 'USD', 3600), ('eth', 'USDT', 86400 + 3600)])
+        [101.0, 110.0]
+
+        :param queries: (base, quote, timestamp) tuples where timestamp is in secs.
+        :type queries: tp.Iterable[tuple]
+        :param bool interpolate: if True, prices are interpolated between candles.
+        :return list: one price per query (None if there is no price for it).
+        """
+        queries = list(queries)
+        pairs = col.defaultdict(list)
+        for i, (base, quote, timestamp) in enumerate(queries):
+            pairs[str(base).upper(), utils._quote(quote)].append(i)
+        result = [None] * len(queries)
+        for (base, quote), rows in pairs.items():
+            timestamps = [int(queries[i][2]) for i in rows]
+            self.fetch(base, quote, min(timestamps), max(timestamps))
+            for i, price in zip(rows, self._lookup(base, quote, timestamps, interpolate)):
+                result[i] = price
+        return result
+
+    def price(self, base, quote, timestamp, interpolate=False):
+        """Return historical price for a single pair and timestamp (see "prices").
+
+        :param base: base currency.
+        :type base: str or Currency
+        :param quote: quote currency.
+        :type quote: str or Currency
+        :param int timestamp: timestamp in secs.
+        :param bool interpolate: if True, price is interpolated between candles.
+        :return float: price at timestamp or None.
+        """
+        return self.prices([(base, quote, timestamp)], interpolate)[0]
+
+    def fetch(self, base, quote, start, end):
+        """Make sure pair candles from "start" to "end" timestamps (in secs) are in local store.
+
+        Only ranges not stored yet are requested (the last stored candle is requested again while it is still open).
+
+        :param str base: upper case base currency.
+        :param str quote: upper case and supported quote currency.
+        :param int start: range start timestamp in secs.
+        :param int end: range end timestamp in secs.
+        :return int: number of stored candles.
+        """
+        symbol = f'{base}/{quote}'
+        now = int(time.time())
+        start, end = start - start % self.step, min(end, now)
+        end -= end % self.step
+        written = 0
+        with self._locks[symbol]:
+            span = self.store.span(symbol, self.timeframe)
+            if span is None:
+                return self._fetch_range(base, quote, start, end)
+            first, last = span[0] // 1000, span[1] // 1000
+            if start < first:
+                written += self._fetch_range(base, quote, start, first - self.step)
+            if end > last or (end == last and last + self.step > now):
+                written += self._fetch_range(base, quote, last, end)
+        return written
+
+    def _fetch_range(self, base, quote, start, end):
+        """Request candles from "start" to "end" (both in secs and included) and append them to store."""
+        symbol, to, pages = f'{base}/{quote}', end, list()
+        while to >= start:
+            limit = max(1, min(_HISTO_MAX_LIMIT, (to - start) // self.step))
+            params = dict(fsym=base, tsym=quote, toTs=to, limit=limit)
+            result = utils.get_url(_HISTO_URLS[self.timeframe], params=params)
+            if not isinstance(result, dict) or result.get('Response') != 'Success':
+                break
+            data = [d for d in (result.get('Data') or dict()).get('Data') or list() if start <= d['time'] <= end]
+            if not data:
+                break
+            pages.append(data)
+            to = data[0]['time'] - self.step
+        rows = [[d['time'] * 1000, d['open'], d['high'], d['low'], d['close'], d.get('volumefrom') or 0.0]
+                for page in reversed(pages) for d in page]
+        if not rows:
+            return 0
+        span = self.store.span(symbol, self.timeframe)
+        if span is not None and rows[0][0] < span[0]:
+            return self.store.prepend(symbol, self.timeframe, rows)
+        return self.store.append(symbol, self.timeframe, rows)
+
+    def _lookup(self, base, quote, timestamps, interpolate=False):
+        """Answer pair queries from local store.
+
+        :param str base: upper case base currency.
+        :param str quote: upper case and supported quote currency.
+        :param list timestamps: timestamps in secs.
+        :param bool interpolate: if True, prices are interpolated between candles middle points.
+        :return list: one price (or None) per timestamp.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.int64) * 1000
+        candles = self.store.read(f'{base}/{quote}', self.timeframe, int(timestamps.min()) - self.step * 1000,
+                                  int(timestamps.max()) + self.step * 1000)
+        if not len(candles):
+            return [None] * len(timestamps)
+        step = self.step * 1000
+        mids = np.round((candles.open + candles.close) / 2, 8)
+        dates = candles.dates
+        rows = np.searchsorted(dates, timestamps, 'right') - 1
+        found = (rows >= 0) & (timestamps < dates[np.maximum(rows, 0)] + step)
+        if interpolate:
+            prices = np.round(np.interp(timestamps, dates + step // 2, mids), 8)
+        else:
+            prices = mids[np.maximum(rows, 0)]
+        return [p if ok and p > 0.0 else None for p, ok in zip(prices.tolist(), found.tolist())]
+
+
+_PRICE_HISTORY = None
+
+
+def get_historical_prices(queries, interpolate=False):
+    """Return historical prices for many (base, quote, timestamp) queries (see "PriceHistory.prices").
+
+    :param queries: (base, quote, timestamp) tuples where timestamp is in secs.
+    :type queries: tp.Iterable[tuple]
+    :param bool interpolate: if True, prices are interpolated between candles.
+    :return list: one price per query (None if there is no price for it).
+    """
+    global _PRICE_HISTORY
+    if _PRICE_HISTORY is None:
+        _PRICE_HISTORY = PriceHistory()
+    return _PRICE_HISTORY.prices(queries, interpolate)
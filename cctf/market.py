@@ -11,7 +11,7 @@ from typing import Text, Dict, Union as U, Any
 from cctf.base import Precision, Limit, BaseDict
 from cctf.symbol import Symbol, Currency
 
-__all__ = ['Markets', 'Market', 'Ticker', 'Tickers']
+__all__ = ['Markets', 'Market', 'Ticker', 'Tickers', 'ExchangeInfo']
 
 _DEFAULT_RANGE = dict(min=0.0, max=sys.maxsize)
 _DEFAULT_LIMITS = dict(
@@ -83,7 +83,8 @@ class Market(BaseDict):
         limits = {k: v for k, v in self.data.get('limits', default_limits).items() if v}
 
         default_precision = dict(amount=8, price=8, quote=8, base=8)
-        default_precision.update(**{k: v for k, v in self.data.get('precision', default_precision).items() if v})
+        precision = self.data.get('precision', default_precision)
+        default_precision.update(**{k: v for k, v in precision.items() if v is not None})
 
         self.taker = self.data.get('taker')
         self.maker = self.data.get('maker')
@@ -99,6 +100,54 @@ class Market(BaseDict):
         self.id = self.data.get('id', self.symbol)
         self.active = self.data.get('active', False)
 
+    def price2precision(self, price):
+        """Round "price" to market price precision.
+
+        >>> Market(base='BTC', quote='USDT', precision=dict(price=2)).price2precision(6543.21789)
+        6543.22
+
+        :param float price: price to round.
+        :return float: rounded price.
+        """
+        return self.precision.quantize('price', price)
+
+    def amount2precision(self, amount):
+        """Truncate "amount" to market amount precision.
+
+        >>> Market(base='BTC', quote='USDT', precision=dict(amount=3)).amount2precision(0.12389)
+        0.123
+        >>> Market(base='BTC', quote='USDT', precision=dict(amount=0)).amount2precision(12.9)
+        12.0
+
+        :param float amount: amount to truncate.
+        :return float: truncated amount.
+        """
+        return self.precision.quantize('amount', amount, truncate=True)
+
+    def cost2precision(self, cost):
+        """Round "cost" to market cost precision.
+
+        :param float cost: cost to round.
+        :return float: rounded cost.
+        """
+        return self.precision.quantize('cost', cost)
+
+    def orders2precision(self, orders):
+        """Bulk version of "price2precision" and "amount2precision" for many orders of this market.
+
+        >>> market = Market(base='BTC', quote='USDT', precision=dict(price=2, amount=3))
+        >>> market.orders2precision([dict(price=6543.217, amount=0.12389), dict(price=6500.0, amount=1.0)])
+        ([6543.22, 6500.0], [0.123, 1.0])
+
+        :param orders: orders (any item accessible type with "price" and "amount" keys).
+        :type orders: tp.Iterable[Order or dict]
+        :return tuple: (prices, amounts) lists, same order as "orders".
+        """
+        orders = list(orders)
+        prices = self.precision.quantize_many('price', [o.get('price') for o in orders])
+        amounts = self.precision.quantize_many('amount', [o.get('amount') for o in orders], truncate=True)
+        return prices, amounts
+
     def as_dict(self) -> Dict:
         """Return data as dict.
 
@@ -154,12 +203,104 @@ class Markets(Dict[U[Text, Symbol], Dict]):
 
         :param kwargs:
         """
-        init_data = dict()
-        for k, v in kwargs.items():
-            v = {x: y for x, y in v.items() if y is not None}
-            m = Market(**v)
-            init_data.update({Symbol(k): Market(**m)})
-        super().__init__(**init_data)
+        super().__init__({Symbol(k): Market(**self._clean(v)) for k, v in kwargs.items()})
+
+    @staticmethod
+    def _clean(data):
+        """Remove None values from market raw data.
+
+        :param dict data: market raw data.
+        :return dict: market raw data without None values.
+        """
+        return {k: v for k, v in data.items() if v is not None}
+
+    def orders2precision(self, orders):
+        """Bulk price and amount precision handling for orders of any of these markets.
+
+        Orders are grouped by symbol so each market quantizes all its orders at once.
+
+        >>> markets = Markets(**{'BTC/USDT': dict(base='BTC', quote='USDT', precision=dict(price=2, amount=3)),
+        ...                      'ETH/BTC': dict(base='ETH', quote='BTC', precision=dict(price=6, amount=2))})
+        >>> markets.orders2precision([dict(symbol='BTC/USDT', price=6543.217, amount=0.12389),
+        ...                           dict(symbol='ETH/BTC', price=0.0312345678, amount=1.239)])
+        ([6543.22, 0.031235], [0.123, 1.23])
+
+        :param orders: orders (any item accessible type with "symbol", "price" and "amount" keys).
+        :type orders: tp.Iterable[Order or dict]
+        :return tuple: (prices, amounts) lists, same order as "orders".
+        :raise KeyError: if any order symbol is not in markets.
+        """
+        orders = list(orders)
+        groups = dict()
+        for i, o in enumerate(orders):
+            groups.setdefault(Symbol(o['symbol']), list()).append(i)
+        prices, amounts = [None] * len(orders), [None] * len(orders)
+        for symbol, rows in groups.items():
+            group_prices, group_amounts = self[symbol].orders2precision([orders[i] for i in rows])
+            for i, price, amount in zip(rows, group_prices, group_amounts):
+                prices[i], amounts[i] = price, amount
+        return prices, amounts
+
+    def refresh(self, **kwargs):
+        """Update markets in place from a new markets snapshot.
+
+        Only new and changed markets are built, unchanged ones keep their current Market instance.
+
+        >>> markets = Markets(**{'BTC/USDT': dict(base='BTC', quote='USDT'), 'ETH/BTC': dict(base='ETH', quote='BTC')})
+        >>> eth_btc = markets['ETH/BTC']
+        >>> markets.refresh(**{'BTC/USDT': dict(base='BTC', quote='USDT', active=True), 'ETH/BTC': dict(base='ETH',
+        ...                    quote='BTC'), 'XRP/BTC': dict(base='XRP', quote='BTC')})
+        ([(Symbol:XRP/BTC)], [(Symbol:BTC/USDT)], [])
+        >>> markets['ETH/BTC'] is eth_btc
+        True
+        >>> markets.refresh(**{'btc/usdt': dict(base='BTC', quote='USDT', active=True)})
+        ([], [], [(Symbol:ETH/BTC), (Symbol:XRP/BTC)])
+
+        :param kwargs: markets snapshot (same format used by constructor).
+        :return tuple: (added, changed, removed) symbols lists.
+        """
+        added, changed = list(), list()
+        snapshot = {Symbol(k): v for k, v in kwargs.items()}
+        for symbol, v in snapshot.items():
+            v = self._clean(v)
+            market = self.get(symbol)
+            if market is None or market.data != v:
+                (added if market is None else changed).append(symbol)
+                self[symbol] = Market(**v)
+        removed = [s for s in self if s not in snapshot]
+        for symbol in removed:
+            del self[symbol]
+        return added, changed, removed
+
+
+def _benchmark(size=5000, number=5):
+    """Markets construction and refresh benchmark over a synthetic markets payload (prints ms per operation).
+
+    :param int size: number of markets in synthetic payload.
+    :param int number: number of times each operation is executed.
+    """
+    import copy
+    import timeit
+
+    limit = dict(min=0.001, max=100000.0)
+    payload = {f'C{i}/BTC': dict(id=f'c{i}btc', symbol=f'C{i}/BTC', base=f'C{i}', quote='BTC', active=True,
+                                 precision=dict(amount=2, price=8), limits=dict(amount=limit, price=limit, cost=limit),
+                                 info=dict(status='TRADING'))
+               for i in range(size)}
+    # one fresh snapshot per refresh, alternating 1% of markets "active" flag, so every refresh has changes
+    snapshots = list()
+    for n in range(number):
+        snapshot = copy.deepcopy(payload)
+        for k in list(snapshot)[::100]:
+            snapshot[k]['active'] = n % 2 == 1
+        snapshots.append(snapshot)
+    snapshots = iter(snapshots)
+    markets = Markets(**payload)
+
+    for name, fn in [('Markets(**payload)', lambda: Markets(**payload)),
+                     ('Markets.refresh (1% changed)', lambda: markets.refresh(**next(snapshots)))]:
+        secs = timeit.timeit(fn, number=number)
+        print(f' - {name:<30} {secs / number * 1e3:>8.1f} ms ({size} markets)')
 
 
 class Ticker(Dict[Text, Any]):
@@ -189,6 +330,14 @@ class Tickers(Dict[U[Text, Symbol], Ticker]):
         """Constructor."""
         super().__init__({Symbol(k): Ticker(**v) for k, v in kwargs.items()})
 
+    def to_table(self):
+        """Convert tickers to columnar store (requires numpy).
+
+        :return cctf.tickers.TickerTable: columnar tickers store.
+        """
+        from cctf.tickers import TickerTable
+        return TickerTable.from_dict(self)
+
 
 class ExchangeInfo:
 
@@ -252,6 +401,7 @@ class ExchangeInfo:
             'uid':      '123456',               // string user id
         }
         """
+        self._urls: dict = kwargs.get('urls') or dict()
         self.id: str = kwargs.get('id')
         self.name: str = kwargs.get('name')
         self.countries: list = kwargs.get('countries')
@@ -262,7 +412,7 @@ class ExchangeInfo:
         self.user_agent: bool = kwargs.get('userAgent')
         self.verbose: bool = kwargs.get('verbose')
         self.apikey: bool = kwargs.get('apiKey')
-        self.secret: bool = kwargs.get('rateLimit')
+        self.secret: bool = kwargs.get('secret')
         self.password: bool = kwargs.get('password')
         self.uid = kwargs.get('uid')
         self.proxy = kwargs.get('proxy')
@@ -274,4 +424,19 @@ class ExchangeInfo:
         self.currencies: dict = kwargs.get('currencies', {})
         self.symbols: dict = kwargs.get('symbols', {})
         self._api = kwargs.get('api')
-        self._urls: dict = kwargs.get('urls', {})
+
+    def has(self, feature):
+        """Return True if exchange supports "feature" (a ccxt "has" key like "fetchOHLCV").
+
+        >>> info = ExchangeInfo(id='fake', urls=dict(api='https://api.example.com'), has=dict(fetchOHLCV=True))
+        >>> info.url_api, info.has('fetchOHLCV'), info.has('withdraw')
+        ('https://api.example.com', True, False)
+
+        :param str feature: ccxt "has" key.
+        :return bool: True if supported ("emulated" counts as supported).
+        """
+        return bool((self._has or dict()).get(feature))
+
+
+if __name__ == '__main__':
+    _benchmark()
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""CCTF
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - License:     UNLICENSE
+"""
+import json
+import mmap
+import os
+import pathlib as path
+import struct
+import typing as tp
+
+__all__ = ['MetadataIndex']
+
+_MAGIC = b'CCTFIDX1'
+_HEADER = struct.Struct('<8sI')
+# key offset, key length, value offset, value length
+_ENTRY = struct.Struct('<IIII')
+
+
+class MetadataIndex(tp.Mapping[str, dict]):
+    """Read-only memory-mapped metadata index.
+
+    File layout (little endian):
+
+     - header: magic (8 bytes) and entries count (uint32).
+     - entries table: (key offset, key length, value offset, value length) uint32 tuples sorted by key.
+     - keys blob: UTF-8 encoded keys.
+     - values blob: compact JSON encoded values.
+
+    Lookups binary search the entries table directly on the mapped file, so only the requested value is decoded.
+
+    >>> import tempfile
+    >>> index_file = path.Path(tempfile.mkdtemp()).joinpath('coins.idx')
+    >>> MetadataIndex.write(index_file, {'ETH': {'Id': '7605'}, 'BTC': {'Id': '1182'}})
+    >>> index = MetadataIndex(index_file)
+    >>> len(index), list(index)
+    (2, ['BTC', 'ETH'])
+    >>> index['ETH']
+    {'Id': '7605'}
+    >>> 'XRP' in index
+    False
+
+    """
+
+    def __init__(self, filename):
+        """MetadataIndex constructor.
+
+        :param filename: index file path.
+        :type filename: str or path.Path
+        :raise ValueError: if file is not a valid index file.
+        """
+        self.filename = path.Path(filename)
+        with open(str(self.filename), 'rb') as fp:
+            try:
+                self._mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f'{self.filename} is empty.')
+        if len(self._mm) < _HEADER.size:
+            raise ValueError(f'{self.filename} is not a valid index file.')
+        magic, self._count = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or len(self._mm) < _HEADER.size + self._count * _ENTRY.size:
+            raise ValueError(f'{self.filename} is not a valid index file.')
+        self._keys = None
+
+    @staticmethod
+    def write(filename, data):
+        """Write "data" dict as index file (atomically replacing any previous one).
+
+        :param filename: index file path.
+        :type filename: str or path.Path
+        :param dict data: str keys and JSON serializable values dict.
+        """
+        keys = sorted(data)
+        raw_keys = [str(k).encode('utf-8') for k in keys]
+        raw_values = [json.dumps(data[k], separators=(',', ':')).encode('utf-8') for k in keys]
+
+        keys_offset = _HEADER.size + len(keys) * _ENTRY.size
+        values_offset = keys_offset + sum(map(len, raw_keys))
+        entries = list()
+        for raw_key, raw_value in zip(raw_keys, raw_values):
+            entries.append(_ENTRY.pack(keys_offset, len(raw_key), values_offset, len(raw_value)))
+            keys_offset += len(raw_key)
+            values_offset += len(raw_value)
+
+        filename = path.Path(filename)
+        temp_file = filename.with_suffix('{}.{}.tmp'.format(filename.suffix, os.getpid()))
+        with open(str(temp_file), 'wb') as fp:
+            fp.write(_HEADER.pack(_MAGIC, len(keys)))
+            fp.write(b''.join(entries))
+            fp.write(b''.join(raw_keys))
+            fp.write(b''.join(raw_values))
+        os.replace(str(temp_file), str(filename))
+
+    def _entry(self, i):
+        """Return i-th entry as (key offset, key length, value offset, value length) tuple."""
+        return _ENTRY.unpack_from(self._mm, _HEADER.size + i * _ENTRY.size)
+
+    def _key(self, i):
+        """Return i-th raw key."""
+        key_offset, key_length, _, _ = self._entry(i)
+        return self._mm[key_offset:key_offset + key_length]
+
+    def _find(self, key):
+        """Binary search "key" returning its position or -1 if not found."""
+        raw_key = str(key).encode('utf-8')
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < raw_key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self._count and self._key(lo) == raw_key else -1
+
+    def __getitem__(self, key):
+        i = self._find(key) if isinstance(key, str) else -1
+        if i < 0:
+            raise KeyError(key)
+        _, _, value_offset, value_length = self._entry(i)
+        return json.loads(self._mm[value_offset:value_offset + value_length].decode('utf-8'))
+
+    def __contains__(self, key):
+        return isinstance(key, str) and self._find(key) >= 0
+
+    def __iter__(self):
+        if self._keys is None:
+            self._keys = [self._key(i).decode('utf-8') for i in range(self._count)]
+        return iter(self._keys)
+
+    def __len__(self):
+        return self._count
+
+    def __repr__(self):
+        return f'{type(self).__name__}({str(self.filename)!r}, entries: {self._count})'
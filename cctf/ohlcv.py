@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""CCTF
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - License:     UNLICENSE
+"""
+import itertools
+import math
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from cctf.orders import OHLC
+
+__all__ = ['OHLCV', 'parse_timeframe']
+
+_TIMEFRAME_UNITS = {'s': 1000, 'm': 60000, 'h': 3600000, 'd': 86400000, 'w': 604800000}
+_TIMEFRAME_RE = re.compile(r'^(\d+)([smhdw])$')
+
+
+def parse_timeframe(timeframe):
+    """Convert a ccxt like timeframe ("1m", "4h", "1d", ...) to milliseconds.
+
+    >>> parse_timeframe('5m'), parse_timeframe('1d')
+    (300000, 86400000)
+
+    :param timeframe: timeframe as str or milliseconds as int.
+    :type timeframe: str or int
+    :return int: timeframe in milliseconds.
+    :raise ValueError: if timeframe format is not valid.
+    """
+    if isinstance(timeframe, int):
+        return timeframe
+    match = _TIMEFRAME_RE.match(str(timeframe).strip())
+    if match is None:
+        raise ValueError(f'Invalid timeframe: {timeframe}')
+    amount, unit = match.groups()
+    return int(amount) * _TIMEFRAME_UNITS[unit]
+
+
+class OHLCV:
+    """Array backed OHLCV candles series (requires numpy).
+
+    Dates (ms timestamps) are stored in an int64 column and open, high, low, close and volume in float64 columns, all
+    of them contiguous. Time slicing returns views (no data is copied) and "append" writes in place into preallocated
+    capacity (grown geometrically).
+
+    >>> candles = OHLCV.from_ccxt([[0, 1.0, 2.0, 0.5, 1.5, 10.0],
+    ...                            [60000, 1.5, 3.0, 1.0, 2.0, 20.0],
+    ...                            [120000, 2.0, 2.5, 1.5, 2.5, 30.0]], timeframe='1m')
+    >>> len(candles), candles.quotevolume.tolist()
+    (3, [15.0, 40.0, 75.0])
+    >>> candles.between(60000).close.tolist()
+    [2.0, 2.5]
+    >>> candles.append([[120000, 2.0, 2.8, 1.5, 2.6, 35.0], [180000, 2.6, 2.7, 2.4, 2.5, 5.0]])
+    >>> candles.to_list()[-2:]
+    [[120000, 2.0, 2.8, 1.5, 2.6, 35.0], [180000, 2.6, 2.7, 2.4, 2.5, 5.0]]
+    >>> candles.resample('2m').to_list()
+    [[0, 1.0, 3.0, 0.5, 2.0, 30.0], [120000, 2.0, 2.8, 1.5, 2.5, 40.0]]
+
+    """
+
+    COLUMNS = (OHLC.DATE, OHLC.OPEN, OHLC.HIGH, OHLC.LOW, OHLC.CLOSE, OHLC.VOLUME)
+
+    def __init__(self, dates, open, high, low, close, volume, timeframe=None, copy=True):
+        """OHLCV constructor.
+
+        :param dates: candles open time as ms timestamps (sorted in ascending order).
+        :param open: open prices.
+        :param high: high prices.
+        :param low: low prices.
+        :param close: close prices.
+        :param volume: base currency volumes.
+        :param timeframe: candles timeframe ("1m", "1h", ...) if known.
+        :type timeframe: str or int
+        :param bool copy: if False, supplied arrays are used as is when types already match (e.g. memory mapped data).
+        """
+        if np is None:
+            raise ImportError('numpy is required by OHLCV.')
+        convert = np.array if copy else np.asarray
+        dates = convert(dates, dtype=np.int64)
+        values = [convert(v, dtype=np.float64) for v in (open, high, low, close, volume)]
+        if any(len(v) != len(dates) for v in values):
+            raise ValueError('All OHLCV columns must have the same length.')
+        self._columns = [dates] + values
+        self._size = len(dates)
+        # shared (not copied) columns are reallocated before the first write
+        self._owned = bool(copy)
+        self.timeframe = timeframe
+
+    @classmethod
+    def from_ccxt(cls, rows, timeframe=None):
+        """Build from ccxt "fetch_ohlcv" like rows ([timestamp, open, high, low, close, volume] lists).
+
+        Rows are streamed into a single preallocated buffer, so no per row intermediate arrays are created. Missing
+        values (None, as ccxt returns for empty candles or volumes) are stored as NaN.
+
+        >>> candles = OHLCV.from_ccxt([[0, 1.0, 1.0, 1.0, 1.0, None], [60000, None, None, None, None, None]])
+        >>> len(candles), candles.volume.tolist()
+        (2, [nan, nan])
+
+        :param rows: ccxt OHLCV rows.
+        :type rows: tp.Sequence[list]
+        :param timeframe: candles timeframe.
+        :type timeframe: str or int
+        :return OHLCV: new OHLCV instance.
+        """
+        if np is None:
+            raise ImportError('numpy is required by OHLCV.')
+        width = len(cls.COLUMNS)
+        values = (math.nan if v is None else v for v in itertools.chain.from_iterable(rows))
+        data = np.fromiter(values, np.float64, len(rows) * width)
+        data = data.reshape(len(rows), width).T
+        return cls(data[0], *data[1:], timeframe=timeframe)
+
+    def _column(self, i):
+        """Return a read-only view of i-th column (only filled rows)."""
+        column = self._columns[i][:self._size]
+        column.flags.writeable = False
+        return column
+
+    @property
+    def dates(self):
+        """Candles open time (ms timestamps) as int64 array view."""
+        return self._column(0)
+
+    @property
+    def open(self):
+        """Open prices as float64 array view."""
+        return self._column(1)
+
+    @property
+    def high(self):
+        """High prices as float64 array view."""
+        return self._column(2)
+
+    @property
+    def low(self):
+        """Low prices as float64 array view."""
+        return self._column(3)
+
+    @property
+    def close(self):
+        """Close prices as float64 array view."""
+        return self._column(4)
+
+    @property
+    def volume(self):
+        """Base currency volumes as float64 array view."""
+        return self._column(5)
+
+    @property
+    def quotevolume(self):
+        """Quote currency volumes (volume * close) as float64 array."""
+        return self.volume * self.close
+
+    def column(self, field):
+        """Return "field" column ("quotevolume" included).
+
+        :param str field: one of COLUMNS or "quotevolume".
+        :return np.ndarray: "field" column.
+        """
+        if field == OHLC.QVOLUME:
+            return self.quotevolume
+        return self._column(self.COLUMNS.index(field))
+
+    def _view(self, start, stop):
+        """Return a new instance sharing rows from "start" to "stop" positions (no data copy)."""
+        return type(self)(*(c[start:stop] for c in self._columns), timeframe=self.timeframe, copy=False) \
+            if start < stop else type(self)([], [], [], [], [], [], timeframe=self.timeframe)
+
+    def between(self, start=None, end=None):
+        """Return candles opened from "start" (included) to "end" (excluded) as a view (no data copy).
+
+        :param int start: start ms timestamp (default from the first candle).
+        :param int end: end ms timestamp (default up to the last candle).
+        :return OHLCV: candles view.
+        """
+        dates = self.dates
+        lo = 0 if start is None else int(np.searchsorted(dates, start, 'left'))
+        hi = self._size if end is None else int(np.searchsorted(dates, end, 'left'))
+        return self._view(lo, hi)
+
+    def append(self, rows):
+        """Append ccxt like rows in place (amortized O(1) per row).
+
+        Rows older than last candle are ignored and a row with the same date as the last candle replaces it (last
+        candle is usually still open when fetched).
+
+        :param rows: ccxt OHLCV rows.
+        :type rows: tp.Sequence[list]
+        """
+        other = rows if isinstance(rows, OHLCV) else OHLCV.from_ccxt(rows)
+        if not len(other):
+            return
+        dates = other.dates
+        start = self._size
+        if start:
+            last = self._columns[0][start - 1]
+            dates = dates[int(np.searchsorted(dates, last, 'left')):]
+            if len(dates) and dates[0] == last:
+                start -= 1
+        count = len(dates)
+        if not count:
+            return
+        offset = len(other) - count
+        self._reserve(start + count)
+        for column, values in zip(self._columns, other._columns):
+            column[start:start + count] = values[offset:offset + count]
+        self._size = start + count
+
+    def _reserve(self, size):
+        """Make sure columns capacity is at least "size" rows (reallocating if needed)."""
+        capacity = len(self._columns[0])
+        if size <= capacity and self._owned:
+            return
+        capacity = max(size, 2 * capacity, 64) if size > capacity else capacity
+        columns = list()
+        for column in self._columns:
+            new_column = np.empty(capacity, dtype=column.dtype)
+            new_column[:self._size] = column[:self._size]
+            columns.append(new_column)
+        self._columns = columns
+        self._owned = True
+
+    def resample(self, timeframe):
+        """Aggregate candles into a coarser timeframe.
+
+        :param timeframe: new timeframe ("5m", "1h", "1d", ...).
+        :type timeframe: str or int
+        :return OHLCV: new resampled OHLCV instance.
+        """
+        step = parse_timeframe(timeframe)
+        if not self._size:
+            return type(self)([], [], [], [], [], [], timeframe=timeframe)
+        buckets = self.dates // step * step
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+        ends = np.append(starts[1:], self._size) - 1
+        return type(self)(buckets[starts], self.open[starts],
+                          np.maximum.reduceat(self.high, starts), np.minimum.reduceat(self.low, starts),
+                          self.close[ends], np.add.reduceat(self.volume, starts), timeframe=timeframe, copy=False)
+
+    def to_list(self):
+        """Convert to ccxt like rows.
+
+        :return list: [timestamp, open, high, low, close, volume] rows list.
+        """
+        values = zip(*(self._column(i).tolist() for i in range(1, len(self.COLUMNS))))
+        return [[d, *v] for d, v in zip(self.dates.tolist(), values)]
+
+    @property
+    def nbytes(self):
+        """Allocated memory in bytes."""
+        return sum(c.nbytes for c in self._columns)
+
+    def __getitem__(self, item):
+        """Return a column if item is a field name, otherwise a view of rows selected by position slice.
+
+        :param item: field name or positional slice.
+        :type item: str or slice
+        :return: column as np.ndarray or rows view as OHLCV.
+        """
+        if isinstance(item, str):
+            return self.column(item)
+        elif isinstance(item, slice) and item.step in (None, 1):
+            start, stop, _ = item.indices(self._size)
+            return self._view(start, stop)
+        raise TypeError(f'Invalid index: {item!r}')
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return f'{type(self).__name__}(timeframe: {self.timeframe}, candles: {self._size})'
@@ -7,15 +7,71 @@
   - Created:    13-11-2018
   - Modified:   13-11-2018
 """
-from collections import UserDict
+import typing as tp
+
+__all__ = ['TradeFields', 'Order', 'Orders', 'Side', 'OHLC']
+
+
+class TradeFields:
+    AMOUNT = 'amount'
+    COST = 'cost'
+    DATETIME = 'datetime'
+    FEE = 'fee'
+    PRICE = 'price'
+    SIDE = 'side'
+    SYMBOL = 'symbol'
+    TIMESTAMP = 'timestamp'
+
+
+def _int(value):
+    """Convert "value" to int (numeric str like "1546300800000.0" included).
+
+    >>> _int('1546300800000.0'), _int(5.9)
+    (1546300800000, 5)
+    """
+    return int(float(value))
+
+
+def _cast(cast, value):
+    """Convert "value" with "cast" without raising (None values are kept as is).
+
+    >>> _cast(float, '0.5'), _cast(float, 'n/a'), _cast(dict, [1]), _cast(str, None)
+    (0.5, None, [1], None)
+
+    :param cast: type (or callable) to convert "value" to.
+    :param value: value to convert.
+    :return: converted value, None for failed numeric conversions or unchanged value for other failed conversions.
+    """
+    if value is None:
+        return value
+    try:
+        return cast(value)
+    except (TypeError, ValueError, OverflowError):
+        return None if cast in (float, _int) else value
 
 
 # noinspection PyUnusedFunction,PyUnusedFunction,PyUnusedFunction,PyUnusedFunction
-class Order(UserDict):
+class Order:
     """ Order model class to serve as order data container.
 
+    Compact and typed order record (one slot per field). It keeps dict like access ("order['price']", "get", "keys",
+    iteration, "len" and item assignment) so it can be used wherever ccxt order dicts are expected. Fields not in
+    FIELDS (like "trades", "fees", "timeInForce" or "stopPrice") are kept as is in "extra" dict and are accessible the
+    same way, also as attributes (missing ones are None).
+
     >>> Order(price=0.0543).price
     0.0543
+    >>> order = Order.from_ccxt(dict(id='1', symbol='BTC/USDT', price='6000', amount=0.1, status='open',
+    ...                              timeInForce='GTC'))
+    >>> order['price'], order.is_active(), order.is_completed()
+    (6000.0, True, False)
+    >>> order.extra, order['timeInForce'], order.timeInForce, order.stopPrice
+    ({'timeInForce': 'GTC'}, 'GTC', 'GTC', None)
+    >>> order['filled'] = '0.05'
+    >>> len(order), list(order)
+    (7, ['id', 'symbol', 'price', 'amount', 'filled', 'status', 'timeInForce'])
+    >>> Order(amount='n/a', info=[1], timestamp='1546300800000.0').to_dict()
+    {'timestamp': 1546300800000, 'info': [1]}
 
     """
     PRICE = 'price'
@@ -30,43 +86,165 @@ class Order(UserDict):
     # noinspection PyUnusedFunction
     class Status:
         NEW = 'new'
+        OPEN = 'open'
         CLOSED = 'closed'
         PENDING = 'pending'
-        CANCELED = 'cancel'
+        # ccxt canceled order status
+        CANCELED = 'canceled'
+        EXPIRED = 'expired'
+        REJECTED = 'rejected'
 
         @classmethod
         def fields(cls):
-            return [cls.NEW, cls.CLOSED, cls.PENDING, cls.CANCELED]
+            return [cls.NEW, cls.OPEN, cls.CLOSED, cls.PENDING, cls.CANCELED, cls.EXPIRED, cls.REJECTED]
+
+    # field name -> type (values are converted on assignment, None is kept as is, see "_cast")
+    TYPES = {
+        'id': str,
+        'clientOrderId': str,
+        TradeFields.TIMESTAMP: _int,
+        TradeFields.DATETIME: str,
+        'lastTradeTimestamp': _int,
+        TradeFields.SYMBOL: str,
+        'type': str,
+        TradeFields.SIDE: str,
+        TradeFields.PRICE: float,
+        'average': float,
+        TradeFields.AMOUNT: float,
+        TradeFields.COST: float,
+        'filled': float,
+        'remaining': float,
+        STATUS: str,
+        TradeFields.FEE: dict,
+        'info': dict,
+    }
+    FIELDS = tuple(TYPES)
+
+    __slots__ = FIELDS + ('extra',)
 
     def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # self.price = kwargs.get(self.PRICE)
-        # self.amount = kwargs.get(self.STATUS)
-        # self.buy = kwargs.get(self.BUY)
-        # self.sell = kwargs.get(self.SELL)
-        # self.limit = kwargs.get(self.LIMIT)
-        # self.market = kwargs.get(self.MARKET)
-        # self.status = kwargs.get(self.STATUS)
-        # self.cancel = kwargs.get(self.CANCEL)
+        """Order constructor.
 
-    def __getattr__(self, item):
-        return self.data.get(item) if item not in 'data' else self.data
+        Values that can not be converted to their field type never raise: numeric fields are set to None and
+        other fields keep the supplied value.
 
-    @classmethod
-    def is_new(cls):
-        return cls.status == cls.NEW
+        :param kwargs: order fields (see FIELDS), unknown fields are stored unchanged in "extra" dict.
+        """
+        for field, cast in self.TYPES.items():
+            setattr(self, field, _cast(cast, kwargs.get(field)))
+        self.extra = {k: v for k, v in kwargs.items() if k not in self.TYPES}
 
     @classmethod
-    def is_completed(cls):
-        return cls.STATUS == cls.CLOSED
+    def from_ccxt(cls, data):
+        """Build an Order from a ccxt order dict.
 
-    @classmethod
-    def is_active(cls):
-        return cls.STATUS == cls.PENDING
+        :param dict data: ccxt order dict.
+        :return Order: new Order instance.
+        """
+        return cls(**data)
+
+    def is_new(self):
+        return self.status == self.Status.NEW
+
+    def is_completed(self):
+        return self.status == self.Status.CLOSED
+
+    def is_active(self):
+        return self.status in (self.Status.PENDING, self.Status.OPEN)
+
+    def is_removed(self):
+        # ccxt uses "canceled" for canceled orders
+        return self.status in (self.Status.CANCELED, self.Status.EXPIRED, self.Status.REJECTED)
+
+    def keys(self):
+        """Names of fields with a value (followed by "extra" ones) as list."""
+        return list(self.to_dict())
+
+    def get(self, item, default=None):
+        """Dict like "get" implementation."""
+        value = getattr(self, item, None) if item in self.TYPES else self.extra.get(item)
+        return default if value is None else value
+
+    def to_dict(self):
+        """Return order as dict, "extra" fields included (fields with None values are not included)."""
+        data = {f: getattr(self, f) for f in self.FIELDS if getattr(self, f) is not None}
+        data.update({k: v for k, v in self.extra.items() if v is not None})
+        return data
+
+    def __getattr__(self, item):
+        """Read "extra" fields as attributes (None if missing)."""
+        if item == 'extra' or item.startswith('__'):
+            raise AttributeError(item)
+        return self.extra.get(item)
+
+    def __getitem__(self, item):
+        if item not in self.TYPES:
+            return self.extra[item]
+        return getattr(self, item)
+
+    def __setitem__(self, key, value):
+        if key in self.TYPES:
+            setattr(self, key, _cast(self.TYPES[key], value))
+        else:
+            self.extra[key] = value
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __contains__(self, item):
+        return self.get(item) is not None
+
+    def __eq__(self, other):
+        if isinstance(other, Order):
+            return all(getattr(self, f) == getattr(other, f) for f in self.FIELDS) and self.extra == other.extra
+        return NotImplemented
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, ', '.join(f'{k}={v!r}' for k, v in self.to_dict().items()))
+
+
+class Orders(tp.List[Order]):
+    """Orders list with bulk ccxt conversion and status / symbol selectors.
+
+    >>> orders = Orders.from_ccxt([dict(id='1', symbol='BTC/USDT', status='open'),
+    ...                            dict(id='2', symbol='ETH/BTC', status='closed')])
+    >>> [o.id for o in orders.active()], [o.id for o in orders.by_symbol('ETH/BTC')]
+    (['1'], ['2'])
+
+    """
 
     @classmethod
-    def is_removed(cls):
-        return cls.STATUS == cls.CANCELED
+    def from_ccxt(cls, data):
+        """Bulk build from ccxt orders dicts.
+
+        :param data: ccxt orders dicts.
+        :type data: tp.Iterable[dict]
+        :return Orders: new Orders instance.
+        """
+        return cls(Order(**d) for d in data)
+
+    def active(self):
+        """Return orders still active (open or pending)."""
+        return type(self)(o for o in self if o.is_active())
+
+    def completed(self):
+        """Return completed (closed) orders."""
+        return type(self)(o for o in self if o.is_completed())
+
+    def removed(self):
+        """Return canceled, expired or rejected orders."""
+        return type(self)(o for o in self if o.is_removed())
+
+    def by_symbol(self, symbol):
+        """Return orders for "symbol".
+
+        :param str symbol: symbol to select.
+        """
+        symbol = str(symbol).upper()
+        return type(self)(o for o in self if o.symbol == symbol)
 
 
 # noinspection PyUnusedFunction,PyUnusedFunction,PyUnusedFunction
@@ -86,17 +264,6 @@ class Side:
         return Side.BUY
 
 
-class TradeFields:
-    AMOUNT = 'amount'
-    COST = 'cost'
-    DATETIME = 'datetime'
-    FEE = 'fee'
-    PRICE = 'price'
-    SIDE = 'side'
-    SYMBOL = 'symbol'
-    TIMESTAMP = 'timestamp'
-
-
 class OHLC:
     DATE = 'date'
     OPEN = 'open'
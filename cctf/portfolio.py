@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""CCTF
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - License:     UNLICENSE
+"""
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from cctf.utils import _quote
+from cctf.valuation import PriceSnapshot, _at_par
+
+__all__ = ['Portfolio', 'PortfolioValuation']
+
+
+class Portfolio:
+    """Many accounts wallets aggregator (requires numpy).
+
+    Balances totals are stored in a single (accounts, currencies) float64 matrix, where currencies are shared by all
+    accounts, so thousands of accounts with hundreds of currencies take a few MB and each currency is priced once per
+    snapshot whatever the number of accounts holding it.
+
+    >>> from cctf.balance import Wallet
+    >>> portfolio = Portfolio()
+    >>> portfolio.add('main', Wallet(BTC=0.5, XRP=1000.0), exchange='binance')
+    >>> portfolio.add('hedge', Wallet(BTC=0.25, USDT=100.0), exchange='kraken')
+    >>> portfolio.currencies, portfolio.balances.tolist()
+    (['BTC', 'XRP', 'USDT'], [[0.5, 1000.0, 0.0], [0.25, 0.0, 100.0]])
+    >>> snapshot = PriceSnapshot({'XRP': {'BTC': 0.0001}, 'USDT': {'BTC': 0.0002}}, ['BTC'])
+    >>> valuation = portfolio.valuate(['BTC'], snapshot)
+    >>> valuation.totals, valuation.accounts('BTC'), valuation.currencies('BTC')
+    ({'BTC': 0.87}, {'main': 0.6, 'hedge': 0.27}, {'BTC': 0.75, 'XRP': 0.1, 'USDT': 0.02})
+
+    """
+
+    def __init__(self):
+        """Portfolio constructor."""
+        if np is None:
+            raise ImportError('numpy is required by Portfolio.')
+        self._accounts = dict()
+        self._exchanges = list()
+        self._currencies = dict()
+        self._data = np.zeros((0, 0), dtype=np.float64)
+
+    @property
+    def accounts(self):
+        """Accounts names list (rows order)."""
+        return list(self._accounts)
+
+    @property
+    def exchanges(self):
+        """Accounts exchanges list (rows order)."""
+        return list(self._exchanges)
+
+    @property
+    def currencies(self):
+        """Currencies list (columns order)."""
+        return list(self._currencies)
+
+    @property
+    def balances(self):
+        """Balances totals matrix view, one row per account and one column per currency."""
+        view = self._data[:len(self._accounts), :len(self._currencies)]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def nbytes(self):
+        """Allocated balances matrix size in bytes."""
+        return self._data.nbytes
+
+    def _reserve(self, rows, columns):
+        """Make sure balances matrix capacity is at least (rows, columns) (grown geometrically)."""
+        capacity = self._data.shape
+        if rows <= capacity[0] and columns <= capacity[1]:
+            return
+        shape = tuple(c if n <= c else max(n, 2 * c, 16) for n, c in zip((rows, columns), capacity))
+        data = np.zeros(shape, dtype=np.float64)
+        data[:capacity[0], :capacity[1]] = self._data
+        self._data = data
+
+    def add(self, account, wallet, exchange=None):
+        """Add (or replace) an account wallet.
+
+        :param str account: account name.
+        :param wallet: account balances as Wallet or {currency: total} dict.
+        :type wallet: Wallet or dict
+        :param str exchange: account exchange name.
+        """
+        totals = {str(c).upper(): float(b) for c, b in wallet.items()}
+        for currency in totals:
+            if currency not in self._currencies:
+                self._currencies[currency] = len(self._currencies)
+        row = self._accounts.get(account)
+        if row is None:
+            row = self._accounts[account] = len(self._accounts)
+            self._exchanges.append(exchange)
+        elif exchange is not None:
+            self._exchanges[row] = exchange
+        self._reserve(len(self._accounts), len(self._currencies))
+        self._data[row] = 0.0
+        columns = [self._currencies[c] for c in totals]
+        self._data[row, columns] = list(totals.values())
+
+    def update(self, account, balances):
+        """Update some account currencies totals (other ones are kept).
+
+        :param str account: account name.
+        :param dict balances: {currency: total} dict (or a Wallet).
+        """
+        totals = {c: float(b) for c, b in zip(self.currencies, self.balances[self._accounts[account]].tolist()) if b}
+        totals.update({str(c).upper(): float(b) for c, b in balances.items()})
+        self.add(account, totals)
+
+    def snapshot(self, quotes=None, max_age=None):
+        """Take a price snapshot for all portfolio currencies (each one priced once).
+
+        :param quotes: quote currencies (default BTC, USD and EUR).
+        :type quotes: tp.Iterable[str]
+        :param float max_age: cached prices older than "max_age" secs are requested again.
+        :return PriceSnapshot: new snapshot.
+        """
+        return PriceSnapshot.take(self.currencies, quotes, max_age=max_age)
+
+    def valuate(self, quotes=None, snapshot=None, max_age=None):
+        """Value all accounts in all "quotes" from a single price snapshot.
+
+        :param quotes: quote currencies (default BTC, USD and EUR).
+        :type quotes: tp.Iterable[str]
+        :param PriceSnapshot snapshot: prices to use (a new one is taken if None).
+        :param float max_age: max cached prices age in secs when a new snapshot is taken.
+        :return PortfolioValuation: portfolio valuation.
+        """
+        quotes = [str(q).upper() for q in quotes or ('BTC', 'USD', 'EUR')]
+        quotes = sorted(set(quotes), key=quotes.index)
+        snapshot = snapshot or self.snapshot(quotes, max_age)
+        prices = dict()
+        for q in quotes:
+            supported = _quote(q)
+            prices[q] = np.array([1.0 if _at_par(c, supported) else snapshot.price(c, supported) or np.nan
+                                  for c in self._currencies], dtype=np.float64)
+        return PortfolioValuation(self, prices, snapshot)
+
+    def __contains__(self, account):
+        return account in self._accounts
+
+    def __len__(self):
+        return len(self._accounts)
+
+    def __repr__(self):
+        return f'{type(self).__name__}(accounts: {len(self)}, currencies: {len(self._currencies)})'
+
+
+class PortfolioValuation:
+    """Portfolio values in many quote currencies (see "Portfolio.valuate").
+
+    Values are computed on demand as vectorised balances matrix and price vector products. Currencies without price
+    are excluded from totals and reported by "missing".
+    """
+
+    def __init__(self, portfolio, prices, snapshot):
+        """PortfolioValuation constructor.
+
+        :param Portfolio portfolio: valued portfolio.
+        :param dict prices: {quote: price vector (one price per portfolio currency)} dict.
+        :param PriceSnapshot snapshot: snapshot prices come from.
+        """
+        self.snapshot = snapshot
+        self.quotes = list(prices)
+        self._accounts = portfolio.accounts
+        self._exchanges = portfolio.exchanges
+        self._currencies = portfolio.currencies
+        self._balances = portfolio.balances.copy()
+        self._prices = prices
+
+    @staticmethod
+    def _round(quote, values):
+        """Round values as "Balance.value" does."""
+        return np.round(values, 8 if _quote(quote) == 'BTC' else 5).tolist()
+
+    def values(self, quote):
+        """Return (accounts, currencies) values matrix in "quote" currency (NaN where no price is available).
+
+        :param str quote: one of valuation quotes.
+        :return np.ndarray: values matrix.
+        """
+        return self._balances * self._prices[str(quote).upper()]
+
+    def _sums(self, quote, axis):
+        return np.nansum(self.values(quote), axis=axis)
+
+    @property
+    def totals(self):
+        """Portfolio total value as {quote: total} dict."""
+        return {q: self._round(q, self._sums(q, None)) for q in self.quotes}
+
+    def accounts(self, quote):
+        """Accounts total value in "quote" currency as {account: value} dict."""
+        return dict(zip(self._accounts, self._round(quote, self._sums(quote, 1))))
+
+    def currencies(self, quote):
+        """Whole portfolio exposure per currency in "quote" currency as {currency: value} dict."""
+        return dict(zip(self._currencies, self._round(quote, self._sums(quote, 0))))
+
+    def exchanges(self, quote):
+        """Exchanges total value in "quote" currency as {exchange: value} dict."""
+        names = sorted(set(self._exchanges), key=self._exchanges.index)
+        groups = np.array([names.index(e) for e in self._exchanges], dtype=np.intp)
+        sums = np.bincount(groups, weights=self._sums(quote, 1), minlength=len(names))
+        return dict(zip(names, self._round(quote, sums)))
+
+    @property
+    def missing(self):
+        """Currencies without price as {quote: currencies} dict (quotes without missing prices are not included)."""
+        return {q: [c for c, p in zip(self._currencies, prices.tolist()) if math.isnan(p)]
+                for q, prices in self._prices.items() if np.isnan(prices).any()}
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+"""CCTF
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - License:     UNLICENSE
+"""
+import collections as col
+import heapq
+import itertools
+import threading
+import time
+import urllib.parse as urlparse
+
+__all__ = ['TokenBucket', 'RateLimiter', 'RateLimitTimeout', 'RATE_LIMITER', 'HIGH', 'NORMAL', 'LOW']
+
+# priority lanes (lower value is served first): orders, prices and metadata requests
+HIGH = 0
+NORMAL = 1
+LOW = 2
+
+# default per host budget (requests per second and burst size)
+_HOST_RATE = 10.0
+_HOST_BURST = 10
+
+
+class RateLimitTimeout(Exception):
+    """Raised when a request slot is not granted before the supplied timeout."""
+
+
+class TokenBucket:
+    """Token bucket: "rate" tokens per second are added up to "capacity" (max burst size).
+
+    >>> bucket = TokenBucket(rate=10, capacity=2)
+    >>> bucket.try_acquire(), bucket.try_acquire(), bucket.try_acquire()
+    (True, True, False)
+    >>> 0.05 < bucket.delay() <= 0.1
+    True
+
+    """
+
+    def __init__(self, rate, capacity=1):
+        """TokenBucket constructor.
+
+        :param float rate: tokens added per second (None or zero means no limit).
+        :param int capacity: max number of stored tokens (burst size).
+        """
+        self.rate = float(rate or 0.0)
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay(self, tokens=1):
+        """Secs until "tokens" are available (0.0 if they already are).
+
+        :param float tokens: needed tokens.
+        :return float: secs to wait.
+        """
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            self._refill()
+            return max(0.0, (tokens - self._tokens) / self.rate)
+
+    def try_acquire(self, tokens=1):
+        """Take "tokens" if available.
+
+        :param float tokens: needed tokens.
+        :return bool: True if tokens were taken.
+        """
+        if not self.rate:
+            return True
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens=1, timeout=None):
+        """Wait until "tokens" are available and take them.
+
+        :param float tokens: needed tokens.
+        :param float timeout: max secs to wait (default no limit).
+        :return float: waited secs.
+        :raise RateLimitTimeout: if tokens are not available before "timeout".
+        """
+        started = time.monotonic()
+        if self.try_acquire(tokens):
+            return 0.0
+        while not self.try_acquire(tokens):
+            delay = self.delay(tokens)
+            if timeout is not None and time.monotonic() - started + delay > timeout:
+                raise RateLimitTimeout(f'No rate limit slot available in {timeout} secs.')
+            time.sleep(delay)
+        return time.monotonic() - started
+
+    def __repr__(self):
+        return f'{type(self).__name__}(rate: {self.rate}/s, capacity: {self.capacity:.0f})'
+
+
+class RateLimiter:
+    """Request scheduler sharing per host and per endpoint token buckets among all threads.
+
+    Every request needs a token from its host bucket and, if its URL starts with a configured endpoint prefix, from
+    that endpoint bucket too. Waiting requests are granted in priority order (HIGH before NORMAL before LOW) and in
+    arrival order within the same priority, but a request never waits behind requests blocked on a bucket it does not
+    use (like another endpoint of the same host that ran out of tokens).
+
+    >>> limiter = RateLimiter(rate=100, burst=1)
+    >>> limiter.configure_endpoint('https://api.example.com/orders', rate=1000, burst=5)
+    >>> limiter.acquire('https://api.example.com/orders?id=1', priority=HIGH)
+    0.0
+    >>> limiter.acquire('https://api.example.com/coins', priority=LOW) > 0.0
+    True
+    >>> stats = limiter.stats
+    >>> stats['requests'], stats['throttled'], stats['lanes']
+    (2, 1, {'HIGH': 1, 'LOW': 1})
+    >>> limiter = RateLimiter(rate=1000, burst=10)
+    >>> limiter.configure_endpoint('https://api.example.com/orders', rate=2, burst=1)
+    >>> limiter.acquire('https://api.example.com/orders')
+    0.0
+    >>> blocked = threading.Thread(target=limiter.acquire, args=('https://api.example.com/orders', HIGH))
+    >>> blocked.start(), time.sleep(0.05)
+    (None, None)
+    >>> limiter.acquire('https://api.example.com/coins', LOW) < 0.1
+    True
+    >>> blocked.join()
+
+    """
+
+    _LANES = {HIGH: 'HIGH', NORMAL: 'NORMAL', LOW: 'LOW'}
+
+    def __init__(self, rate=_HOST_RATE, burst=_HOST_BURST):
+        """RateLimiter constructor.
+
+        :param float rate: default requests per second per host (None or zero disables host limits).
+        :param int burst: default host burst size.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._hosts = dict()
+        self._host_settings = dict()
+        self._endpoints = dict()
+        self._waiting = col.defaultdict(list)
+        self._tickets = dict()
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._stats = col.Counter()
+        self._lanes = col.Counter()
+        self._waits = col.Counter()
+
+    def configure(self, rate=None, burst=None):
+        """Change default host budget (already created host buckets are replaced).
+
+        :param float rate: requests per second per host.
+        :param int burst: host burst size.
+        """
+        with self._cond:
+            self.rate = self.rate if rate is None else rate
+            self.burst = self.burst if burst is None else burst
+            self._hosts = {h: b for h, b in self._hosts.items() if h in self._host_settings}
+
+    def configure_host(self, host, rate, burst=1):
+        """Set "host" specific budget.
+
+        :param str host: host name (or URL).
+        :param float rate: requests per second.
+        :param int burst: burst size.
+        """
+        host = urlparse.urlsplit(host).netloc or host
+        with self._cond:
+            self._host_settings[host] = (rate, burst)
+            self._hosts[host] = TokenBucket(rate, burst)
+
+    def configure_endpoint(self, prefix, rate, burst=1):
+        """Set a budget for URLs starting with "prefix" (on top of their host budget).
+
+        :param str prefix: URL prefix (scheme, host and path).
+        :param float rate: requests per second.
+        :param int burst: burst size.
+        """
+        with self._cond:
+            self._endpoints[prefix] = TokenBucket(rate, burst)
+
+    def configure_exchange(self, info, rate=None, burst=1):
+        """Set an exchange budget from its description ("rateLimit" is min ms between requests).
+
+        ccxt sends its requests itself (to one or more API hosts), so exchange calls are scheduled under a single
+        "ccxt://<exchange id>" key whose budget is shared by all of them.
+
+        >>> limiter = RateLimiter()
+        >>> class Info:
+        ...     id, rate_limit = 'binance', 500
+        >>> url = limiter.configure_exchange(Info())
+        >>> url, limiter.acquire(url), limiter.acquire(url) > 0.4
+        ('ccxt://binance', 0.0, True)
+
+        :param ExchangeInfo info: exchange description.
+        :param float rate: requests per second (default from "rateLimit", no limit if it is not set either).
+        :param int burst: burst size.
+        :return str: key URL to pass to "acquire" for this exchange calls.
+        """
+        url = f'ccxt://{info.id}'
+        rate_limit = getattr(info, 'rate_limit', None)
+        self.configure_host(url, rate or (1000.0 / rate_limit if rate_limit else None), burst)
+        return url
+
+    def _buckets(self, url):
+        """Return (key, bucket) pairs "url" needs a token from."""
+        host = urlparse.urlsplit(url).netloc
+        bucket = self._hosts.get(host)
+        if bucket is None:
+            bucket = self._hosts[host] = TokenBucket(self.rate, self.burst)
+        buckets = [(host, bucket)]
+        buckets.extend((p, b) for p, b in self._endpoints.items() if url.startswith(p))
+        return buckets
+
+    def acquire(self, url, priority=NORMAL, timeout=None):
+        """Wait for "url" turn (all its buckets must have a token and no higher priority request may be waiting).
+
+        :param str url: request URL.
+        :param int priority: request lane (HIGH, NORMAL or LOW).
+        :param float timeout: max secs to wait (default no limit).
+        :return float: waited secs.
+        :raise RateLimitTimeout: if no slot is granted before "timeout".
+        """
+        started = time.monotonic()
+        with self._cond:
+            buckets = self._buckets(url)
+            ticket = (priority, next(self._counter))
+            throttled = False
+            self._tickets[ticket] = buckets
+            for key, _ in buckets:
+                heapq.heappush(self._waiting[key], ticket)
+            try:
+                while True:
+                    first = self._first(ticket, buckets)
+                    delay = max(b.delay() for _, b in buckets)
+                    if first and not delay:
+                        for _, bucket in buckets:
+                            bucket.try_acquire()
+                        break
+                    elapsed = time.monotonic() - started
+                    if timeout is not None and elapsed >= timeout:
+                        raise RateLimitTimeout(f'No rate limit slot available for {url} in {timeout} secs.')
+                    wait = delay if first else None
+                    if timeout is not None:
+                        wait = min(wait or timeout, timeout - elapsed)
+                    throttled = True
+                    self._cond.wait(wait)
+            finally:
+                del self._tickets[ticket]
+                for key, _ in buckets:
+                    self._waiting[key].remove(ticket)
+                    heapq.heapify(self._waiting[key])
+                self._cond.notify_all()
+            waited = time.monotonic() - started if throttled else 0.0
+            self._stats['requests'] += 1
+            self._stats['throttled'] += throttled
+            self._lanes[self._LANES.get(priority, str(priority))] += 1
+            self._waits[buckets[0][0]] += waited
+            self._stats['max_wait'] = max(self._stats['max_wait'], waited)
+            return waited
+
+    def _first(self, ticket, buckets):
+        """Return True if "ticket" is next in all its buckets queues.
+
+        Tickets ahead of it blocked on a bucket "ticket" does not use (one without tokens) are skipped.
+        """
+        keys = {key for key, _ in buckets}
+        for key in keys:
+            for other in self._waiting[key]:
+                if other < ticket and not any(b.delay() for k, b in self._tickets[other] if k not in keys):
+                    return False
+        return True
+
+    @property
+    def stats(self):
+        """Scheduler metrics: requests, throttled requests, max wait secs, requests per lane and wait secs per host."""
+        with self._cond:
+            return dict(requests=self._stats['requests'], throttled=self._stats['throttled'],
+                        max_wait=self._stats['max_wait'], lanes=dict(self._lanes), waits=dict(self._waits))
+
+    def reset_stats(self):
+        """Reset metrics counters."""
+        with self._cond:
+            self._stats.clear()
+            self._lanes.clear()
+            self._waits.clear()
+
+
+RATE_LIMITER = RateLimiter()
@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+"""CCTF
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - License:     UNLICENSE
+"""
+import email.utils as eut
+import random
+import sys
+import threading
+import time
+import urllib.parse as urlparse
+
+import requests
+
+from cctf.ratelimit import RateLimitTimeout
+from cctf.session import SESSIONS
+
+__all__ = ['Backoff', 'CircuitBreaker', 'CircuitOpenError', 'Attempts', 'CIRCUIT_BREAKERS', 'retry_after']
+
+# HTTP status codes worth retrying besides 5xx ones (any other HTTP error is returned to caller right away)
+_RETRY_STATUS = {408, 425, 429}
+# 5xx status codes not worth retrying (server does not support the request at all)
+_NO_RETRY_STATUS = {501}
+
+# default backoff base and cap secs, and whole request (all attempts) deadline secs
+_BACKOFF_BASE = 0.5
+_BACKOFF_CAP = 15.0
+_DEADLINE = 60.0
+
+# consecutive failures before a host circuit is opened and secs before a trial request is allowed again
+_BREAKER_THRESHOLD = 5
+_BREAKER_RESET = 30.0
+
+
+def _retryable(status):
+    """Return True if an HTTP "status" code response is worth retrying.
+
+    >>> [_retryable(s) for s in (404, 429, 500, 501, 505, 522)]
+    [False, True, True, False, True, True]
+
+    :param int status: HTTP status code.
+    :return bool: True if request should be retried.
+    """
+    return status in _RETRY_STATUS or (500 <= status < 600 and status not in _NO_RETRY_STATUS)
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised when a request is refused because its host circuit is open."""
+
+
+class Backoff:
+    """Capped exponential backoff with "full jitter" (delays are uniformly drawn between 0 and the capped value).
+
+    >>> backoff = Backoff(base=0.5, cap=4.0, jitter=False)
+    >>> [backoff.delay(n) for n in range(5)]
+    [0.5, 1.0, 2.0, 4.0, 4.0]
+    >>> 0.0 <= Backoff(base=0.5, cap=4.0).delay(10) <= 4.0
+    True
+
+    """
+
+    def __init__(self, base=_BACKOFF_BASE, cap=_BACKOFF_CAP, factor=2.0, jitter=True):
+        """Backoff constructor.
+
+        :param float base: first retry max delay in secs.
+        :param float cap: max delay in secs.
+        :param float factor: delay growth factor per attempt.
+        :param bool jitter: if True delays are randomized (avoids clients retrying in lockstep).
+        """
+        self.base = float(base)
+        self.cap = float(cap)
+        self.factor = float(factor)
+        self.jitter = bool(jitter)
+
+    def delay(self, attempt):
+        """Delay in secs before retry number "attempt" (0 based).
+
+        :param int attempt: failed attempts count minus one.
+        :return float: secs to wait.
+        """
+        delay = min(self.cap, self.base * self.factor ** min(attempt, 64))
+        return random.uniform(0.0, delay) if self.jitter else delay
+
+
+class CircuitBreaker:
+    """Host circuit breaker.
+
+    After "threshold" consecutive failures circuit is opened and requests are refused for "reset_timeout" secs, then
+    a single trial request is allowed ("half-open" state): circuit is closed again if it succeeds and re-opened
+    otherwise.
+
+    >>> breaker = CircuitBreaker(threshold=2, reset_timeout=0.05)
+    >>> breaker.failure(), breaker.failure(), breaker.state, breaker.allow()
+    (None, None, 'open', False)
+    >>> time.sleep(0.05)
+    >>> breaker.allow(), breaker.allow(), breaker.state
+    (True, False, 'half-open')
+    >>> breaker.success(), breaker.state
+    (None, 'closed')
+
+    A trial request given up before its outcome is known must "release" its slot, so a new trial can be made:
+
+    >>> breaker.failure(), breaker.failure(), time.sleep(0.05), breaker.enter(), breaker.allow()
+    (None, None, None, True, False)
+    >>> breaker.release(), breaker.allow()
+    (None, True)
+
+    """
+
+    def __init__(self, threshold=_BREAKER_THRESHOLD, reset_timeout=_BREAKER_RESET):
+        """CircuitBreaker constructor.
+
+        :param int threshold: consecutive failures opening circuit.
+        :param float reset_timeout: secs circuit stays open before a trial request.
+        """
+        self.threshold = max(1, int(threshold))
+        self.reset_timeout = float(reset_timeout)
+        self.failures = 0
+        self._opened = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """Circuit state: "closed", "open" or "half-open"."""
+        if self._opened is None:
+            return 'closed'
+        return 'half-open' if self._trial or time.monotonic() - self._opened >= self.reset_timeout else 'open'
+
+    def allow(self):
+        """Return True if a request can be sent now (only one trial request is allowed while "half-open")."""
+        return self.enter() is not None
+
+    def enter(self):
+        """Request permission to send a request.
+
+        :return bool: None if request is refused, True if it is the "half-open" trial request, False otherwise.
+        """
+        with self._lock:
+            if self._opened is None:
+                return False
+            if self._trial or time.monotonic() - self._opened < self.reset_timeout:
+                return None
+            self._trial = True
+            return True
+
+    def release(self):
+        """Give back trial request slot without recording any outcome (circuit state is unchanged)."""
+        with self._lock:
+            self._trial = False
+
+    def success(self):
+        """Record a successful request (circuit is closed)."""
+        with self._lock:
+            self.failures = 0
+            self._opened = None
+            self._trial = False
+
+    def failure(self):
+        """Record a failed request (circuit is opened on threshold and after a failed trial request)."""
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.threshold:
+                self._opened = time.monotonic()
+                self._trial = False
+
+    def __repr__(self):
+        return f'{type(self).__name__}(state: {self.state}, failures: {self.failures})'
+
+
+class _Breakers(dict):
+    """Per host CircuitBreaker registry (created on first use)."""
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def __missing__(self, host):
+        with self._lock:
+            return self.setdefault(host, CircuitBreaker())
+
+    def get_for(self, url):
+        """Return "url" host circuit breaker.
+
+        :param str url: request URL.
+        :return CircuitBreaker: host circuit breaker.
+        """
+        return self[urlparse.urlsplit(url).netloc]
+
+
+CIRCUIT_BREAKERS = _Breakers()
+
+
+def retry_after(response):
+    """Return response "Retry-After" header value in secs (or None if missing or invalid).
+
+    >>> class Response:
+    ...     headers = {'Retry-After': '3'}
+    >>> retry_after(Response())
+    3.0
+    >>> Response.headers['Retry-After'] = 'Wed, 21 Oct 2015 07:28:00 GMT'
+    >>> retry_after(Response())
+    0.0
+    >>> retry_after(None) is None
+    True
+
+    :param requests.Response response: HTTP response.
+    :return float: secs to wait.
+    """
+    value = getattr(response, 'headers', None) and response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, eut.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class Attempts:
+    """Single request retries state: attempts count, backoff, deadline and host circuit breaker.
+
+    Used by sync and async "get_url" versions, which just sleep the returned delays their own way:
+
+    >>> attempts = Attempts('https://example.com/data', retries=2, backoff=Backoff(jitter=False), verbose=False)
+    >>> attempts.start(), attempts.failed(requests.ConnectionError('down'))
+    (True, 0.5)
+    >>> attempts.start(), attempts.failed(requests.ConnectionError('down'))
+    (True, None)
+    >>> attempts.start()
+    False
+
+    Callers must "close" it when done (on any exit path), so an unfinished trial request never keeps its host circuit
+    "half-open" forever.
+
+    """
+
+    def __init__(self, url, retries=3, backoff=None, deadline=_DEADLINE, timeout=None, verbose=True, breaker=None):
+        """Attempts constructor.
+
+        :param str url: request URL.
+        :param int retries: max attempts (no limit if negative, "deadline" still applies).
+        :param Backoff backoff: delays between attempts (default capped exponential backoff with jitter).
+        :param float deadline: max secs for all attempts including waits (None means no deadline).
+        :param timeout: per attempt timeout in secs as float or (connect, read) tuple (default is pool timeout).
+        :type timeout: float or tuple
+        :param bool verbose: if True failures will be reported to stderr.
+        :param CircuitBreaker breaker: host circuit breaker (default from CIRCUIT_BREAKERS).
+        """
+        self.url = url
+        self.retries = int(retries)
+        self.backoff = backoff or Backoff()
+        self.verbose = verbose
+        self.attempt = 0
+        self.breaker = breaker or CIRCUIT_BREAKERS.get_for(url)
+        self._timeout = timeout
+        self._deadline = None if deadline is None else time.monotonic() + float(deadline)
+        self._done = False
+        self._trial = False
+
+    @property
+    def remaining(self):
+        """Secs until deadline (None if there is no deadline)."""
+        return None if self._deadline is None else max(0.0, self._deadline - time.monotonic())
+
+    @property
+    def timeout(self):
+        """Next attempt timeout (request timeout, default is pool timeout, capped by remaining secs until deadline)."""
+        timeout = SESSIONS.timeout if self._timeout is None else self._timeout
+        remaining = self.remaining
+        if remaining is None or timeout is None:
+            return timeout if remaining is None else remaining
+        if isinstance(timeout, (tuple, list)):
+            return tuple(min(t, remaining) for t in timeout)
+        return min(timeout, remaining)
+
+    def _report(self, message):
+        if self.verbose:
+            print(f'{message} ({self.url})', file=sys.stderr)
+
+    def start(self):
+        """Return True if a new attempt can be made (attempts left, deadline not reached and host circuit closed)."""
+        if self._done or (0 <= self.retries <= self.attempt) or self.remaining == 0.0:
+            return False
+        trial = self.breaker.enter()
+        if trial is None:
+            self._report(str(CircuitOpenError(f'Circuit open for {urlparse.urlsplit(self.url).netloc}')))
+            return False
+        self._trial = trial
+        self.attempt += 1
+        return True
+
+    def succeeded(self):
+        """Record a successful attempt."""
+        self._trial = False
+        self.breaker.success()
+        self._done = True
+
+    def close(self):
+        """Stop attempts, releasing host circuit trial slot if last attempt outcome was never recorded."""
+        if self._trial:
+            self._trial = False
+            self.breaker.release()
+        self._done = True
+
+    def failed(self, err):
+        """Record a failed attempt and return secs to wait before next one (None if request must be given up).
+
+        Connection errors, timeouts, invalid JSON bodies and HTTP 408, 425, 429 and 5xx (but 501) responses are
+        retried, while other HTTP errors are returned right away (without counting as host failures). Delay is the
+        larger of backoff and server "Retry-After" header values.
+
+        :param Exception err: attempt error.
+        :return float: secs to wait or None.
+        """
+        response = getattr(err, 'response', None)
+        status = getattr(response, 'status_code', None)
+        if isinstance(err, RateLimitTimeout):
+            # request was never sent: no outcome to record
+            self.close()
+            retry = False
+        elif status is not None and not _retryable(status):
+            self.breaker.success()
+            retry = False
+        else:
+            self.breaker.failure()
+            retry = True
+        self._trial = False
+        self._report(f'{type(err).__name__}: {err}')
+        if not retry or (0 <= self.retries <= self.attempt):
+            self._done = True
+            return None
+        delay = max(self.backoff.delay(self.attempt - 1), retry_after(response) or 0.0)
+        remaining = self.remaining
+        if remaining is not None and delay >= remaining:
+            self._report(f'Giving up, next retry in {delay:.1f} secs would exceed deadline')
+            self._done = True
+            return None
+        self._report(f' - Retrying in {delay:.1f} secs')
+        return delay
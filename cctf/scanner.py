@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""CCTF
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - License:     UNLICENSE
+"""
+import argparse
+import collections as col
+import concurrent.futures as cf
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from cctf.market import ExchangeInfo
+from cctf.ratelimit import RATE_LIMITER, NORMAL, LOW
+
+__all__ = ['ScanRow', 'VolumeScanner', 'Renderer', 'main']
+
+ScanRow = col.namedtuple('ScanRow', ['symbol', 'volume', 'delta'])
+ScanRow.__doc__ = """Scanner result row: symbol, last candle quote volume and its change since previous round."""
+
+# stable coins excluded from scans
+_EXCLUDE = ('PAX', 'USDC', 'TUSD')
+
+
+class VolumeScanner:
+    """Quote volume scanner over all symbols traded against a base market (requires numpy).
+
+    Each round fetches last candles of all selected symbols concurrently (honoring a max requests per second budget)
+    and returns symbols whose last candle quote volume (volume * close) is over "min_timeframe_volume", sorted by it,
+    together with their change since previous round.
+
+    "exchange" can be any object providing ccxt like "load_markets", "fetch_tickers" and "fetch_ohlcv" methods (a ccxt
+    exchange instance or a "cctf.exchange" adapter like "FakeExchange").
+
+    >>> class FakeExchange:
+    ...     rateLimit = 0
+    ...     volumes = {'ETH/BTC': 10.0, 'XRP/BTC': 2.5, 'ETH/USDT': 5.0}
+    ...     def load_markets(self):
+    ...         return {s: dict(symbol=s) for s in self.volumes}
+    ...     def fetch_tickers(self, symbols=None):
+    ...         return {s: dict(symbol=s, quoteVolume=100.0) for s in symbols}
+    ...     def fetch_ohlcv(self, symbol, timeframe='1m', limit=None):
+    ...         self.volumes[symbol] += 1.0
+    ...         return [[0, 1.0, 1.0, 1.0, 0.5, self.volumes[symbol]]]
+    >>> scanner = VolumeScanner(FakeExchange(), base_market='BTC', min_timeframe_volume=2.0)
+    >>> scanner.scan()
+    [ScanRow(symbol='ETH/BTC', volume=5.5, delta=0.0)]
+    >>> scanner.scan()
+    [ScanRow(symbol='ETH/BTC', volume=6.0, delta=0.5), ScanRow(symbol='XRP/BTC', volume=2.25, delta=0.0)]
+
+    """
+
+    def __init__(self, exchange, base_market='BTC', timeframe='1m', min_timeframe_volume=0.01, min_ticker_volume=1.0,
+                 rate=None, workers=8, exclude=_EXCLUDE):
+        """VolumeScanner constructor.
+
+        :param exchange: ccxt like exchange instance.
+        :param str base_market: quote currency of scanned symbols.
+        :param str timeframe: candles timeframe.
+        :param float min_timeframe_volume: min last candle quote volume.
+        :param float min_ticker_volume: min 24h ticker quote volume for a symbol to be scanned.
+        :param float rate: max requests per second (default from exchange "rateLimit" ms if any, otherwise no limit),
+            the exchange budget is shared through "RATE_LIMITER".
+        :param int workers: max concurrent requests.
+        :param exclude: base currencies not to be scanned.
+        :type exclude: tp.Iterable[str]
+        """
+        if np is None:
+            raise ImportError('numpy is required by VolumeScanner.')
+        self.exchange = exchange
+        self.base_market = str(base_market).upper()
+        self.timeframe = timeframe
+        self.min_timeframe_volume = float(min_timeframe_volume)
+        self.min_ticker_volume = float(min_ticker_volume)
+        info = ExchangeInfo(id=getattr(exchange, 'id', None) or type(exchange).__name__.lower(),
+                            rateLimit=getattr(exchange, 'rateLimit', None))
+        limiter = getattr(exchange, 'limiter', None)
+        self._url = (limiter or RATE_LIMITER).configure_exchange(info, rate)
+        # adapters like "CcxtExchange" schedule their own calls, other exchanges calls are scheduled here
+        self._limiter = RATE_LIMITER if limiter is None else None
+        self._executor = cf.ThreadPoolExecutor(max(1, int(workers)), thread_name_prefix='cctf-scanner')
+        self.exclude = set(exclude or ())
+        self._symbols = None
+        self._previous = dict()
+
+    @property
+    def symbols(self):
+        """Scanned symbols (loaded on first use)."""
+        if self._symbols is None:
+            self._symbols = self.load_symbols()
+        return self._symbols
+
+    def load_symbols(self):
+        """Select symbols traded against "base_market" with enough 24h volume.
+
+        :return list: selected symbols.
+        """
+        self._acquire(LOW)
+        markets = self.exchange.load_markets()
+        symbols = [s for s in markets if s.endswith('/' + self.base_market) and s.split('/')[0] not in self.exclude]
+        if self.min_ticker_volume > 0.0 and symbols:
+            self._acquire(NORMAL)
+            tickers = self.exchange.fetch_tickers(symbols)
+            volumes = {s: (tickers.get(s) or dict()).get('quoteVolume') or 0.0 for s in symbols}
+            symbols = [s for s in symbols if volumes[s] > self.min_ticker_volume]
+        return symbols
+
+    def _acquire(self, priority):
+        """Wait for next exchange call turn (unless exchange schedules its own calls)."""
+        if self._limiter is not None:
+            self._limiter.acquire(self._url, priority)
+
+    def _last_candle(self, symbol):
+        """Return symbol last candle (or None if it could not be fetched)."""
+        self._acquire(NORMAL)
+        try:
+            candles = self.exchange.fetch_ohlcv(symbol, timeframe=self.timeframe, limit=5)
+        except Exception as err:
+            print(f' - {symbol}: {err}', file=sys.stderr)
+            return None
+        return candles[-1] if candles else None
+
+    def scan(self):
+        """Run a scan round.
+
+        :return list: ScanRow list sorted by volume (descending order).
+        """
+        symbols = self.symbols
+        candles = list(self._executor.map(self._last_candle, symbols))
+        symbols = [s for s, c in zip(symbols, candles) if c is not None]
+        if not symbols:
+            return list()
+        candles = np.array([c for c in candles if c is not None], dtype=np.float64)
+        volumes = candles[:, 5] * candles[:, 4]
+        selected = np.flatnonzero(volumes > self.min_timeframe_volume)
+        selected = selected[np.argsort(-volumes[selected], kind='stable')]
+        symbols = [symbols[i] for i in selected.tolist()]
+        volumes = volumes[selected]
+        previous = np.array([self._previous.get(s, np.nan) for s in symbols], dtype=np.float64)
+        deltas = np.where(np.isnan(previous), 0.0, volumes - previous)
+        self._previous = dict(zip(symbols, volumes.tolist()))
+        return [ScanRow(*row) for row in zip(symbols, volumes.tolist(), deltas.tolist())]
+
+    def run(self, interval=5.0, rounds=None, renderer=None):
+        """Scan forever (or "rounds" times) waiting "interval" secs between rounds.
+
+        :param float interval: secs between rounds.
+        :param int rounds: number of rounds (default no limit).
+        :param Renderer renderer: results renderer (default stdout one).
+        """
+        renderer = renderer or Renderer()
+        count = 0
+        while rounds is None or count < rounds:
+            started = time.monotonic()
+            renderer.update(self.format(self.scan()))
+            count += 1
+            if rounds is None or count < rounds:
+                time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    def format(self, rows):
+        """Format scan rows as text lines (USD like quotes without decimals).
+
+        :param list rows: ScanRow list.
+        :return list: text lines.
+        """
+        fmt = ',.0f' if 'USD' in self.base_market else '.8f'
+        return [f' * {r.symbol:<10} -> {r.volume:>12{fmt}} {"(" + format(r.delta, "+" + fmt) + ")":>12}' for r in rows]
+
+    def close(self):
+        """Shutdown scanner thread pool."""
+        self._executor.shutdown(wait=False)
+
+
+class Renderer:
+    """Incremental text renderer: on terminals only changed lines are rewritten (plain output otherwise)."""
+
+    def __init__(self, stream=None):
+        """Renderer constructor.
+
+        :param stream: output text stream (default stdout).
+        """
+        self.stream = stream or sys.stdout
+        self.interactive = hasattr(self.stream, 'isatty') and self.stream.isatty()
+        self._lines = list()
+
+    def update(self, lines):
+        """Render "lines" replacing previous ones.
+
+        :param list lines: text lines.
+        """
+        if not self.interactive:
+            self.stream.write('\n'.join(lines) + '\n\n')
+        else:
+            if not self._lines:
+                self.stream.write('\x1b[2J')
+            output = list()
+            for i in range(max(len(lines), len(self._lines))):
+                line = lines[i] if i < len(lines) else ''
+                if i >= len(self._lines) or self._lines[i] != line:
+                    output.append(f'\x1b[{i + 1};1H\x1b[2K{line}')
+            output.append(f'\x1b[{len(lines) + 1};1H')
+            self.stream.write(''.join(output))
+        self.stream.flush()
+        self._lines = list(lines)
+
+
+def main(argv=None):
+    """Volume scanner command line entry point (requires ccxt).
+
+    :param list argv: command line args (default sys.argv[1:]).
+    """
+    parser = argparse.ArgumentParser(description='Scan exchange symbols last candle quote volume.')
+    parser.add_argument('-e', '--exchange', default='binance', help='ccxt exchange id')
+    parser.add_argument('-b', '--base-market', default='BTC')
+    parser.add_argument('-T', '--timeframe', default='1m')
+    parser.add_argument('-m', '--min-timeframe-volume', type=float, default=0.01)
+    parser.add_argument('-t', '--min-ticker-volume', type=float, default=1.0)
+    parser.add_argument('-i', '--interval', type=float, default=5.0, help='secs between scans')
+    parser.add_argument('-r', '--rate', type=float, default=None, help='max requests per second')
+    parser.add_argument('-w', '--workers', type=int, default=8, help='max concurrent requests')
+    args = parser.parse_args(argv)
+
+    try:
+        import ccxt
+    except ImportError:
+        parser.error('ccxt is required by scanner command ("pip install ccxt").')
+    exchange = getattr(ccxt, args.exchange)(dict(timeout=15000, enableRateLimit=False))
+    scanner = VolumeScanner(exchange, args.base_market, args.timeframe, args.min_timeframe_volume,
+                            args.min_ticker_volume, args.rate, args.workers)
+    try:
+        scanner.run(args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scanner.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""CCTF
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - License:     UNLICENSE
+"""
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+__all__ = ['SessionPool', 'SESSIONS', 'configure', 'get_session']
+
+_POOL_HOSTS = 10
+_POOL_SIZE = 10
+_TIMEOUT = (5.0, 30.0)
+
+
+class SessionPool:
+    """Thread-safe, keep-alive HTTP session pool.
+
+    Every thread gets its own ``requests.Session`` (sessions are not safe to share between threads) but all of them
+    mount the same ``HTTPAdapter`` instances, so TCP+TLS connections are pooled and reused process wide.
+
+    >>> pool = SessionPool(hosts=4, per_host=2, timeout=3)
+    >>> pool.timeout
+    (3.0, 3.0)
+    >>> pool.get() is pool.get()
+    True
+    >>> pool.close()
+
+    """
+
+    def __init__(self, hosts=_POOL_HOSTS, per_host=_POOL_SIZE, timeout=_TIMEOUT, block=False, headers=None):
+        """SessionPool constructor.
+
+        :param int hosts: number of per host connection pools kept alive.
+        :param int per_host: max number of connections kept alive per host.
+        :param timeout: default request timeout in secs as float or (connect, read) tuple.
+        :type timeout: float or tuple
+        :param bool block: if True, no more than "per_host" concurrent connections will be opened to the same host.
+        :param dict headers: default headers sent with every request.
+        """
+        self.hosts = int(hosts)
+        self.per_host = int(per_host)
+        self.block = bool(block)
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._sessions = list()
+        self._adapter = self._new_adapter()
+
+    @property
+    def timeout(self):
+        """Default (connect, read) timeout tuple."""
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value):
+        """Timeout setter.
+
+        :param value: timeout in secs as float or (connect, read) tuple.
+        :type value: float or tuple
+        """
+        if isinstance(value, (tuple, list)):
+            connect, read = value
+        else:
+            connect = read = value
+        self._timeout = (float(connect), float(read))
+
+    def _new_adapter(self):
+        """Create the adapter shared by all thread sessions."""
+        return HTTPAdapter(pool_connections=self.hosts, pool_maxsize=self.per_host, pool_block=self.block)
+
+    def get(self):
+        """Return calling thread session (created on first use).
+
+        :return requests.Session: a session bound to the shared connection pool.
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            with self._lock:
+                session.mount('http://', self._adapter)
+                session.mount('https://', self._adapter)
+                self._sessions.append(session)
+            self._local.session = session
+        return session
+
+    def request(self, method, url, timeout=None, **kwargs):
+        """Send a request through calling thread session.
+
+        :param str method: HTTP method name.
+        :param str url: URL to request.
+        :param timeout: per request timeout, pool default is used if None.
+        :type timeout: float or tuple
+        :param kwargs: any other "requests.Session.request" keyword argument.
+        :return requests.Response: server response.
+        """
+        return self.get().request(method, url, timeout=timeout or self.timeout, **kwargs)
+
+    def configure(self, hosts=None, per_host=None, timeout=None, block=None, headers=None):
+        """Change pool settings.
+
+        Already opened connections are dropped and sessions will be lazily recreated using the new settings.
+
+        >>> pool = SessionPool()
+        >>> pool.configure(per_host=20, timeout=(2, 10))
+        >>> pool.per_host, pool.timeout
+        (20, (2.0, 10.0))
+
+        :param int hosts: number of per host connection pools kept alive.
+        :param int per_host: max number of connections kept alive per host.
+        :param timeout: default request timeout in secs as float or (connect, read) tuple.
+        :type timeout: float or tuple
+        :param bool block: if True, no more than "per_host" concurrent connections will be opened to the same host.
+        :param dict headers: default headers sent with every request.
+        """
+        with self._lock:
+            self.hosts = int(hosts or self.hosts)
+            self.per_host = int(per_host or self.per_host)
+            self.block = self.block if block is None else bool(block)
+            if timeout is not None:
+                self.timeout = timeout
+            if headers is not None:
+                self.headers = dict(headers)
+            self.close()
+
+    def close(self):
+        """Close all sessions and pooled connections."""
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions = list()
+            self._adapter.close()
+            self._adapter = self._new_adapter()
+            self._local = threading.local()
+
+
+SESSIONS = SessionPool()
+
+
+def get_session():
+    """Return calling thread session from the package wide pool.
+
+    :return requests.Session: a session bound to the package wide connection pool.
+    """
+    return SESSIONS.get()
+
+
+def configure(hosts=None, per_host=None, timeout=None, block=None):
+    """Change package wide pool settings (see "SessionPool.configure").
+
+    :param int hosts: number of per host connection pools kept alive.
+    :param int per_host: max number of connections kept alive per host.
+    :param timeout: default request timeout in secs as float or (connect, read) tuple.
+    :type timeout: float or tuple
+    :param bool block: if True, no more than "per_host" concurrent connections will be opened to the same host.
+    """
+    SESSIONS.configure(hosts=hosts, per_host=per_host, timeout=timeout, block=block)
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""CCTF
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - License:     UNLICENSE
+"""
+import mmap
+import os
+import pathlib as path
+import struct
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from cctf.ohlcv import OHLCV
+from cctf.symbol import _DATA_DIR
+
+__all__ = ['OHLCVStore', 'OHLCV_STORE']
+
+_MAGIC = b'CCTFOHL1'
+# magic, rows capacity, rows count (header is padded to 64 bytes so columns stay aligned)
+_HEADER = struct.Struct('<8sQQ')
+_HEADER_SIZE = 64
+_COUNT_OFFSET = 16
+_COLUMNS = len(OHLCV.COLUMNS)
+
+
+class _Segment:
+    """Fixed capacity segment file memory mapped (read-only or read-write).
+
+    File layout: header followed by one contiguous block per OHLCV column ("capacity" int64 dates first, then open,
+    high, low, close and volume as float64). Rows are written before count is updated, so readers only see complete
+    rows (except the last one, which may be rewritten in place while its candle is open).
+    """
+
+    def __init__(self, filename, writable=False):
+        self.filename = filename
+        with open(str(filename), 'r+b' if writable else 'rb') as fp:
+            self._mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        magic, self.capacity, _ = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or len(self._mm) < _HEADER_SIZE + _COLUMNS * 8 * self.capacity:
+            raise ValueError(f'{filename} is not a valid OHLCV segment file.')
+        self.columns = [np.frombuffer(self._mm, np.int64 if i == 0 else np.float64, self.capacity,
+                                      _HEADER_SIZE + i * 8 * self.capacity) for i in range(_COLUMNS)]
+
+    @staticmethod
+    def create(filename, capacity):
+        """Create an empty (sparse) segment file atomically."""
+        temp_file = filename.with_suffix('.{}.tmp'.format(os.getpid()))
+        with open(str(temp_file), 'wb') as fp:
+            fp.write(_HEADER.pack(_MAGIC, capacity, 0))
+            fp.truncate(_HEADER_SIZE + _COLUMNS * 8 * capacity)
+        os.replace(str(temp_file), str(filename))
+
+    @property
+    def count(self):
+        """Rows currently stored (read from file header on each call)."""
+        return struct.unpack_from('<Q', self._mm, _COUNT_OFFSET)[0]
+
+    @count.setter
+    def count(self, value):
+        struct.pack_into('<Q', self._mm, _COUNT_OFFSET, value)
+
+    def flush(self):
+        self._mm.flush()
+
+
+class OHLCVStore:
+    """Local OHLCV store made of per symbol and timeframe append-only memory mapped segments (requires numpy).
+
+    Candles are stored under "root/<BASE>_<QUOTE>/<timeframe>/" in fixed capacity segment files named after their
+    first candle timestamp, so file names are the time index and range queries only map the segments they need.
+    Reads are zero-copy when the range fits a single segment. Readers never lock, a single writer per series (in
+    any process) is enforced with a lock file.
+
+    >>> import tempfile
+    >>> store = OHLCVStore(tempfile.mkdtemp(), segment_rows=2)
+    >>> store.append('BTC/USDT', '1m', [[0, 1.0, 2.0, 0.5, 1.5, 10.0], [60000, 1.5, 3.0, 1.0, 2.0, 20.0],
+    ...                                 [120000, 2.0, 2.5, 1.5, 2.5, 30.0]])
+    3
+    >>> store.read('BTC/USDT', '1m', start=60000).close.tolist()
+    [2.0, 2.5]
+    >>> store.span('BTC/USDT', '1m'), store.series()
+    ((0, 120000), [('BTC/USDT', '1m')])
+
+    """
+
+    def __init__(self, root=None, segment_rows=65536):
+        """OHLCVStore constructor.
+
+        :param root: store directory (default "~/.local/cctf/ohlcv").
+        :type root: str or path.Path
+        :param int segment_rows: rows per segment file (only used when new segment files are created).
+        """
+        if np is None:
+            raise ImportError('numpy is required by OHLCVStore.')
+        self.root = path.Path(root) if root else _DATA_DIR.joinpath('ohlcv')
+        self.segment_rows = int(segment_rows)
+        self._segments = dict()
+        self._lock = threading.RLock()
+
+    def _dir(self, symbol, timeframe):
+        """Return series directory."""
+        return self.root.joinpath(str(symbol).upper().replace('/', '_'), str(timeframe))
+
+    def _index(self, symbol, timeframe):
+        """Return series segments as sorted (first timestamp, file name) list."""
+        directory = self._dir(symbol, timeframe)
+        if not directory.is_dir():
+            return list()
+        return sorted((int(f.stem), f) for f in directory.glob('*.seg'))
+
+    def _segment(self, filename, writable=False):
+        """Return (cached) mapped segment."""
+        key = (filename, writable)
+        with self._lock:
+            segment = self._segments.get(key)
+            if segment is None:
+                segment = self._segments[key] = _Segment(filename, writable)
+            return segment
+
+    def series(self):
+        """Return stored (symbol, timeframe) tuples.
+
+        :return list: stored series.
+        """
+        if not self.root.is_dir():
+            return list()
+        return sorted((d.name.replace('_', '/'), t.name) for d in self.root.iterdir() if d.is_dir()
+                      for t in d.iterdir() if t.is_dir() and any(t.glob('*.seg')))
+
+    def span(self, symbol, timeframe):
+        """Return first and last stored candle timestamps.
+
+        :param symbol: series symbol.
+        :type symbol: str or Symbol
+        :param str timeframe: series timeframe.
+        :return tuple: (first, last) ms timestamps or None if series is empty.
+        """
+        index = self._index(symbol, timeframe)
+        if not index:
+            return None
+        last = self._segment(index[-1][1])
+        count = last.count
+        if not count:
+            return None
+        return index[0][0], int(last.columns[0][count - 1])
+
+    def read(self, symbol, timeframe, start=None, end=None):
+        """Return candles opened from "start" (included) to "end" (excluded).
+
+        :param symbol: series symbol.
+        :type symbol: str or Symbol
+        :param str timeframe: series timeframe.
+        :param int start: start ms timestamp (default from the first candle).
+        :param int end: end ms timestamp (default up to the last candle).
+        :return OHLCV: read-only (memory mapped) candles if range fits in one segment, otherwise a copy.
+        """
+        index = self._index(symbol, timeframe)
+        pieces = list()
+        for i, (first, filename) in enumerate(index):
+            if end is not None and first >= end:
+                break
+            if start is not None and i + 1 < len(index) and index[i + 1][0] <= start:
+                continue
+            segment = self._segment(filename)
+            count = segment.count
+            dates = segment.columns[0][:count]
+            lo = 0 if start is None else int(np.searchsorted(dates, start, 'left'))
+            hi = count if end is None else int(np.searchsorted(dates, end, 'left'))
+            if lo < hi:
+                pieces.append([c[lo:hi] for c in segment.columns])
+        if not pieces:
+            return OHLCV([], [], [], [], [], [], timeframe=timeframe)
+        elif len(pieces) == 1:
+            return OHLCV(*pieces[0], timeframe=timeframe, copy=False)
+        return OHLCV(*(np.concatenate(c) for c in zip(*pieces)), timeframe=timeframe, copy=False)
+
+    def append(self, symbol, timeframe, candles):
+        """Append candles to series (creating it if needed).
+
+        Candles older than the last stored one are ignored and a candle with the same date as the last stored one
+        replaces it.
+
+        :param symbol: series symbol.
+        :type symbol: str or Symbol
+        :param str timeframe: series timeframe.
+        :param candles: candles to append as OHLCV instance or ccxt like rows.
+        :type candles: OHLCV or tp.Sequence[list]
+        :return int: number of written candles.
+        """
+        return self._write(symbol, timeframe, candles, self._append)
+
+    def prepend(self, symbol, timeframe, candles):
+        """Backfill series with candles older than the first stored one (newer ones are ignored).
+
+        Backfilled candles are written to new segment files, so stored ones are never moved or rewritten.
+
+        >>> import tempfile
+        >>> store = OHLCVStore(tempfile.mkdtemp(), segment_rows=2)
+        >>> store.append('BTC/USDT', '1m', [[120000, 2.0, 2.5, 1.5, 2.5, 30.0]])
+        1
+        >>> store.prepend('BTC/USDT', '1m', [[0, 1.0, 2.0, 0.5, 1.5, 10.0], [60000, 1.5, 3.0, 1.0, 2.0, 20.0],
+        ...                                  [120000, 9.0, 9.0, 9.0, 9.0, 9.0]])
+        2
+        >>> store.read('BTC/USDT', '1m').close.tolist()
+        [1.5, 2.0, 2.5]
+
+        :param symbol: series symbol.
+        :type symbol: str or Symbol
+        :param str timeframe: series timeframe.
+        :param candles: candles to prepend as OHLCV instance or ccxt like rows.
+        :type candles: OHLCV or tp.Sequence[list]
+        :return int: number of written candles.
+        """
+        return self._write(symbol, timeframe, candles, self._prepend)
+
+    def _write(self, symbol, timeframe, candles, writer):
+        """Run "writer" holding series write lock.
+
+        :return int: number of written candles.
+        """
+        candles = candles if isinstance(candles, OHLCV) else OHLCV.from_ccxt(candles)
+        if not len(candles):
+            return 0
+        directory = self._dir(symbol, timeframe)
+        directory.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(str(directory.joinpath('.lock')), 'wb') as lock_fp:
+            if fcntl is not None:
+                fcntl.flock(lock_fp, fcntl.LOCK_EX)
+            columns = [candles.column(c) for c in OHLCV.COLUMNS]
+            return writer(directory, self._index(symbol, timeframe), columns)
+
+    def _append(self, directory, index, columns):
+        """Append "columns" rows after series last candle."""
+        segment = self._segment(index[-1][1], writable=True) if index else None
+        offset, written = 0, 0
+        if segment is not None and segment.count:
+            count = segment.count
+            last = segment.columns[0][count - 1]
+            offset = int(np.searchsorted(columns[0], last, 'left'))
+            if offset < len(columns[0]) and columns[0][offset] == last:
+                for column, values in zip(segment.columns, columns):
+                    column[count - 1] = values[offset]
+                offset, written = offset + 1, 1
+        return written + self._fill(directory, segment, columns, offset, len(columns[0]))
+
+    def _prepend(self, directory, index, columns):
+        """Write "columns" rows older than series first candle into new segments."""
+        end = int(np.searchsorted(columns[0], index[0][0], 'left')) if index else len(columns[0])
+        return self._fill(directory, None, columns, 0, end)
+
+    def _fill(self, directory, segment, columns, offset, end):
+        """Write "columns" rows from "offset" to "end" into "segment" and new segments once it is full.
+
+        :return int: number of written rows.
+        """
+        written = 0
+        while offset < end:
+            if segment is None or segment.count == segment.capacity:
+                if segment is not None:
+                    segment.flush()
+                filename = directory.joinpath('{:016d}.seg'.format(int(columns[0][offset])))
+                _Segment.create(filename, self.segment_rows)
+                segment = self._segment(filename, writable=True)
+            count = segment.count
+            size = min(segment.capacity - count, end - offset)
+            for column, values in zip(segment.columns, columns):
+                column[count:count + size] = values[offset:offset + size]
+            segment.count = count + size
+            offset, written = offset + size, written + size
+        if segment is not None:
+            segment.flush()
+        return written
+
+    def close(self):
+        """Drop cached segments maps (already returned arrays keep their maps alive)."""
+        with self._lock:
+            self._segments.clear()
+
+
+OHLCV_STORE = OHLCVStore() if np is not None else None
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""CCTF
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - License:     UNLICENSE
+"""
+import collections as col
+import json
+import math
+import time
+
+from cctf.utils import _quote
+from cctf.valuation import PriceSnapshot
+
+__all__ = ['WalletEvent', 'WalletStream', 'read_events']
+
+# changed balances after which totals are recomputed from all values (incremental float updates drift)
+_REBASE_CHANGES = 1000
+
+WalletEvent = col.namedtuple('WalletEvent', ['changes', 'totals', 'timestamp'])
+WalletEvent.__doc__ = """Wallet update event: BalanceChange list, wallet totals after them and event timestamp."""
+
+
+class WalletStream:
+    """Incremental wallet valuation fed by streamed balance updates.
+
+    Each update is applied in place to the wallet ("Wallet.apply"), only changed balances are valued again and totals
+    are adjusted by their difference (and recomputed from all values every "rebase" changes, so float rounding errors
+    do not build up). Subscribers are called with a WalletEvent for every update changing something.
+
+    >>> from cctf.balance import Wallet
+    >>> snapshot = PriceSnapshot({'XRP': {'BTC': 0.0001}, 'ETH': {'BTC': 0.03}}, ['BTC'])
+    >>> stream = WalletStream(Wallet(BTC=0.5, XRP=1000.0), ['BTC'], snapshot)
+    >>> events = list()
+    >>> stream.subscribe(events.append)
+    >>> stream.totals
+    {'BTC': 0.6}
+    >>> stream.apply({'XRP': 2000.0, 'BTC': {'total': 0.5}})
+    WalletEvent(changes=[BalanceChange(currency='XRP', old=(0.0, 0.0, 1000.0), new=(0.0, 0.0, 2000.0))], \
+totals={'BTC': 0.7}, timestamp=None)
+    >>> stream.apply({'BTC': {'total': 0.5}}) is None, len(events)
+    (True, 1)
+
+    """
+
+    def __init__(self, wallet, quotes=None, snapshot=None, rebase=_REBASE_CHANGES):
+        """WalletStream constructor.
+
+        :param Wallet wallet: wallet to keep updated.
+        :param quotes: quote currencies (default BTC, USD and EUR).
+        :type quotes: tp.Iterable[str]
+        :param PriceSnapshot snapshot: prices to use (a new one is taken if None).
+        :param int rebase: changed balances between exact totals recomputations.
+        """
+        self.wallet = wallet
+        self.rebase = max(1, int(rebase))
+        self.quotes = [str(q).upper() for q in quotes or ('BTC', 'USD', 'EUR')]
+        self._subscribers = list()
+        self.reprice(snapshot)
+
+    @property
+    def totals(self):
+        """Wallet totals as {quote: total} dict."""
+        return {q: round(t, 8 if _quote(q) == 'BTC' else 5) for q, t in self._totals.items()}
+
+    @property
+    def values(self):
+        """Per currency values as {currency: {quote: value}} dict."""
+        return dict(self._values)
+
+    def subscribe(self, callback):
+        """Register a callable to be called with each WalletEvent.
+
+        :param callback: callable taking a WalletEvent as only argument.
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Remove a registered callable.
+
+        :param callback: registered callable.
+        """
+        self._subscribers.remove(callback)
+
+    def reprice(self, snapshot=None, max_age=None):
+        """Value whole wallet again with a new price snapshot.
+
+        :param PriceSnapshot snapshot: prices to use (a new one is taken if None).
+        :param float max_age: max cached prices age in secs when a new snapshot is taken.
+        """
+        self.snapshot = snapshot or PriceSnapshot.take(self.wallet.currencies, self.quotes, max_age=max_age)
+        # currencies already looked up in snapshot (a supplied snapshot is expected to cover the whole wallet)
+        self._priced = set(map(str, self.wallet))
+        self._values = {str(c): self._value(b) for c, b in self.wallet.items()}
+        self._rebase()
+
+    def _rebase(self):
+        """Recompute totals from all currencies values (exactly rounded sums)."""
+        self._totals = {q: math.fsum(v[q] or 0.0 for v in self._values.values()) for q in self.quotes}
+        self._changes = 0
+
+    def _value(self, balance):
+        """Return balance value in each quote currency."""
+        currency = str(balance.currency)
+        if currency not in self._priced:
+            # currencies added after snapshot was taken are priced on first use
+            self.snapshot.prices.update(PriceSnapshot.take([currency], self.quotes).prices)
+            self._priced.add(currency)
+        return {q: balance.value(q, self.snapshot.prices) for q in self.quotes}
+
+    def apply(self, update, timestamp=None):
+        """Apply a balances update and notify subscribers.
+
+        :param dict update: balances payload (see "Wallet.apply").
+        :param timestamp: update timestamp (default payload "timestamp" value if any).
+        :return WalletEvent: event or None if nothing changed.
+        """
+        changes = self.wallet.apply(update)
+        if not changes:
+            return None
+        for change in changes:
+            old = self._values.pop(change.currency, None) or dict()
+            new = dict()
+            if change.new is not None:
+                new = self._values[change.currency] = self._value(self.wallet[change.currency])
+            for q in self.quotes:
+                self._totals[q] += (new.get(q) or 0.0) - (old.get(q) or 0.0)
+        self._changes += len(changes)
+        if self._changes >= self.rebase:
+            self._rebase()
+        event = WalletEvent(changes, self.totals, update.get('timestamp') if timestamp is None else timestamp)
+        for callback in self._subscribers:
+            callback(event)
+        return event
+
+    def feed(self, updates):
+        """Apply many updates (e.g. from a websocket client or "read_events").
+
+        :param updates: balances payloads.
+        :type updates: tp.Iterable[dict]
+        :return int: number of updates changing the wallet.
+        """
+        return sum(self.apply(u) is not None for u in updates)
+
+
+def read_events(filename, speed=None):
+    """Read balance updates from a JSON lines file (one balances payload per line).
+
+    :param str filename: events file path.
+    :param float speed: if set, events are yielded at their "timestamp" (ms) pace multiplied by "speed".
+    :return: balances payloads generator.
+    """
+    previous = None
+    with open(str(filename), 'rt') as fp:
+        for line in fp:
+            line = line.strip()
+            if not line:
+                continue
+            event = json.loads(line)
+            timestamp = event.get('timestamp')
+            if speed and timestamp is not None:
+                if previous is not None and timestamp > previous:
+                    time.sleep((timestamp - previous) / 1000.0 / speed)
+                previous = timestamp
+            yield event
@@ -5,38 +5,145 @@
  - Created:     08-10-2018
  - License:     UNLICENSE
 """
+import collections as col
 import json
+import os
 import pathlib as path
+import threading
 import time
 from typing import Iterable as Iter, Mapping as Map, List, Text, Union as U
 
+from cctf import aio
 from cctf.base import Meta, BaseDict
+from cctf.metadata import MetadataIndex
+from cctf.ratelimit import LOW
 from cctf.utils import get_url, get_price
 
 _DEBUG = False
 _DATA_DIR = path.Path.home().joinpath('.local', 'cctf')
-_DATA_DIR.mkdir(exist_ok=True, parents=True)
 _CACHE_DIR = _DATA_DIR.joinpath('cache')
-_CACHE_DIR.mkdir(exist_ok=True, parents=True)
 _COIN_LIST_URL = 'https://min-api.cryptocompare.com/data/all/coinlist'
 
 __all__ = ['Symbol', 'Symbols', 'Currency', 'Currencies', 'CURRENCIES']
 
+# max number of interned Currency and Symbol instances (each)
+_INTERN_MAXSIZE = 4096
+
+
+class _InternCache:
+    """Thread-safe bounded registry of interned instances by normalized name (least recently used dropped first)."""
+
+    def __init__(self, maxsize=_INTERN_MAXSIZE):
+        """_InternCache constructor.
+
+        :param int maxsize: max number of instances.
+        """
+        self.maxsize = int(maxsize)
+        self._data = col.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        """Return interned instance for "name" (None if not interned).
+
+        Lookups take no lock: OrderedDict single operations are atomic, only insertions and evictions are serialized.
+        """
+        obj = self._data.get(name)
+        if obj is not None:
+            try:
+                self._data.move_to_end(name)
+            except KeyError:  # evicted by another thread meanwhile
+                pass
+        return obj
+
+    def add(self, name, obj):
+        """Intern "obj" as "name" (if another thread did it first, that instance is returned instead)."""
+        with self._lock:
+            obj = self._data.setdefault(name, obj)
+            self._data.move_to_end(name)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            return obj
+
+    def __len__(self):
+        return len(self._data)
+
+
+# interned Currency and Symbol instances by normalized (upper case) name
+_CURRENCY_CACHE = _InternCache()
+_SYMBOL_CACHE = _InternCache()
+
 
 class Currencies(BaseDict):
     """Currencies class model.
 
     Loads all currencies metadata (from cached file or from server).
 
+    If "lazy" is True, metadata is loaded on first access (or in a background thread by calling "load").
+
     >>> currencies = Currencies()
     >>> 'BTC' in currencies.names
     True
+    >>> Currencies(lazy=True).loaded
+    False
 
     """
 
-    def __init__(self):
-        d = self._load()
-        super(Currencies, self).__init__(**d)
+    def __init__(self, lazy=False):
+        """Currencies constructor.
+
+        :param bool lazy: if True, metadata will be loaded on first use instead of at construction time.
+        """
+        self._data = None
+        self._index = None
+        self._names = None
+        self._lock = threading.RLock()
+        if not lazy:
+            self.load()
+
+    @property
+    def data(self):
+        """Currencies metadata as dict or read-only MetadataIndex (loaded on first access)."""
+        if self._data is None:
+            self.load()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        names = sorted(set(list(value or []) + ['EUR', 'USD']))
+        self._data = value
+        self._names, self._index = tuple(names), frozenset(names)
+
+    @property
+    def loaded(self):
+        """True if currencies metadata is already loaded.
+
+        Importing cctf must not load currencies metadata (and must stay within a 1 sec budget):
+
+        >>> import subprocess, sys
+        >>> code = 'import time; t = time.time(); import cctf; print(time.time() - t < 1.0, cctf.CURRENCIES.loaded)'
+        >>> subprocess.check_output([sys.executable, '-c', code], universal_newlines=True).split()
+        ['True', 'False']
+
+        """
+        return self._data is not None
+
+    def load(self, force_reload=False, background=False):
+        """Load currencies metadata (nothing is done if already loaded and "force_reload" is False).
+
+        Any access to currencies data while a background load is running waits until it finishes.
+
+        :param bool force_reload: if True, cached data will be ignored and metadata will be downloaded again.
+        :param bool background: if True, metadata will be loaded in a background thread.
+        :return: self instance, or the loader thread if "background" is True.
+        """
+        if background:
+            thread = threading.Thread(target=self.load, args=(force_reload,), name='cctf-currencies', daemon=True)
+            thread.start()
+            return thread
+        with self._lock:
+            if self._data is None or force_reload:
+                self.data = self._load(force_reload)
+        return self
 
     def __get__(self, item):
         if item in self.data.keys():
@@ -46,11 +153,39 @@ class Currencies(BaseDict):
 
     @property
     def names(self):
-        """Currencies names as list.
+        """Currencies names (including EUR and USD) as sorted tuple.
+
+        Names are computed once each time metadata is (re)loaded.
+
+        :return tp.Tuple[tp.AnyStr]: currencies names as Tuple[AnyStr]
+        """
+        if self._names is None:
+            self.load()
+        return self._names
+
+    @property
+    def index(self):
+        """Currencies names (including EUR and USD) as frozenset.
+
+        :return tp.FrozenSet[tp.AnyStr]: currencies names as FrozenSet[AnyStr]
+        """
+        if self._index is None:
+            self.load()
+        return self._index
+
+    def has(self, name):
+        """O(1) currency name membership test.
+
+        >>> currencies = Currencies(lazy=True)
+        >>> currencies.data = {'BTC': {}, 'ETH': {}}
+        >>> currencies.has('btc'), currencies.has('EUR'), currencies.has('XRP')
+        (True, True, False)
 
-        :return tp.List[tp.AnyStr]: currencies names as List[AnyStr]
+        :param name: currency name.
+        :type name: str or Currency
+        :return bool: True if "name" is a known currency.
         """
-        return sorted(set(list(self.data) + ['EUR', 'USD']))
+        return str(name).upper() in self.index
 
     def _get_metadata(self):
         """Get currencies metadata from cryptocompare site.
@@ -65,64 +200,119 @@ class Currencies(BaseDict):
         """
         data = dict()
 
-        response = get_url(_COIN_LIST_URL)
+        response = get_url(_COIN_LIST_URL, priority=LOW)
 
         if isinstance(response or [], dict) and len(response):
             try:
                 if response['Response'] == 'Success':
                     data = response['Data']
-                    cache_file = _CACHE_DIR.joinpath('currencies.json')
-                    cache_file.touch(exist_ok=True)
-                    with open(str(cache_file), 'wt') as fp:
-                        json.dump(data, fp, indent=2)
+                    self._save(data)
             except ValueError as err:
                 if _DEBUG:
                     print(str(err))
         return data
 
+    @staticmethod
+    def _save(data):
+        """Write currencies metadata to both binary index and JSON (fallback) cache files.
+
+        :param dict data: currencies metadata.
+        """
+        _CACHE_DIR.mkdir(exist_ok=True, parents=True)
+        MetadataIndex.write(_CACHE_DIR.joinpath('currencies.idx'), data)
+        with open(str(_CACHE_DIR.joinpath('currencies.json')), 'wt') as fp:
+            json.dump(data, fp, separators=(',', ':'))
+
     def _load(self, force_reload=False):
         """Currencies data loader and cache data handler.
 
-        :return dict: currencies data as dict.
+        Cache files are used if not older than 24 hours, memory-mapped binary index first and JSON as fallback (in
+        which case binary index is rebuilt). Outdated cache files are still used if metadata download fails.
+
+        :return: currencies data as dict or MetadataIndex (read-only mapping).
+        :rtype: dict or MetadataIndex
+        """
+        if not force_reload:
+            data = self._read_cache(max_age=3600 * 24)
+            if len(data):
+                return data
+        # overwrite cache files with new content
+        if _DEBUG:
+            print(' - Updating cache file ...')
+        data = self._get_metadata()
+        # outdated cache files are better than nothing if metadata download fails
+        return data if len(data or []) else self._read_cache()
+
+    @staticmethod
+    def _read_cache(max_age=None):
+        """Read cache files (memory-mapped binary index first and JSON as fallback).
+
+        :param int max_age: max cache files age in secs (None means any age).
+        :return: currencies data as dict or MetadataIndex, empty dict if no valid cache file is found.
+        :rtype: dict or MetadataIndex
         """
-        # path to cache file
+        index_file = _CACHE_DIR.joinpath('currencies.idx')
         cache_file = _CACHE_DIR.joinpath('currencies.json')
-        cache_file.touch(exist_ok=True)
-
-        # check if cache file is older than 24 hours
-        ctime = cache_file.stat().st_ctime
-        if not force_reload and int(time.time()) - ctime < 3600 * 24:
-            # load from cache
+        if _is_fresh(index_file, max_age):
+            if _DEBUG:
+                print(' - Using cache file: {}'.format(str(index_file)))
+            try:
+                return MetadataIndex(index_file)
+            except (OSError, ValueError):
+                pass
+        if _is_fresh(cache_file, max_age):
             if _DEBUG:
                 print(' - Using cache file: {}'.format(str(cache_file)))
             try:
                 data = json.loads(cache_file.read_text())
-            except json.JSONDecodeError:
-                data = self._get_metadata() or dict()
-                if data is not None and len(data):
-                    with open(str(cache_file), 'wt') as fp:
-                        json.dump(data, fp, indent=2)
+            except (OSError, ValueError):
+                data = None
+            if len(data or []):
+                try:
+                    MetadataIndex.write(index_file, data)
+                    # rebuilt index keeps JSON file age, so its freshness is not reset
+                    stat = cache_file.stat()
+                    os.utime(str(index_file), (stat.st_atime, stat.st_mtime))
+                except OSError:
+                    pass
+                return data
+        return dict()
+
+
+def _is_fresh(filename, max_age=None):
+    """Check if "filename" exists, is not empty and is not older than "max_age" secs.
+
+    :param path.Path filename: file to check.
+    :param int max_age: max age in secs (None means any age).
+    :return bool: True if file is fresh.
+    """
+    try:
+        stat = filename.stat()
+    except OSError:
+        return False
+    return stat.st_size > 0 and (max_age is None or time.time() - stat.st_mtime < max_age)
 
-        else:
-            # overwrite cache file with new content
-            if _DEBUG:
-                print(' - Updating cache file ...')
-            data = self._get_metadata() or dict()
-            if data is not None and len(data):
-                with open(str(cache_file), 'wt') as fp:
-                    json.dump(data, fp, indent=2)
 
-        return data
+CURRENCIES = globals().get('CURRENCIES', Currencies(lazy=True))
 
 
-CURRENCIES = globals().get('CURRENCIES', Currencies())
+class Currency(metaclass=Meta):
+    """Currency class.
 
+    Instances are interned by upper case name, so there is only one Currency object for each currency name (the
+    registry is bounded, least recently used names are dropped first).
 
-class Currency(metaclass=Meta):
-    """Currency class."""
+    >>> Currency('btc') is Currency('BTC')
+    True
+
+    """
 
     def __new__(cls, s):
-        return str.__new__(cls, str(s).upper())
+        name = str(s).upper()
+        obj = _CURRENCY_CACHE.get(name)
+        if obj is None:
+            obj = _CURRENCY_CACHE.add(name, str.__new__(cls, name))
+        return obj
 
     def __add__(self, other):
         """Create a Symbol by combining the self currency as base and the other as quote.
@@ -135,7 +325,7 @@ class Currency(metaclass=Meta):
         :return Symbol: a Symbol instance formed from self and other currencies as quote and base respectively.
         """
         other = str(other).upper()
-        if other in CURRENCIES.names:
+        if CURRENCIES.has(other):
             symbol_str = '{}/{}'.format(self, other)
             return Symbol(symbol_str)
 
@@ -153,6 +343,14 @@ class Currency(metaclass=Meta):
         result = get_price(str(self), to_currency)
         return result
 
+    async def to_async(self, to_currency):
+        """Async "to" version (see "cctf.aio").
+
+        :param to_currency: currencies to convert to.
+        :return float: current price in "to_currency" currency.
+        """
+        return await aio.convert(self, to_currency)
+
     def __contains__(self, item):
         """This is an "in" operator behaviour implementation.
 
@@ -166,29 +364,61 @@ class Currency(metaclass=Meta):
         return str(item) == str(self)
 
 
+def _symbol_name(symbol=None, base=None, quote=None):
+    """Normalized symbol name from Symbol constructor args.
+
+    >>> _symbol_name('btc/usdt'), _symbol_name('BTC', 'USD')
+    ('BTC/USDT', 'USD/BTC')
+
+    :return str: upper case symbol name.
+    :raise ValueError: if no valid symbol can be built from args.
+    """
+    assert (symbol and '/' in symbol) or len(
+        [e for e in (symbol, base, quote)]) > 1, 'No symbol name or base currency was supplied.'
+    symbol = str(symbol or '')
+    if '/' in symbol:
+        symbol = symbol.upper()
+    elif symbol and base and quote is None:
+        symbol = f'{symbol}{quote}'
+    elif base and quote and symbol is None:
+        symbol = f'{base}{quote}'
+    else:
+        err_msg = f'- Symbol {symbol or "Empty"} is not valid (no "/" separator found (example: BTC/ETH).'
+        raise ValueError(err_msg)
+
+    if len(base or str()) and len(quote or str()):
+        symbol = f'{str(base).upper()}/{str(quote).upper()}'
+    elif len(base or str()):
+        symbol = f'{str(base).upper()}/BTC'
+    return symbol
+
+
 class Symbol(metaclass=Meta):
-    """Symbol class."""
+    """Symbol class.
 
-    def __new__(cls, symbol=None, base=None, quote=None):
-        assert (symbol and '/' in symbol) or len(
-            [e for e in (symbol, base, quote)]) > 1, 'No symbol name or base currency was supplied.'
-        symbol = str(symbol or '')
-        if '/' in symbol:
-            symbol = symbol.upper()
-        elif symbol and base and quote is None:
-            symbol = f'{symbol}{quote}'
-        elif base and quote and symbol is None:
-            symbol = f'{base}{quote}'
-        else:
-            err_msg = f'- Symbol {symbol or "Empty"} is not valid (no "/" separator found (example: BTC/ETH).'
-            raise ValueError(err_msg)
+    Instances are interned (only one Symbol object for each upper case symbol name, within a bounded registry) and
+    its "base" and "quote" currencies are parsed once at creation time and stored as instance attributes.
+
+    >>> btc_usd = Symbol('BTC/USD')
+    >>> btc_usd is Symbol('btc/usd')
+    True
+    >>> btc_usd.base, btc_usd.quote
+    ('BTC', 'USD')
 
-        if len(base or str()) and len(quote or str()):
-            symbol = f'{str(base).upper()}/{str(quote).upper()}'
-        elif len(base or str()):
-            symbol = f'{str(base).upper()}/BTC'
+    """
 
-        return str.__new__(cls, symbol)
+    def __new__(cls, symbol=None, base=None, quote=None):
+        if base is None and quote is None and isinstance(symbol, str) and '/' in symbol:
+            name = symbol.upper()
+        else:
+            name = _symbol_name(symbol, base, quote)
+        obj = _SYMBOL_CACHE.get(name)
+        if obj is None:
+            obj = str.__new__(cls, name)
+            raw = name.split('/')
+            obj.__dict__.update(base=Currency(raw[0]), quote=Currency(raw[1]) if len(raw) > 1 else None)
+            obj = _SYMBOL_CACHE.add(name, obj)
+        return obj
 
     @property
     def parts(self):
@@ -199,32 +429,8 @@ class Symbol(metaclass=Meta):
 
         :return tp.Tuple[Currency]: base, quote Currency instances as tuple.
         """
-        if '/' in super().__str__():
-            obj_str = super().__str__()
-            elements = map(Currency, obj_str.split('/'))
-            return list(elements)
-
-    @property
-    def base(self):
-        """Base currency as "Currency" instance.
-
-        >>> Symbol('BTC/USD').base
-        'BTC'
-
-        """
-        return Currency(str(self).split('/')[0])
-
-    @property
-    def quote(self):
-        """Quote currency as "Currency" instance.
-
-        >>> Symbol('BTC/USD').quote
-        'USD'
-
-        """
-        raw = str(self).split('/')
-        if len(raw) > 1:
-            return Currency(raw[1])
+        if self.quote is not None:
+            return [self.base, self.quote]
 
     @property
     def price(self):
@@ -259,8 +465,11 @@ class Symbol(metaclass=Meta):
         :return Currency:
         :raise: AttributeError
         """
-        if any(item == c for c in map(str, super().__str__().split('/'))):
-            return self.base if item == self.parts[0] else self.quote
+        base, quote = self.__dict__.get('base'), self.__dict__.get('quote')
+        if base is not None and item == base:
+            return base
+        elif quote is not None and item == quote:
+            return quote
         else:
             raise AttributeError('Invalid {} attribute.'.format(str(item)))
 
@@ -286,8 +495,10 @@ class Symbol(metaclass=Meta):
             else:
                 raise IndexError(
                     'Index should be: 0->BaseCurrency, 1->QuoteCurrency')
-        elif item in self:
-            return self.base if item == self.parts[0] else self.quote
+        elif item == self.base:
+            return self.base
+        elif item == self.quote:
+            return self.quote
         raise TypeError()
 
     def __contains__(self, item):
@@ -306,16 +517,10 @@ class Symbol(metaclass=Meta):
 
         :return str: True if item currency or symbol is contained / equal to Symbol
         """
-        if isinstance(item, Currency) or '/' not in str(item):
-            currencies = super().__str__().split('/')
-            return any(str(item) == c for c in map(str, currencies))
-        elif isinstance(item, Symbol) or '/' in str(item):
-            return str(item) == str(self)
-        elif str(item) == '/':
-            return True
-        else:
-            currencies = super().__str__().split('/')
-            return any(str(item) == c for c in map(str, currencies))
+        item = str(item)
+        if '/' not in item:
+            return item == self.base or item == self.quote
+        return str.__eq__(self, item)
 
     def __setattr__(self, key, value):
         if key in '_str' or hasattr(value or '', '__call__'):
@@ -324,14 +529,71 @@ class Symbol(metaclass=Meta):
             raise AttributeError(
                 'Only a callable type could be assigned to this class as attribute.')
 
-    def price2precision(self):
-        raise NotImplementedError()
+    def _market(self, market):
+        """Return market to use for this symbol precision handling.
+
+        :param market: Market instance or Markets instance this symbol market is looked up from.
+        :type market: Market or Markets
+        :return Market: market instance.
+        :raise ValueError: if no market is supplied.
+        :raise KeyError: if "market" is a Markets instance without this symbol.
+        """
+        if market is None:
+            raise ValueError(f'A Market (or Markets) instance is required for {self} precision handling.')
+        return market if hasattr(market, 'precision') else market[self]
+
+    def price2precision(self, price, market):
+        """Round "price" to market price precision.
+
+        >>> from cctf.market import Markets
+        >>> markets = Markets(**{'BTC/EUR': dict(base='BTC', quote='EUR', precision=dict(price=2, amount=4))})
+        >>> Symbol('BTC/EUR').price2precision(5432.1789, markets)
+        5432.18
+        >>> Symbol('BTC/EUR').price2precision(5432.1789, markets['BTC/EUR'])
+        5432.18
+
+        :param float price: price to round.
+        :param market: symbol Market or a Markets instance containing it.
+        :type market: Market or Markets
+        :return float: rounded price.
+        """
+        return self._market(market).price2precision(price)
 
-    def amount2precision(self):
-        raise NotImplementedError()
+    def amount2precision(self, amount, market):
+        """Truncate "amount" to market amount precision.
 
-    def cost2precision(self):
-        raise NotImplementedError()
+        >>> from cctf.market import Market
+        >>> market = Market(base='BTC', quote='EUR', precision=dict(price=2, amount=4))
+        >>> Symbol('BTC/EUR').amount2precision(0.123456, market)
+        0.1234
+
+        :param float amount: amount to truncate.
+        :param market: symbol Market or a Markets instance containing it.
+        :type market: Market or Markets
+        :return float: truncated amount.
+        """
+        return self._market(market).amount2precision(amount)
+
+    def cost2precision(self, cost, market):
+        """Round "cost" to market cost precision.
+
+        :param float cost: cost to round.
+        :param market: symbol Market or a Markets instance containing it.
+        :type market: Market or Markets
+        :return float: rounded cost.
+        """
+        return self._market(market).cost2precision(cost)
+
+    def orders2precision(self, orders, market):
+        """Bulk "price2precision" and "amount2precision" version for many orders of this symbol.
+
+        :param orders: orders (any item accessible type with "price" and "amount" keys).
+        :type orders: tp.Iterable[Order or dict]
+        :param market: symbol Market or a Markets instance containing it.
+        :type market: Market or Markets
+        :return tuple: (prices, amounts) lists, same order as "orders".
+        """
+        return self._market(market).orders2precision(orders)
 
     def __repr__(self):
         """Symbol representation as str.
@@ -412,8 +674,30 @@ class Symbols(List[U[Symbol, Text]]):
 #         return [Currency(c) for c in map(str, currencies) if len(c.strip())]
 
 
+def _benchmark(number=1000000):
+    """Symbol and Currency micro-benchmark (prints ns per operation).
+
+    :param int number: number of times each statement is executed.
+    """
+    import timeit
+
+    setup = 'from cctf.symbol import Symbol, Currency; s = Symbol("BTC/USDT")'
+    statements = [
+        ('Symbol("BTC/USDT")', 'Symbol creation'),
+        ('Currency("BTC")', 'Currency creation'),
+        ('s.base', 'Symbol.base'),
+        ('s.quote', 'Symbol.quote'),
+        ('s.parts', 'Symbol.parts'),
+        ('s[1]', 'Symbol.__getitem__'),
+        ('"USDT" in s', 'Symbol.__contains__'),
+    ]
+    for stmt, name in statements:
+        secs = timeit.timeit(stmt, setup, number=number)
+        print(f' - {name:<20} {secs / number * 1e9:>8.1f} ns')
+
+
 if __name__ == '__main__':
-    print(len(Currencies().names))
+    _benchmark()
     # symbol = 'MATIC/USDT'
     # symbols = Symbols(symbol, Symbol('LINK/USDT'))
     # symbols.extend(['BTT/USDT', 'CELR/USDT'])
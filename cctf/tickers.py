@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""CCTF
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - License:     UNLICENSE
+"""
+import typing as tp
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from cctf.market import Ticker, Tickers
+from cctf.symbol import Symbol
+
+__all__ = ['TickerTable']
+
+
+class TickerTable:
+    """Columnar tickers store (requires numpy).
+
+    Each ticker field is stored as a float64 column (missing values as 0.0, like "Ticker" does) and rows are indexed
+    by symbol, so filtering and sorting are vectorised numpy operations.
+
+    >>> table = TickerTable.from_dict({
+    ...     'BTC/USDT': {'symbol': 'BTC/USDT', 'last': 6000.0, 'quoteVolume': 1000000.0},
+    ...     'ETH/USDT': {'symbol': 'ETH/USDT', 'last': 200.0, 'quoteVolume': 3000000.0},
+    ...     'ETH/BTC': {'symbol': 'ETH/BTC', 'last': 0.033, 'quoteVolume': 150.0}})
+    >>> len(table), table['ETH/USDT']['last']
+    (3, 200.0)
+    >>> table.top(2).symbols
+    [(Symbol:ETH/USDT), (Symbol:BTC/USDT)]
+    >>> usdt = table.quote('USDT')
+    >>> usdt.filter(usdt['last'] > 1000).symbols
+    [(Symbol:BTC/USDT)]
+
+    """
+
+    FIELDS = ('last', 'bid', 'ask', 'high', 'low', 'baseVolume', 'quoteVolume', 'percentage')
+
+    def __init__(self, symbols, values):
+        """TickerTable constructor.
+
+        :param list symbols: symbols (one per row).
+        :param values: (len(FIELDS), len(symbols)) shaped float array, one row per field.
+        :type values: np.ndarray
+        """
+        if np is None:
+            raise ImportError('numpy is required by TickerTable.')
+        self._symbols = [Symbol(s) for s in symbols]
+        self._values = np.asarray(values, dtype=np.float64).reshape(len(self.FIELDS), len(self._symbols))
+        self._index = None
+
+    @classmethod
+    def from_dict(cls, tickers):
+        """Bulk construction from a ccxt "fetch_tickers" like dict (or a Tickers instance).
+
+        :param tickers: symbol as key and ticker dict as value.
+        :type tickers: tp.Mapping
+        :return TickerTable: new TickerTable instance.
+        """
+        if np is None:
+            raise ImportError('numpy is required by TickerTable.')
+        symbols = list(tickers)
+        rows = [[t.get(f) or 0.0 for f in cls.FIELDS] for t in tickers.values()]
+        values = np.array(rows, dtype=np.float64).reshape(len(symbols), len(cls.FIELDS))
+        return cls(symbols, np.ascontiguousarray(values.T))
+
+    @property
+    def symbols(self):
+        """Rows symbols as list."""
+        return list(self._symbols)
+
+    @property
+    def index(self):
+        """Symbol to row number dict."""
+        if self._index is None:
+            self._index = {s: i for i, s in enumerate(self._symbols)}
+        return self._index
+
+    def column(self, field):
+        """Return a read-only view of "field" column.
+
+        :param str field: one of FIELDS.
+        :return np.ndarray: "field" column view.
+        """
+        column = self._values[self.FIELDS.index(field)]
+        column.flags.writeable = False
+        return column
+
+    def row(self, symbol):
+        """Return "symbol" row as Ticker instance.
+
+        :param symbol: symbol to get.
+        :type symbol: str or Symbol
+        :return Ticker: "symbol" ticker.
+        """
+        i = self.index[Symbol(symbol)]
+        return Ticker(symbol=self._symbols[i], **dict(zip(self.FIELDS, self._values[:, i].tolist())))
+
+    def take(self, rows):
+        """Return a new table with selected rows (in supplied order).
+
+        :param rows: rows numbers as int array.
+        :type rows: np.ndarray or tp.Sequence[int]
+        :return TickerTable: new TickerTable instance.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        return type(self)([self._symbols[i] for i in rows.tolist()], self._values[:, rows])
+
+    def filter(self, mask):
+        """Return a new table with rows where "mask" is True.
+
+        :param mask: boolean array with one value per row.
+        :type mask: np.ndarray
+        :return TickerTable: new TickerTable instance.
+        """
+        return self.take(np.flatnonzero(mask))
+
+    def quote(self, *currencies):
+        """Return a new table with symbols quoted in any of supplied currencies.
+
+        :param currencies: quote currencies.
+        :return TickerTable: new TickerTable instance.
+        """
+        currencies = set(map(str.upper, map(str, currencies)))
+        return self.filter(np.fromiter((s.quote in currencies for s in self._symbols), bool, len(self)))
+
+    def sort(self, field='quoteVolume', reverse=True):
+        """Return a new table sorted by "field" (stable in both orders: ties keep their current relative order).
+
+        >>> table = TickerTable.from_dict({s: {'last': last} for s, last in [('A/BTC', 1.0), ('B/BTC', 2.0),
+        ...                                                                   ('C/BTC', 1.0), ('D/BTC', 2.0)]})
+        >>> table.sort('last').symbols
+        [(Symbol:B/BTC), (Symbol:D/BTC), (Symbol:A/BTC), (Symbol:C/BTC)]
+        >>> table.sort('last', reverse=False).symbols
+        [(Symbol:A/BTC), (Symbol:C/BTC), (Symbol:B/BTC), (Symbol:D/BTC)]
+
+        :param str field: one of FIELDS.
+        :param bool reverse: descending order if True.
+        :return TickerTable: new TickerTable instance.
+        """
+        column = self.column(field)
+        return self.take(np.argsort(-column if reverse else column, kind='stable'))
+
+    def top(self, n, field='quoteVolume'):
+        """Return a new table with "n" rows having the highest "field" values (sorted in descending order).
+
+        :param int n: number of rows.
+        :param str field: one of FIELDS.
+        :return TickerTable: new TickerTable instance.
+        """
+        column = self.column(field)
+        if n < len(self):
+            rows = np.argpartition(-column, n)[:n]
+            rows = rows[np.argsort(-column[rows], kind='stable')]
+        else:
+            rows = np.argsort(-column, kind='stable')
+        return self.take(rows)
+
+    def to_tickers(self):
+        """Convert table to Tickers (dict of Ticker) instance.
+
+        :return Tickers: tickers instance.
+        """
+        rows = zip(*self._values.tolist())
+        return Tickers(**{s: dict(zip(self.FIELDS, values), symbol=s) for s, values in zip(self._symbols, rows)})
+
+    def __getitem__(self, item):
+        """Return a column view if item is a field name, otherwise a Ticker (item is a symbol).
+
+        :param str item: field name or symbol.
+        :return: column as np.ndarray or row as Ticker.
+        """
+        return self.column(item) if item in self.FIELDS else self.row(item)
+
+    def __contains__(self, item):
+        return str(item).upper() in self.index
+
+    def __iter__(self) -> tp.Iterator[Symbol]:
+        return iter(self._symbols)
+
+    def __len__(self):
+        return len(self._symbols)
+
+    def __repr__(self):
+        return f'{type(self).__name__}(symbols: {len(self)})'
@@ -5,15 +5,25 @@
  - Created:     08-10-20018
  - License:     UNLICENSE
 """
-import collections as col
-import json
-import sys
 import time
 import typing as tp
 
 import requests
 
+from cctf.cache import PRICE_CACHE, STALE, MISS
+from cctf.ratelimit import RATE_LIMITER, NORMAL, RateLimitTimeout
+from cctf.retry import Attempts, Backoff, _DEADLINE
+from cctf.session import SESSIONS
+
 _PRICE_URL = 'https://min-api.cryptocompare.com/data/v2/histoday'
+_PRICE_MULTI_URL = 'https://min-api.cryptocompare.com/data/pricemulti'
+
+# historical prices granularity in secs ("histoday" endpoint)
+_BUCKET_SECS = 86400
+
+# CryptoCompare max length for "fsyms" and "tsyms" comma separated values
+_FSYMS_MAX_LEN = 300
+_TSYMS_MAX_LEN = 100
 
 # _PRICE_URL = 'https://min-api.cryptocompare.com/data/price?{}'
 
@@ -27,43 +37,77 @@ _HEADERS = {
 }
 
 
-def get_url(url, params=None, retries=1, wait_secs=15, verbose=True) -> tp.Union[dict, str]:
-    """Read URL content and return it as str type.
+def get_url(url, params=None, retries=3, wait_secs=None, verbose=True, timeout=None, priority=NORMAL,
+            deadline=_DEADLINE) -> tp.Optional[dict]:
+    """Read URL JSON content retrying failed attempts.
+
+    Failed attempts are retried with capped exponential backoff and jitter (honoring server "Retry-After" header)
+    until "retries" attempts are made or "deadline" secs have elapsed. Hosts failing repeatedly have their circuit
+    opened, so requests to them fail fast for a while (see "cctf.retry").
 
     >>> response = get_url(_PRICE_URL, params={'fsym': 'BTC', 'tsym': 'USD'})
     >>> isinstance(response, dict) and response['Data']['Data'][0]['close'] > 0.0
     True
 
     :param str url: URL to retrieve as str.
-    :param dict params: params used to build the GET request.L
-    :param int retries: max retries, if retries value is negative there is no attempts limit (default -1)
-    :param int wait_secs: sleep time in secs between retries.
+    :param dict params: params used to build the GET request.
+    :param int retries: max attempts, if retries value is negative there is no attempts limit (default 3).
+    :param float wait_secs: max sleep time in secs between attempts (backoff cap, default 15).
     :param bool verbose: if True all catches errors will be reported to stderr.
-    :return: raw url content as str type. In case of error, an empty string will be returned.
+    :param timeout: request timeout in secs as float or (connect, read) tuple (default is pool timeout).
+    :type timeout: float or tuple
+    :param int priority: rate limiter lane ("cctf.ratelimit" HIGH, NORMAL or LOW).
+    :param float deadline: max secs for all attempts including waits (None means no deadline).
+    :return: parsed JSON content or None on error (or if content is not JSON).
     """
-    while retries > 0:
-        try:
+    attempts = Attempts(url, retries, Backoff(cap=wait_secs) if wait_secs else None, deadline, timeout, verbose)
+    try:
+        while attempts.start():
             try:
-                result = requests.get(url, params=params, headers=_HEADERS)
-                if result.ok and 'json' in result.headers['Content-Type']:
-                    return result.json()
-                else:
-                    result.raise_for_status()
-            except (json.JSONDecodeError, ValueError) as err:
-                pass
-        except requests.RequestException as err:
-            if verbose:
-                print(str(err), file=sys.stderr)
-                print(' - Retrying', file=sys.stderr)
-            retries -= 1
-            time.sleep(wait_secs)
-        except KeyboardInterrupt:
-            return str()
+                result = _get_json(url, params=params, timeout=attempts.timeout, priority=priority,
+                                   wait=attempts.remaining)
+            except (requests.RequestException, ValueError, RateLimitTimeout) as err:
+                delay = attempts.failed(err)
+                if delay is not None:
+                    time.sleep(delay)
+            else:
+                attempts.succeeded()
+                return result
+    except KeyboardInterrupt:
+        return None
+    finally:
+        attempts.close()
+
+
+def _get_json(url, params=None, timeout=None, priority=NORMAL, wait=None):
+    """Single GET request attempt through the package wide session pool (waiting for its rate limiter turn).
+
+    :param str url: URL to retrieve as str.
+    :param dict params: params used to build the GET request.
+    :param timeout: request timeout in secs as float or (connect, read) tuple (default is pool timeout).
+    :type timeout: float or tuple
+    :param int priority: rate limiter lane ("cctf.ratelimit" HIGH, NORMAL or LOW).
+    :param float wait: max secs to wait for rate limiter turn (default no limit).
+    :return: parsed JSON content or None if response content is not JSON.
+    :raise requests.RequestException: on connection errors and HTTP error status codes.
+    :raise ValueError: if response content is not valid JSON.
+    :raise RateLimitTimeout: if rate limiter turn does not come in "wait" secs.
+    """
+    RATE_LIMITER.acquire(url, priority, timeout=wait)
+    result = SESSIONS.request('GET', url, params=params, headers=_HEADERS, timeout=timeout)
+    if result.ok and 'json' in result.headers.get('Content-Type', ''):
+        return result.json()
+    result.raise_for_status()
 
 
 def _params(params):
     """Params handler.
 
+    Multi value params ("fsyms" and "tsyms") are joined as upper case comma separated values.
+
+    >>> _params(dict(fsyms=['btc', 'eth'], tsyms='usd'))
+    {'fsyms': 'BTC,ETH', 'tsyms': 'USD'}
+
     :param params:
     :type params: dict
     :return:
@@ -73,16 +117,53 @@ def _params(params):
     for param in ['tsyms', 'fsyms']:
         if param in params:
             param_value = params.get(param)
-            if isinstance(param_value, str) and ',' not in param:
-                params[param] = [param_value]
-            if isinstance(param_value, col.Iterable):
-                params[param] = ','.join([str(s).upper() for s in param_value])
+            if isinstance(param_value, str):
+                param_value = param_value.split(',')
+            if isinstance(param_value, tp.Iterable):
+                params[param] = ','.join([str(s).strip().upper() for s in param_value])
     return params
 
 
+def _quote(quote):
+    """Normalize quote currency to one of the supported ones by price API (BTC, EUR or USD).
+
+    >>> _quote('USDT'), _quote('eur'), _quote('XRP'), _quote(None)
+    ('USD', 'EUR', 'BTC', 'BTC')
+
+    :param quote: quote currency.
+    :type quote: str or Currency
+    :return str: supported quote currency.
+    """
+    quote = str(quote or 'BTC').upper().strip(' T')
+    return quote if quote in ['BTC', 'EUR', 'USD'] else 'BTC'
+
+
+def _chunks(names, max_len):
+    """Split "names" in groups whose comma separated length is not greater than "max_len".
+
+    >>> list(_chunks(['BTC', 'ETH', 'XRP'], 8))
+    [['BTC', 'ETH'], ['XRP']]
+
+    :param list names: currencies names.
+    :param int max_len: max length for comma joined chunks.
+    :return: generator of currencies names lists.
+    """
+    chunk, size = list(), 0
+    for name in names:
+        if chunk and size + len(name) > max_len:
+            yield chunk
+            chunk, size = list(), 0
+        chunk.append(name)
+        size += len(name) + 1
+    if chunk:
+        yield chunk
+
+
 def get_price(base, quote=None, timestamp=None) -> float:
     """Get price for a symbol from CryptoCompare.com
 
+    Prices are cached in "PRICE_CACHE" by (base, quote, day bucket) key. Past days historical prices never expire.
+
     >>> price = get_price('TRX')
     >>> isinstance(price, float) and price > 0.0
     True
@@ -94,14 +175,56 @@ def get_price(base, quote=None, timestamp=None) -> float:
     :type quote: str or Currency
     :return: current price for supplied currency pair.
     """
-    quote = str(quote or 'BTC').strip(' T')
-    if quote not in ['BTC', 'EUR', 'USD']:
-        quote = 'BTC'
-    params = dict(fsym=base.upper(), tsym=quote.upper())
+    key, ttl, timestamp = _price_key(base, quote, timestamp)
+    return PRICE_CACHE.fetch(key, lambda: _fetch_price(*key[:2], timestamp), ttl)
+
+
+def _price_key(base, quote, timestamp=None):
+    """Build "get_price" cache key and ttl.
+
+    >>> _price_key('eth', 'USDT', 0)
+    (('ETH', 'USD', None), None, None)
+    >>> _price_key('eth', 'EUR', 1546300800)
+    (('ETH', 'EUR', 17897), inf, 1546300800)
+
+    :param base: base currency.
+    :type base: str or Currency
+    :param quote: quote currency.
+    :type quote: str or Currency
+    :param int timestamp: historical price timestamp.
+    :return tuple: (key, ttl, timestamp) tuple where timestamp is None for current prices.
+    """
+    key, ttl = (str(base).upper(), _quote(quote), None), None
     if timestamp and isinstance(timestamp, int) and timestamp > 0:
+        key = key[:2] + (timestamp // _BUCKET_SECS,)
+        if key[2] < int(time.time()) // _BUCKET_SECS:
+            ttl = float('inf')
+    else:
+        timestamp = None
+    return key, ttl, timestamp
+
+
+def _fetch_price(base, quote, timestamp=None):
+    """Uncached "get_price" implementation.
+
+    :param str base: base currency.
+    :param str quote: quote currency.
+    :param int timestamp: return historical price at supplied timestamp.
+    :return: price for supplied currency pair.
+    """
+    params = dict(fsym=base, tsym=quote)
+    if timestamp:
         params.update(toTs=timestamp)
-    # url = _PRICE_URL.format(params)
-    result = get_url(_PRICE_URL, params=params)
+    return _parse_price(get_url(_PRICE_URL, params=params), quote)
+
+
+def _parse_price(result, quote):
+    """Extract price from a "histoday" response.
+
+    :param dict result: "histoday" response.
+    :param str quote: quote currency.
+    :return: price for supplied currency pair.
+    """
     if isinstance(result, dict) and result.get('Response', '') == 'Success':
         result = result.get('Data', result).get('Data', result)
         return round(sum([result[1]['open'], result[1]['close']]) / 2, 8)
@@ -109,35 +232,165 @@ def get_price(base, quote=None, timestamp=None) -> float:
     return result.get(quote.upper()) if isinstance(result, dict) else result
 
 
-# def get_price(fsyms: tp.Union[tp.Sequence[tp.Text], tp.Text],
-#               tsyms: tp.Union[tp.Sequence[tp.Text], tp.Text]) -> tp.Dict:
-#     """ Price conversion (one to many) from "fsym" currency to "tsyms" currencies.
-#
-#     >>> data = get_price(fsyms='BTC', tsyms=['ETH', 'USD', 'EUR'])
-#     >>> isinstance(data, dict)
-#     True
-#     >>> all(isinstance(v, float) for v in data.values())
-#     True
-#     >>> data = get_price(['BTC', 'ETH', 'XRP', 'ADA'], ['USD', 'EUR'])
-#     >>> isinstance(data, dict)
-#     True
-#     >>> isinstance(data['total'], float)
-#     True
-#
-#     """
-#     if isinstance(fsyms, str):
-#         fsyms = [fsyms]
-#     if isinstance(tsyms, str):
-#         tsyms = [tsyms]
-#
-#     if len(fsyms) == 1 and len(tsyms) >= 1:
-#         fsym = str(fsyms[0])
-#         del fsyms
-#         return get_url(_PRICE_URL, locals())
-#     elif len(fsyms) > 1 and len(tsyms) >= 1:
-#         return get_url(_PRICE_MULTI_URL, locals())
-#     else:
-#         raise ValueError()
+def get_prices(bases, quotes=None) -> tp.Dict[str, tp.Dict[str, float]]:
+    """Get current prices for many base currencies in many quote currencies using as few requests as possible.
+
+    Prices already in "PRICE_CACHE" are not requested again.
+
+    >>> prices = get_prices(['BTC', 'ETH', 'XRP'], ['USD', 'EUR'])
+    >>> all(isinstance(prices[b][q], float) for b in ['BTC', 'ETH', 'XRP'] for q in ['USD', 'EUR'])
+    True
+
+    :param bases: base currencies.
+    :type bases: str or tp.Iterable
+    :param quotes: quote currencies (default BTC), unsupported ones are replaced as done by "get_price".
+    :type quotes: str or tp.Iterable
+    :return: price matrix as {base: {quote: price}} dict. Currencies without price are not included.
+    """
+    bases, quotes = _price_pairs(bases, quotes)
+    prices, stale, missing = _cached_prices(bases, quotes)
+    if stale:
+        PRICE_CACHE.revalidate(('prices', frozenset(stale)), lambda: _fetch_prices(*_unzip(stale)))
+    if missing:
+        _fetch_prices(*_unzip(missing), prices=prices)
+    return prices
+
+
+def _fetch_prices(bases, quotes, prices=None):
+    """Uncached "get_prices" implementation, fetched prices are stored in "PRICE_CACHE".
+
+    :param list bases: upper case base currencies.
+    :param list quotes: upper case and supported quote currencies.
+    :param dict prices: price matrix to be updated with fetched prices (a new one is created if None).
+    :return: price matrix as {base: {quote: price}} dict.
+    """
+    prices = dict() if prices is None else prices
+    for params in _price_params(bases, quotes):
+        _merge_prices(prices, _get_price_multi(params))
+    return prices
+
+
+def _get_price_multi(params):
+    """Single "pricemulti" request, concurrent identical requests share it (see "PriceCache.single_flight").
+
+    :param dict params: request params as built by "_price_params".
+    :return dict: "pricemulti" response.
+    """
+    key = ('pricemulti', params['fsyms'], params['tsyms'])
+    return PRICE_CACHE.single_flight(key, lambda: get_url(_PRICE_MULTI_URL, params=params))
+
+
+def _price_pairs(bases, quotes):
+    """Normalize "get_prices" bases and quotes args as sorted and unique upper case lists.
+
+    >>> _price_pairs('eth,btc', ['USDT', 'EUR'])
+    (['BTC', 'ETH'], ['EUR', 'USD'])
+
+    :param bases: base currencies.
+    :type bases: str or tp.Iterable
+    :param quotes: quote currencies (default BTC).
+    :type quotes: str or tp.Iterable
+    :return tuple: (bases, quotes) tuple.
+    """
+    bases = _params(dict(fsyms=bases or []))['fsyms'].split(',')
+    quotes = _params(dict(tsyms=quotes or 'BTC'))['tsyms'].split(',')
+    return sorted(set(b for b in bases if b)), sorted(set(map(_quote, quotes)))
+
+
+def _cached_prices(bases, quotes):
+    """Lookup in "PRICE_CACHE" all bases and quotes combinations.
+
+    :param list bases: upper case base currencies.
+    :param list quotes: upper case and supported quote currencies.
+    :return tuple: (prices, stale, missing) tuple where "stale" and "missing" are sets of (base, quote) pairs.
+    """
+    prices, stale, missing = dict(), set(), set()
+    for base in bases:
+        for quote in quotes:
+            price, status = PRICE_CACHE.get((base, quote, None))
+            if status != MISS:
+                prices.setdefault(base, dict())[quote] = price
+            if status == STALE:
+                stale.add((base, quote))
+            elif status == MISS:
+                missing.add((base, quote))
+    return prices, stale, missing
+
+
+def _unzip(pairs):
+    """Split (base, quote) pairs as sorted bases and quotes lists.
+
+    >>> _unzip({('ETH', 'USD'), ('BTC', 'USD')})
+    (['BTC', 'ETH'], ['USD'])
+
+    :param pairs: (base, quote) pairs.
+    :return tuple: (bases, quotes) tuple.
+    """
+    return sorted({b for b, _ in pairs}), sorted({q for _, q in pairs})
+
+
+def _price_params(bases, quotes):
+    """Build the fewest "pricemulti" requests params needed to fetch all bases and quotes combinations.
+
+    >>> _price_params(['BTC', 'ETH'], ['USD'])
+    [{'fsyms': 'BTC,ETH', 'tsyms': 'USD'}]
+
+    :param list bases: upper case base currencies.
+    :param list quotes: upper case and supported quote currencies.
+    :return list: requests params as list of dicts.
+    """
+    return [_params(dict(fsyms=fsyms, tsyms=tsyms))
+            for fsyms in _chunks(bases, _FSYMS_MAX_LEN)
+            for tsyms in _chunks(quotes, _TSYMS_MAX_LEN)]
+
+
+def _merge_prices(prices, result):
+    """Merge a "pricemulti" response into "prices" matrix and store its prices in "PRICE_CACHE".
+
+    >>> _merge_prices(dict(), {'BTC': {'USD': 6000}})
+    {'BTC': {'USD': 6000.0}}
+
+    :param dict prices: price matrix to be updated.
+    :param dict result: "pricemulti" response.
+    :return dict: updated price matrix.
+    """
+    if isinstance(result, dict) and result.get('Response') != 'Error':
+        for base, row in result.items():
+            if isinstance(row, dict):
+                row = {q: float(p) for q, p in row.items()}
+                prices.setdefault(base, dict()).update(row)
+                for quote, price in row.items():
+                    PRICE_CACHE.set((base, quote, None), price)
+    return prices
+
+
+# (precision, cutoff) pairs used by "auto_precision"
+_AUTO_PRECISION_CUTOFFS = tuple((e, 10000.0 / (10 ** e)) for e in range(8, 0, -1))
+# (cutoff, precision) pairs used by "infer_precision", precision for numbers over last cutoff is 0
+_INFER_PRECISION_CUTOFFS = ((0.000001, 10), (0.0001, 8), (0.01, 5), (1.0, 3), (100, 2), (1000, 1))
+
+
+def _numpy():
+    """Return numpy module or None if not installed (imported on demand to keep "import cctf" fast)."""
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    return numpy
+
+
+def _fmt(value, p):
+    """Format "value" with "p" decimals removing trailing zeros.
+
+    >>> _fmt(10.0, 2), _fmt(0.12345, 3), _fmt(0.0, 8)
+    ('10', '0.123', '0')
+
+    :param float value: value to format.
+    :param int p: number of decimals.
+    :return str: formatted value.
+    """
+    value = format(value, '.{:d}f'.format(p))
+    return value.rstrip('0').rstrip('.') if '.' in value else value
 
 
 def flt(value, p=None, as_str=False):
@@ -154,8 +407,7 @@ def flt(value, p=None, as_str=False):
     value_str = str(value or '0.0').strip()
 
     if '.' in value_str:
-        template = '{{:.{:d}f}}'.format(p or infer_precision(value))
-        value = template.format(float(value_str)).rstrip('.0')
+        value = _fmt(float(value_str), p or infer_precision(value))
         backup = str(value)
         try:
             value = value if as_str else float(value)
@@ -187,8 +439,7 @@ def auto_precision(num) -> float:
         return num
 
     if num is not None and isinstance(num, float):
-        for v in [(e, 10000.0 / (10 ** e)) for e in range(8, 0, -1)]:
-            precision, cutoff = v
+        for precision, cutoff in _AUTO_PRECISION_CUTOFFS:
             if num < cutoff:
                 return round(num, precision)
         else:
@@ -229,6 +480,11 @@ def num2str(n, precision=8):
     Accept any Iterable (dict, list, tuple, set, ...) or built-in data types int, float, str, ... and try to
     convert it a number data type (int, float)
 
+    Lists of decimal number strings are formatted in one "flt_array" call.
+
+    >>> num2str(['0.100000', '12.3456789123', 'abc'])
+    ['0.1', '12.34567891', 'abc']
+
     :param n:
     :type n: Number or tp.Iterable
     :param int precision:
@@ -241,15 +497,156 @@ def num2str(n, precision=8):
                 n = flt(n, precision, as_str=True)
             except ValueError:
                 n = backup
-        elif isinstance(n, str):
-            n = flt(n, precision, as_str=True)
         elif isinstance(n, tp.Dict):
-            n = {k: num2str(v, precision) if isinstance(v, col.Iterable) else v for k, v in dict(n).items()}
-        elif isinstance(n, col.Iterable):
-            n = [num2str(n, precision) if isinstance(n, col.Iterable) else n for n in list(n)]
+            n = {k: num2str(v, precision) if isinstance(v, tp.Iterable) else v for k, v in dict(n).items()}
+        elif isinstance(n, tp.Iterable):
+            n = list(n)
+            decimals = [i for i, v in enumerate(n) if isinstance(v, str) and '.' in v]
+            if len(decimals) > 1:
+                try:
+                    values = [float(n[i]) for i in decimals]
+                except ValueError:
+                    decimals = list()
+                else:
+                    for i, v in zip(decimals, flt_array(values, precision, as_str=True)):
+                        n[i] = v
+            decimals = set(decimals)
+            n = [v if i in decimals else num2str(v, precision) if isinstance(v, tp.Iterable) else v
+                 for i, v in enumerate(n)]
     return n
 
 
+def infer_precision_array(values):
+    """Vectorised "infer_precision" version.
+
+    >>> infer_precision_array([0.0000001, 0.5, 12.0, 5000.0]).tolist()
+    [10, 3, 2, 0]
+
+    :param values: numbers.
+    :type values: tp.Iterable[float] or np.ndarray
+    :return: precisions as int array (or list if numpy is not installed).
+    """
+    np = _numpy()
+    if np is None:
+        return [infer_precision(v) for v in values]
+    values = np.asarray(values, dtype=np.float64)
+    cutoffs, precisions = zip(*_INFER_PRECISION_CUTOFFS)
+    return np.asarray(precisions + (0,))[np.searchsorted(cutoffs, values, side='right')]
+
+
+def auto_precision_array(values):
+    """Vectorised "auto_precision" version (results are always floats).
+
+    >>> auto_precision_array([0.34388, 0.0001343, 12300]).tolist()
+    [0.3439, 0.0001343, 12300.0]
+
+    :param values: numbers.
+    :type values: tp.Iterable[float] or np.ndarray
+    :return: rounded numbers as float array (or list if numpy is not installed).
+    """
+    np = _numpy()
+    if np is None:
+        return [float(auto_precision(v)) for v in values]
+    values = np.asarray(values, dtype=np.float64)
+    precisions, cutoffs = zip(*_AUTO_PRECISION_CUTOFFS)
+    precisions = np.asarray(precisions + (0,))[np.searchsorted(cutoffs, values, side='right')]
+    return _round_array(values, precisions)
+
+
+def flt_array(values, p=None, as_str=False):
+    """Vectorised "flt" version for numbers, giving the same results as applying "flt" to each one.
+
+    Falls back to "flt" if numpy is not installed.
+
+    Like "flt", only values whose input str contains a "." are rounded. Non float inputs (ints and numeric str)
+    take a slower path doing that test on each input str. With "as_str" results match "flt" element by element,
+    otherwise they are returned as a float array (so ints returned by "flt" are given as equal floats).
+
+    >>> flt_array([0.123456, 10.0, 1234.5678]).tolist()
+    [0.123, 10.0, 1235.0]
+    >>> flt_array([0.123456, 10.0], p=2, as_str=True)
+    ['0.12', '10']
+    >>> values = [0.123456, 10, '1.0e-07', '25', 1e-07, 0, '-3.14159']
+    >>> flt_array([1e-07, 0.5], as_str=True) == [flt(v, as_str=True) for v in [1e-07, 0.5]]
+    True
+    >>> flt_array(values, as_str=True) == [flt(v, as_str=True) for v in values]
+    True
+    >>> flt_array(values).tolist() == [flt(v) for v in values]
+    True
+
+    :param values: numbers (or numeric str).
+    :type values: tp.Iterable[float or int or str] or np.ndarray
+    :param int p: precision (inferred for each value by "infer_precision" if None).
+    :param bool as_str: return a list of str instead of float array.
+    :return: rounded numbers as float array (list if numpy is not installed) or list of str.
+    """
+    np = _numpy()
+    if np is None:
+        return [flt(v, p, as_str) for v in values]
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind != 'f':
+            return _flt_mixed(values.tolist(), p, as_str)
+    else:
+        values = list(values)
+        if not all(isinstance(v, float) for v in values):
+            return _flt_mixed(values, p, as_str)
+    values = np.asarray(values, dtype=np.float64)
+    precisions = infer_precision_array(values) if not p else np.full(values.shape, int(p))
+    # "flt" only rounds numbers whose str() contains a "." (scientific notation ones without it, nan and inf
+    # are returned unchanged)
+    absolute = np.abs(values)
+    decimal = (values == 0) | ((absolute >= 0.0001) & (absolute < 1e16))
+    scientific = np.flatnonzero(~decimal)
+    decimal[scientific] = ['.' in str(v) for v in values[scientific].tolist()]
+    if as_str:
+        return [_fmt(v, d) if ok else v for v, d, ok in zip(values.tolist(), precisions.tolist(), decimal.tolist())]
+    return np.where(decimal, _round_array(values, precisions), values)
+
+
+def _flt_mixed(values, p=None, as_str=False):
+    """"flt_array" implementation for non float inputs, "." test is done on each input str (as "flt" does).
+
+    :param list values: numbers (or numeric str).
+    :param int p: precision (inferred for each value by "infer_precision" if None).
+    :param bool as_str: return a list of "flt" results instead of float array.
+    :return: rounded numbers as float array or "flt" results list.
+    """
+    np = _numpy()
+    texts = [str(v or '0.0').strip() for v in values]
+    decimal = ['.' in t for t in texts]
+    numbers = np.array([float(t) if ok else 0.0 for t, ok in zip(texts, decimal)], dtype=np.float64)
+    precisions = infer_precision_array(numbers) if not p else np.full(numbers.shape, int(p))
+    if as_str:
+        return [_fmt(n, d) if ok else flt(v, p, as_str)
+                for v, n, d, ok in zip(values, numbers.tolist(), precisions.tolist(), decimal)]
+    others = np.array([0.0 if ok else flt(v, p) for v, ok in zip(values, decimal)], dtype=np.float64)
+    return np.where(decimal, _round_array(numbers, precisions), others)
+
+
+def _round_array(values, precisions):
+    """Round each value to its own number of decimals with the same results as builtin "round".
+
+    Values whose scaled magnitude is too big for exact float math, or too close to a rounding tie, are rounded
+    one by one by builtin "round".
+
+    :param np.ndarray values: float array.
+    :param np.ndarray precisions: int array with same shape as "values".
+    :return np.ndarray: rounded values.
+    """
+    np = _numpy()
+    result = np.empty_like(values)
+    for precision in np.unique(precisions).tolist():
+        mask = precisions == precision
+        scaled = values[mask] * 10.0 ** precision
+        rounded = np.rint(scaled) / 10.0 ** precision
+        with np.errstate(invalid='ignore'):
+            unsafe = ~(np.abs(scaled) < 2.0 ** 50) | (np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) < 1e-6)
+        if unsafe.any():
+            rounded[unsafe] = [round(v, precision) for v in values[mask][unsafe].tolist()]
+        result[mask] = rounded
+    return result
+
+
 if __name__ == '__main__':
     _COIN_LIST_URL = 'https://min-api.cryptocompare.com/data/all/coinlist'
     resp = get_url(_COIN_LIST_URL)
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""CCTF
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - License:     UNLICENSE
+"""
+import collections as col
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from cctf.symbol import Symbol
+
+__all__ = ['OrderVerdict', 'validate_orders']
+
+_FIELDS = ('amount', 'price', 'cost')
+
+OrderVerdict = col.namedtuple('OrderVerdict', ['valid', 'errors', 'price', 'amount', 'cost'])
+OrderVerdict.__doc__ = """Order validation result (errors tuple and precision adjusted price, amount and cost)."""
+
+
+def _bounds(limit):
+    """Return (min, max) tuple from a {'min': ..., 'max': ...} limit where missing (None or 0 max) means unbounded.
+
+    >>> _bounds(dict(min=0.1, max=None)), _bounds(None)
+    ((0.1, inf), (-inf, inf))
+
+    :param dict limit: min and max limit dict.
+    :return tuple: (min, max) floats tuple.
+    """
+    limit = limit or dict()
+    lo, hi = limit.get('min'), limit.get('max')
+    return (-math.inf if lo is None else float(lo)), (math.inf if not hi else float(hi))
+
+
+def validate_orders(orders, markets, adjust=True):
+    """Check many orders against their markets amount, price and cost (price * amount) limits at once.
+
+    Market limits are gathered per order and all checks run as a single vectorised pass (numpy is used if installed).
+    Orders without price (market orders) skip price and cost checks, while orders without a valid amount are rejected.
+    Reported (and checked) cost is computed from adjusted price and amount and rounded to market cost precision.
+
+    >>> from cctf.market import Markets
+    >>> limits = dict(amount=dict(min=0.001, max=100.0), price=dict(min=0.01, max=None), cost=dict(min=10.0))
+    >>> markets = Markets(**{'BTC/USDT': dict(base='BTC', quote='USDT', limits=limits,
+    ...                                       precision=dict(price=2, amount=3))})
+    >>> verdicts = validate_orders([dict(symbol='BTC/USDT', price=6000.123, amount=0.0109),
+    ...                            dict(symbol='BTC/USDT', price=6000.0, amount=0.0001),
+    ...                            dict(symbol='XRP/BTC', price=0.0001, amount=100)], markets)
+    >>> verdicts[0]
+    OrderVerdict(valid=True, errors=(), price=6000.12, amount=0.01, cost=60.0012)
+    >>> verdicts[1].errors
+    ('amount < min', 'cost < min')
+    >>> verdicts[2].errors
+    ('unknown symbol',)
+    >>> validate_orders([dict(symbol='BTC/USDT', price=6000.0), dict(symbol='BTC/USDT', amount=float('nan'))],
+    ...                 markets)[1]
+    OrderVerdict(valid=False, errors=('invalid amount',), price=None, amount=None, cost=None)
+
+    :param orders: orders (any item accessible type with "symbol", "price" and "amount" keys).
+    :type orders: tp.Iterable[Order or dict]
+    :param Markets markets: markets orders belong to.
+    :param bool adjust: if True, prices and amounts are adjusted to market precision before being checked.
+    :return list: one OrderVerdict per order (same order as "orders").
+    """
+    orders = list(orders)
+    known = [Symbol(o['symbol']) in markets for o in orders]
+    prices = [_number(o.get('price')) for o in orders]
+    amounts = [_number(o.get('amount')) for o in orders]
+    if adjust:
+        rows = [i for i, k in enumerate(known) if k]
+        adjusted_prices, adjusted_amounts = markets.orders2precision([orders[i] for i in rows])
+        for i, price, amount in zip(rows, adjusted_prices, adjusted_amounts):
+            prices[i], amounts[i] = _number(price), _number(amount)
+    costs = list()
+    for o, k, price, amount in zip(orders, known, prices, amounts):
+        cost = None if price is None or amount is None else price * amount
+        if adjust and k and cost is not None:
+            cost = markets[Symbol(o['symbol'])].cost2precision(cost)
+        costs.append(cost)
+
+    # per order (min, max) limits as columns: amount min, amount max, price min, price max, cost min, cost max
+    unbounded = (-math.inf, math.inf) * len(_FIELDS)
+    limits = list()
+    for o, k in zip(orders, known):
+        market_limits = markets[Symbol(o['symbol'])].limits if k else None
+        limits.append(sum((_bounds(getattr(market_limits, f)) for f in _FIELDS), ()) if k else unbounded)
+
+    if np is None:
+        checks = _check(prices, amounts, costs, limits)
+    else:
+        checks = _check_array(prices, amounts, costs, limits)
+
+    verdicts = list()
+    for k, price, amount, cost, errors in zip(known, prices, amounts, costs, checks):
+        if not k:
+            errors = ('unknown symbol',)
+        elif amount is None:
+            errors = ('invalid amount',)
+        verdicts.append(OrderVerdict(not errors, tuple(errors), price, amount, cost))
+    return verdicts
+
+
+def _number(value):
+    """Return "value" as float (None if missing, NaN or not a number).
+
+    >>> _number('0.5'), _number(None), _number(float('nan')), _number('x')
+    (0.5, None, None, None)
+
+    :param value: value to convert.
+    :return float: converted value.
+    """
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(value) else value
+
+
+def _errors(amount_lo, amount_hi, price_lo, price_hi, cost_lo, cost_hi):
+    """Return error messages for each failed check flag (flags order matches "_FIELDS" min/max limits order)."""
+    flags = (amount_lo, amount_hi, price_lo, price_hi, cost_lo, cost_hi)
+    messages = [f'{f} {op}' for f in _FIELDS for op in ('< min', '> max')]
+    return [m for m, flag in zip(messages, flags) if flag]
+
+
+def _check(prices, amounts, costs, limits):
+    """Pure python limits checks.
+
+    :return list: errors list for each order.
+    """
+    result = list()
+    for price, amount, cost, (a_min, a_max, p_min, p_max, c_min, c_max) in zip(prices, amounts, costs, limits):
+        amount, price, cost = [math.nan if v is None else v for v in (amount, price, cost)]
+        result.append(_errors(amount < a_min, amount > a_max, price < p_min, price > p_max, cost < c_min, cost > c_max))
+    return result
+
+
+def _check_array(prices, amounts, costs, limits):
+    """Vectorised limits checks.
+
+    :return list: errors list for each order.
+    """
+    prices = np.array([math.nan if p is None else p for p in prices], dtype=np.float64)
+    amounts = np.array([math.nan if a is None else a for a in amounts], dtype=np.float64)
+    costs = np.array([math.nan if c is None else c for c in costs], dtype=np.float64)
+    limits = np.array(limits, dtype=np.float64).reshape(len(prices), 2 * len(_FIELDS)).T
+    values = (amounts, prices, costs)
+    flags = list()
+    for i, value in enumerate(values):
+        flags.extend([value < limits[2 * i], value > limits[2 * i + 1]])
+    flags = np.array(flags).T
+    failed = flags.any(axis=1)
+    return [_errors(*row) if bad else [] for row, bad in zip(flags.tolist(), failed.tolist())]
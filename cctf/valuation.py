@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""CCTF
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - License:     UNLICENSE
+"""
+import collections as col
+import concurrent.futures as cf
+import time
+
+from cctf import utils
+from cctf.cache import PRICE_CACHE
+
+__all__ = ['PriceSnapshot', 'Valuation', 'valuate']
+
+Valuation = col.namedtuple('Valuation', ['totals', 'breakdown', 'missing', 'snapshot'])
+Valuation.__doc__ = """Wallet valuation result.
+
+ - totals: {quote: total value} dict.
+ - breakdown: {currency: {quote: value}} dict (value is None if currency has no price).
+ - missing: {quote: currencies without price} dict (only quotes with missing prices are included).
+ - snapshot: PriceSnapshot used to compute values.
+"""
+
+
+def _at_par(currency, quote):
+    """Return True if "currency" is valued 1:1 in "quote" currency (same currency or USD stable coins in USD).
+
+    >>> _at_par('USDT', 'USD'), _at_par('BTC', 'BTC'), _at_par('USDT', 'EUR')
+    (True, True, False)
+
+    :param str currency: upper case currency.
+    :param str quote: upper case and supported quote currency.
+    :return bool: True if "currency" price in "quote" is 1.0.
+    """
+    return currency == quote or (quote == 'USD' and ('USD' in currency or currency == 'PAX'))
+
+
+class PriceSnapshot:
+    """Consistent price matrix for many currencies taken at once.
+
+    All prices are looked up together: cached ones are reused and the rest are requested with the fewest
+    "pricemulti" requests, sent in parallel if more than one is needed. "staleness" reports the age of the oldest
+    price in the snapshot.
+
+    >>> snapshot = PriceSnapshot({'XRP': {'BTC': 0.0001}}, ['BTC'], ages={('XRP', 'BTC'): 30.0})
+    >>> snapshot.price('XRP', 'BTC'), snapshot.price('XRP', 'EUR')
+    (0.0001, None)
+    >>> snapshot.staleness >= 30.0
+    True
+
+    """
+
+    def __init__(self, prices, quotes, ages=None):
+        """PriceSnapshot constructor.
+
+        :param dict prices: price matrix as {base: {quote: price}} dict.
+        :param list quotes: snapshot quote currencies.
+        :param dict ages: (base, quote) pairs prices age in secs when snapshot was taken (default all 0.0).
+        """
+        self.prices = prices
+        self.quotes = list(quotes)
+        self.ages = dict(ages or dict())
+        self.taken = time.time()
+        self._monotonic = time.monotonic()
+
+    @classmethod
+    def take(cls, currencies, quotes=None, max_age=None, workers=4):
+        """Take a price snapshot for all "currencies" in all "quotes".
+
+        :param currencies: base currencies.
+        :type currencies: tp.Iterable[str]
+        :param quotes: quote currencies (default BTC, USD and EUR).
+        :type quotes: tp.Iterable[str]
+        :param float max_age: cached prices older than "max_age" secs are requested again (default cache ttl rules).
+        :param int workers: max number of parallel requests.
+        :return PriceSnapshot: new snapshot.
+        """
+        bases, quotes = utils._price_pairs(list(map(str, currencies)), list(quotes or ('BTC', 'USD', 'EUR')))
+        prices, stale, missing = utils._cached_prices(bases, quotes)
+        ages = {(b, q): PRICE_CACHE.age((b, q, None)) for b in prices for q in prices[b]}
+        if max_age is not None:
+            missing |= {pair for pair, age in ages.items() if age is None or age > max_age}
+        stale -= missing
+        if stale:
+            # stale prices are used as is and refreshed in background, like "get_prices" does
+            pairs = frozenset(stale)
+            PRICE_CACHE.revalidate(('prices', pairs), lambda: utils._fetch_prices(*utils._unzip(pairs)))
+        if missing:
+            params = utils._price_params(*utils._unzip(missing))
+            with cf.ThreadPoolExecutor(max(1, min(workers, len(params))), thread_name_prefix='cctf-snapshot') as pool:
+                results = list(pool.map(utils._get_price_multi, params))
+            fetched = dict()
+            for result in results:
+                utils._merge_prices(fetched, result)
+            for base, row in fetched.items():
+                prices.setdefault(base, dict()).update(row)
+                ages.update(dict.fromkeys(((base, quote) for quote in row), 0.0))
+        # pairs without price (failed or unknown) are left out, so they do not hide snapshot staleness
+        return cls(prices, quotes, {pair: age for pair, age in ages.items() if age is not None})
+
+    @property
+    def age(self):
+        """Secs elapsed since snapshot was taken."""
+        return time.monotonic() - self._monotonic
+
+    @property
+    def staleness(self):
+        """Age in secs of the oldest snapshot price."""
+        return max(self.ages.values(), default=0.0) + self.age
+
+    def price(self, base, quote):
+        """Return "base" price in "quote" currency (None if not in snapshot).
+
+        :param str base: base currency.
+        :param str quote: quote currency.
+        :return float: price or None.
+        """
+        return self.prices.get(str(base).upper(), dict()).get(utils._quote(quote))
+
+    def __repr__(self):
+        return f'{type(self).__name__}(currencies: {len(self.prices)}, quotes: {self.quotes}, ' \
+               f'staleness: {self.staleness:.1f}s)'
+
+
+def valuate(wallet, quotes=None, snapshot=None, max_age=None):
+    """Value all wallet balances in all "quotes" from a single price snapshot.
+
+    >>> from cctf.balance import Wallet
+    >>> wallet = Wallet(BTC=0.5, XRP=1000.0, USDT=100.0)
+    >>> snapshot = PriceSnapshot({'XRP': {'BTC': 0.0001}, 'USDT': {'BTC': 0.0002}}, ['BTC'])
+    >>> valuation = valuate(wallet, ['BTC'], snapshot)
+    >>> valuation.totals, valuation.breakdown['XRP']
+    ({'BTC': 0.62}, {'BTC': 0.1})
+
+    :param Wallet wallet: wallet to value.
+    :param quotes: quote currencies (default BTC, USD and EUR).
+    :type quotes: tp.Iterable[str]
+    :param PriceSnapshot snapshot: prices to use (a new one is taken if None).
+    :param float max_age: max cached prices age in secs when a new snapshot is taken.
+    :return Valuation: totals, per currency breakdown, currencies without price and used snapshot.
+    """
+    quotes = [str(q).upper() for q in quotes or ('BTC', 'USD', 'EUR')]
+    quotes = sorted(set(quotes), key=quotes.index)
+    if snapshot is None:
+        snapshot = PriceSnapshot.take(wallet.currencies, quotes, max_age=max_age)
+    breakdown, missing = dict(), dict()
+    for currency, balance in wallet.items():
+        values = breakdown[str(currency)] = {q: balance.value(q, snapshot.prices) for q in quotes}
+        for q, v in values.items():
+            if v is None:
+                missing.setdefault(q, list()).append(str(currency))
+    totals = {q: round(sum(v[q] or 0.0 for v in breakdown.values()), 8 if utils._quote(q) == 'BTC' else 5)
+              for q in quotes}
+    return Valuation(totals, breakdown, missing, snapshot)
@@ -32,4 +32,6 @@ setup(
     keywords=keywords,
     classifiers=classifiers,
     install_requires=dependencies,
+    extras_require={'numpy': ['numpy'], 'scanner': ['numpy', 'ccxt']},
+    entry_points={'console_scripts': ['cctf-scanner = cctf.scanner:main']},
 )